@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+JSON API server for University Management System
+
+Serves a single in-memory University over HTTP/1.1 using only asyncio.
+Connections are kept alive and pipelined requests are answered in order.
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from university import University
+from student import Student
+from faculty import Faculty
+from course import Course
+from department import Department
+from fulltext import result_record
+
+class APIError(Exception):
+    """Error returned to the client as a JSON error response."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class UniversityAPI:
+    """Maps JSON API requests onto University operations."""
+    
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 1000
+    
+    def __init__(self, university: University):
+        """
+        Initialize the API.
+        
+        Args:
+            university: University object served by the API
+        """
+        self.university = university
+        self.routes: List[Tuple[str, List[str], Callable]] = []
+        self._register_routes()
+    
+    def _register_routes(self) -> None:
+        """Register the route table (method, path segments, handler)."""
+        add = self._add_route
+        add('GET', '/stats', self.get_stats)
+        add('GET', '/search', self.search)
+        add('POST', '/enrollments', self.enroll)
+        add('DELETE', '/enrollments', self.drop)
+        add('POST', '/grades', self.assign_grade)
+        add('POST', '/assignments', self.assign_faculty)
+        
+        collections = {
+            'students': (lambda: self.university.students, self.university.find_student,
+                         self._create_student, self.university.remove_student,
+                         self.university.update_student),
+            'faculty': (lambda: self.university.faculty, self.university.find_faculty,
+                        self._create_faculty, self.university.remove_faculty,
+                        self.university.update_faculty),
+            'courses': (lambda: self.university.courses, self.university.find_course,
+                        self._create_course, self.university.remove_course,
+                        self.university.update_course),
+            'departments': (lambda: self.university.departments, self.university.find_department,
+                            self._create_department, self.university.remove_department,
+                            self.university.update_department)
+        }
+        
+        for name, (items, find, create, remove, update) in collections.items():
+            add('GET', f'/{name}', self._list_handler(items))
+            add('POST', f'/{name}', create)
+            add('GET', f'/{name}/{{id}}', self._get_handler(find))
+            add('PUT', f'/{name}/{{id}}', self._update_handler(find, update))
+            add('DELETE', f'/{name}/{{id}}', self._delete_handler(remove))
+    
+    def _add_route(self, method: str, pattern: str, handler: Callable) -> None:
+        self.routes.append((method, pattern.strip('/').split('/'), handler))
+    
+    def handle(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        """
+        Handle one request.
+        
+        Args:
+            method: HTTP method
+            target: Request target (path and query string)
+            body: Raw request body
+            
+        Returns:
+            Tuple of (HTTP status, JSON-serializable payload)
+        """
+        url = urlsplit(target)
+        segments = [unquote(s) for s in url.path.strip('/').split('/')]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        
+        path_matched = False
+        for route_method, pattern, handler in self.routes:
+            params = self._match(pattern, segments)
+            if params is None:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            
+            try:
+                payload = json.loads(body) if body else {}
+            except (ValueError, UnicodeDecodeError):
+                return 400, {'error': 'Request body is not valid JSON'}
+            if not isinstance(payload, dict):
+                return 400, {'error': 'Request body must be a JSON object'}
+            
+            try:
+                return handler(params=params, query=query, body=payload)
+            except APIError as e:
+                return e.status, {'error': e.message}
+            except (ValueError, TypeError, KeyError) as e:
+                return 400, {'error': str(e)}
+            except Exception as e:
+                return 500, {'error': f'Internal error: {e}'}
+        
+        if path_matched:
+            return 405, {'error': f'Method {method} not allowed'}
+        return 404, {'error': f'No route for {url.path}'}
+    
+    @staticmethod
+    def _match(pattern: List[str], segments: List[str]) -> Optional[Dict[str, str]]:
+        """Match path segments against a route pattern."""
+        if len(pattern) != len(segments):
+            return None
+        params = {}
+        for expected, actual in zip(pattern, segments):
+            if expected.startswith('{'):
+                params[expected[1:-1]] = actual
+            elif expected != actual:
+                return None
+        return params
+    
+    @staticmethod
+    def _require(body: Dict, *fields: str) -> None:
+        missing = [f for f in fields if f not in body]
+        if missing:
+            raise APIError(400, f"Missing field(s): {', '.join(missing)}")
+    
+    def _page(self, query: Dict) -> Tuple[int, int]:
+        """Parse offset/limit query parameters."""
+        try:
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', self.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise APIError(400, 'offset and limit must be integers')
+        if offset < 0 or limit <= 0:
+            raise APIError(400, 'offset must be >= 0 and limit > 0')
+        return offset, min(limit, self.MAX_PAGE_SIZE)
+    
+    def _list_handler(self, items: Callable) -> Callable:
+        def handler(params, query, body):
+            collection = items()
+            offset, limit = self._page(query)
+            page = collection[offset:offset + limit]
+            return 200, {
+                'items': [entity.to_dict() for entity in page],
+                'total': len(collection),
+                'offset': offset,
+                'limit': limit
+            }
+        return handler
+    
+    def _get_handler(self, find: Callable) -> Callable:
+        def handler(params, query, body):
+            entity = find(params['id'])
+            if entity is None:
+                raise APIError(404, f"{params['id']} not found")
+            return 200, entity.to_dict()
+        return handler
+    
+    def _update_handler(self, find: Callable, update: Callable) -> Callable:
+        def handler(params, query, body):
+            entity = find(params['id'])
+            if entity is None:
+                raise APIError(404, f"{params['id']} not found")
+            # Numbers may be sent as strings; University.update_* validates the rest
+            changes = {field: int(value) if field in University.INTEGER_FIELDS and isinstance(value, str)
+                       else value for field, value in body.items()}
+            update(params['id'], **changes)
+            return 200, entity.to_dict()
+        return handler
+    
+    def _delete_handler(self, remove: Callable) -> Callable:
+        def handler(params, query, body):
+            if not remove(params['id']):
+                raise APIError(404, f"{params['id']} not found")
+            return 200, {'deleted': params['id']}
+        return handler
+    
+    @staticmethod
+    def _created(added: bool, entity) -> Tuple[int, Dict]:
+        if not added:
+            raise APIError(409, 'ID already exists')
+        return 201, entity.to_dict()
+    
+    def _create_student(self, params, query, body):
+        self._require(body, 'student_id', 'name', 'age', 'gender', 'department')
+        student = Student(body['student_id'], body['name'], int(body['age']),
+                          body['gender'], body['department'])
+        return self._created(self.university.add_student(student), student)
+    
+    def _create_faculty(self, params, query, body):
+        self._require(body, 'faculty_id', 'name', 'department')
+        faculty_member = Faculty(body['faculty_id'], body['name'], body['department'])
+        return self._created(self.university.add_faculty(faculty_member), faculty_member)
+    
+    def _create_course(self, params, query, body):
+        self._require(body, 'course_id', 'name', 'credit_hours')
+        course = Course(body['course_id'], body['name'], int(body['credit_hours']),
+                        int(body.get('max_capacity', 0)))
+        created = self._created(self.university.add_course(course), course)
+        self.university.add_course_to_department(body.get('department', ''), course.course_id)
+        return created
+    
+    def _create_department(self, params, query, body):
+        self._require(body, 'department_id', 'name')
+        department = Department(body['department_id'], body['name'])
+        return self._created(self.university.add_department(department), department)
+    
+    def get_stats(self, params, query, body):
+        return 200, self.university.get_university_stats()
+    
+    def search(self, params, query, body):
+        text = query.get('q', '')
+        if not text.strip():
+            raise APIError(400, 'q is required')
+        types = query.get('type')
+        offset, limit = self._page(query)
+        try:
+            results = self.university.search_all(text, types.split(',') if types else None,
+                                                 offset + limit)
+        except ValueError as e:
+            raise APIError(400, str(e))
+        return 200, {'items': [result_record(result) for result in results[offset:]],
+                     'offset': offset, 'limit': limit}
+    
+    def enroll(self, params, query, body):
+        self._require(body, 'student_id', 'course_id')
+        student_id, course_id = body['student_id'], body['course_id']
+        if self.university.enroll_student_in_course(student_id, course_id):
+            return 200, {'enrolled': True, 'waitlisted': False}
+        if body.get('waitlist') and self.university.join_waitlist(student_id, course_id):
+            return 202, {'enrolled': False, 'waitlisted': True}
+        raise APIError(409, 'Enrollment failed')
+    
+    def drop(self, params, query, body):
+        self._require(body, 'student_id', 'course_id')
+        if not self.university.drop_student_from_course(body['student_id'], body['course_id']):
+            raise APIError(404, 'Enrollment not found')
+        return 200, {'dropped': True}
+    
+    def assign_grade(self, params, query, body):
+        self._require(body, 'student_id', 'course_id', 'grade')
+        if not self.university.assign_grade(body['student_id'], body['course_id'],
+                                            float(body['grade'])):
+            raise APIError(409, 'Grade not assigned; check enrollment and grade range')
+        return 200, {'graded': True}
+    
+    def assign_faculty(self, params, query, body):
+        self._require(body, 'faculty_id', 'course_id')
+        if not self.university.assign_faculty_to_course(body['faculty_id'], body['course_id']):
+            raise APIError(404, 'Faculty or course not found')
+        return 200, {'assigned': True}
+
+class APIServer:
+    """Asyncio HTTP/1.1 server with keep-alive and request pipelining."""
+    
+    MAX_HEADER_LINES = 100
+    MAX_BODY_SIZE = 1024 * 1024
+    KEEP_ALIVE_TIMEOUT = 15.0
+    
+    REASONS = {200: 'OK', 201: 'Created', 202: 'Accepted', 400: 'Bad Request',
+               404: 'Not Found', 405: 'Method Not Allowed', 409: 'Conflict',
+               413: 'Payload Too Large', 500: 'Internal Server Error', 501: 'Not Implemented'}
+    
+    def __init__(self, api: UniversityAPI, host: str = '127.0.0.1', port: int = 8000,
+                 before_request: Optional[Callable[[], None]] = None):
+        """
+        Initialize the server.
+        
+        Args:
+            api: UniversityAPI handling requests
+            host: Interface to bind
+            port: TCP port to bind
+            before_request: Called before each request is handled
+        """
+        self.api = api
+        self.host = host
+        self.port = port
+        self.before_request = before_request
+    
+    async def serve_forever(self) -> None:
+        """Start listening and serve until cancelled."""
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        print(f"✓ Serving University API on http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it is closed."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader),
+                                                     self.KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    break
+                
+                method, target, version, headers, body = request
+                if self.before_request is not None:
+                    self.before_request()
+                status, payload = self.api.handle(method, target, body)
+                
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' and
+                              (version == 'HTTP/1.1' or connection == 'keep-alive'))
+                writer.write(self._build_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except APIError as e:
+            writer.write(self._build_response(e.status, {'error': e.message}, False))
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Read one request, or return None at end of stream."""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise APIError(400, 'Malformed request line')
+        
+        headers = {}
+        for _ in range(self.MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise APIError(400, 'Too many headers')
+        
+        # Only bodies with a Content-Length are supported
+        if headers.get('transfer-encoding', 'identity').lower() != 'identity':
+            raise APIError(501, 'Transfer-Encoding is not supported; send a Content-Length')
+        length = headers.get('content-length', '') or '0'
+        if not (length.isascii() and length.isdigit()):
+            raise APIError(400, 'Content-Length must be a non-negative integer')
+        length = int(length)
+        if length > self.MAX_BODY_SIZE:
+            raise APIError(413, 'Request body too large')
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, version.upper(), headers, body
+    
+    def _build_response(self, status: int, payload: Dict, keep_alive: bool) -> bytes:
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {self.REASONS.get(status, 'Unknown')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return head.encode('latin-1') + body
+
+def main():
+    """Load data, serve the API and save on shutdown."""
+    from file_handler import FileHandler
+    
+    parser = argparse.ArgumentParser(description="University Management System JSON API")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind")
+    parser.add_argument('--port', type=int, default=8000, help="TCP port to bind")
+    parser.add_argument('--no-save', action='store_true', help="Do not save data on shutdown")
+    args = parser.parse_args()
+    
+    university = University("Tech University", "123 College Ave, Tech City")
+    FileHandler.load_all_data(university)
+    
+    # Data saved by other processes is picked up while we have no unsaved changes
+    server = APIServer(UniversityAPI(university), args.host, args.port,
+                       lambda: FileHandler.reload_if_changed(university))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    
+    if not args.no_save:
+        FileHandler.save_all_data(university)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Autosave module for University Management System
+
+Saves a University on a background thread once its changes settle. Every
+change event restarts a quiet period and the save happens when it ends,
+so a burst of changes becomes a single write; a maximum delay bounds how
+long a steady stream of changes can postpone it. A save whose content is
+unchanged since the last save writes nothing (see FileHandler.save_snapshot).
+"""
+
+import threading
+import time
+from typing import Optional
+from university import University
+from file_handler import FileHandler, SaveConflictError
+
+class Autosaver:
+    """Debounced background saves of a University."""
+    
+    DEFAULT_QUIET_PERIOD = 5.0  # Seconds without changes before saving
+    DEFAULT_MAX_DELAY = 60.0    # Seconds a change may wait during continuous changes
+    
+    def __init__(self, university: University, quiet_period: float = DEFAULT_QUIET_PERIOD,
+                 max_delay: float = DEFAULT_MAX_DELAY):
+        """
+        Initialize the autosaver.
+        
+        Args:
+            university: University object to save; may be a DeferredUniversity,
+                        which is only resolved on the autosave thread
+            quiet_period: Seconds without changes before saving
+            max_delay: Longest time in seconds between the first unsaved
+                       change and its save
+        """
+        self.university = university
+        self.quiet_period = quiet_period
+        self.max_delay = max(max_delay, quiet_period)
+        self.saves = 0      # Saves that wrote the file
+        self.skipped = 0    # Saves that found the content unchanged
+        self.changes = 0    # Change events seen
+        self.last_error: Optional[str] = None
+        self._first_change: Optional[float] = None  # Monotonic time of the oldest unsaved change
+        self._last_change: Optional[float] = None
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._token: Optional[int] = None
+    
+    def start(self) -> None:
+        """Start the autosave thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="university-autosave", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the autosave thread without saving pending changes.
+        
+        A save in progress is finished first.
+        
+        Args:
+            timeout: Seconds to wait for the thread (forever if None)
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._token is not None:
+            self.university.events.unsubscribe(self._token)
+            self._token = None
+    
+    def _on_change(self, event) -> None:
+        """Event subscriber: (re)start the quiet period."""
+        now = time.monotonic()
+        with self._condition:
+            self.changes += 1
+            if self._first_change is None:
+                self._first_change = now
+            self._last_change = now
+            self._condition.notify_all()
+    
+    def _run(self) -> None:
+        # Subscribing resolves a DeferredUniversity, so it happens here and
+        # not on the thread that started the autosaver
+        self._token = self.university.events.subscribe(self._on_change)
+        while True:
+            with self._condition:
+                while self._last_change is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                due = min(self._last_change + self.quiet_period,
+                          self._first_change + self.max_delay)
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._first_change = self._last_change = None
+            self._save()
+    
+    def _save(self) -> None:
+        """Save a snapshot; changes made meanwhile are saved by the next run."""
+        try:
+            # The snapshot waits for a mutation in progress on the menu thread;
+            # records built here are not cached, as that thread owns them
+            snapshot = self.university.snapshot(store=False)
+            # Changes saved by another process are merged by the next
+            # foreground save, which also reloads the merged data
+            FileHandler.save_snapshot(snapshot, verbose=False, merge=False)
+        except SaveConflictError as e:
+            self._report(f"⚠ Autosave paused, the data file was changed by another process ({e}); "
+                         f"your changes will be merged when you exit")
+            return
+        except Exception as e:
+            self._report(f"⚠ Autosave failed: {e}")
+            return
+        
+        if FileHandler.last_save_skipped:
+            self.skipped += 1
+        else:
+            self.saves += 1
+        self.last_error = None
+    
+    def _report(self, message: str) -> None:
+        """Print an error once until a save succeeds again."""
+        if message != self.last_error:
+            print(f"\n{message}")
+        self.last_error = message
\ No newline at end of file
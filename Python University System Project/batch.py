@@ -0,0 +1,385 @@
+"""
+Batch module for University Management System
+
+Runs operations non-interactively, either as a single command-line
+subcommand or as a command file with one command per line. Data is loaded
+once, every command runs directly against the University, data is saved
+once at the end, and each command produces one JSON line on stdout.
+
+Example command file:
+    # comments and blank lines are ignored
+    add-student S0100 "Ada Lovelace" 20 F CSE
+    enroll S0100 CSE101
+    grade S0100 CSE101 3.9
+    report stats
+"""
+
+import argparse
+import json
+import shlex
+import sys
+from contextlib import redirect_stdout
+from typing import Callable, Dict, IO, Iterable, List, Optional, Tuple
+from university import University
+from student import Student
+from faculty import Faculty
+from course import Course
+from department import Department
+
+class BatchError(Exception):
+    """Error reported for a single batch command."""
+
+class BatchRunner:
+    """Executes batch commands against a University."""
+    
+    def __init__(self, university: University):
+        """
+        Initialize the runner.
+        
+        Args:
+            university: University object the commands operate on
+        """
+        self.university = university
+        self.commands: Dict[str, Tuple[Callable, str]] = {}
+        self._register_commands()
+    
+    def _register_commands(self) -> None:
+        """Register the command table (name -> handler, usage)."""
+        add = self._add_command
+        add('add-student', self.add_student, "ID NAME AGE GENDER DEPARTMENT")
+        add('add-faculty', self.add_faculty, "ID NAME DEPARTMENT")
+        add('add-course', self.add_course, "ID NAME CREDITS [CAPACITY] [DEPARTMENT]")
+        add('add-department', self.add_department, "ID NAME")
+        add('update-student', self._update(self.university.update_student, 'student_id'),
+            "ID FIELD=VALUE...")
+        add('update-faculty', self._update(self.university.update_faculty, 'faculty_id'),
+            "ID FIELD=VALUE...")
+        add('update-course', self._update(self.university.update_course, 'course_id'),
+            "ID FIELD=VALUE...")
+        add('update-department', self._update(self.university.update_department, 'department_id'),
+            "ID FIELD=VALUE...")
+        add('remove-student', self._remove(self.university.remove_student), "ID")
+        add('remove-faculty', self._remove(self.university.remove_faculty), "ID")
+        add('remove-course', self._remove(self.university.remove_course), "ID")
+        add('remove-department', self._remove(self.university.remove_department), "ID")
+        add('enroll', self.enroll, "STUDENT_ID COURSE_ID")
+        add('waitlist', self.waitlist, "STUDENT_ID COURSE_ID")
+        add('drop', self.drop, "STUDENT_ID COURSE_ID")
+        add('grade', self.grade, "STUDENT_ID COURSE_ID GRADE")
+        add('assign', self.assign, "FACULTY_ID COURSE_ID")
+        add('set-capacity', self.set_capacity, "COURSE_ID CAPACITY")
+        add('show', self.show, "students|faculty|courses|departments ID")
+        add('search', self.search, "QUERY [students|faculty|courses|departments[,...]]")
+        add('report', self.report, "stats|gpa|departments|memory")
+        add('check', self.check, "[repair]")
+        add('export', self.export, "full|delta DIRECTORY")
+    
+    def _add_command(self, name: str, handler: Callable, usage: str) -> None:
+        self.commands[name] = (handler, usage)
+    
+    @staticmethod
+    def _arguments(args: List[str], required: int, optional: int = 0) -> List[str]:
+        """Check the argument count, padding missing optional arguments with ''."""
+        if not required <= len(args) <= required + optional:
+            raise BatchError(f"Expected {required} argument(s), got {len(args)}")
+        return args + [''] * (required + optional - len(args))
+    
+    def execute(self, tokens: List[str]) -> Dict:
+        """
+        Execute one command.
+        
+        Args:
+            tokens: Command name followed by its arguments
+            
+        Returns:
+            Result dictionary with 'ok' and either 'result' or 'error'
+        """
+        name, args = tokens[0], tokens[1:]
+        entry = self.commands.get(name)
+        if entry is None:
+            return {'command': name, 'ok': False, 'error': f"Unknown command: {name}"}
+        
+        handler, usage = entry
+        try:
+            return {'command': name, 'ok': True, 'result': handler(args)}
+        except BatchError as e:
+            return {'command': name, 'ok': False, 'error': str(e), 'usage': f"{name} {usage}"}
+        except ValueError as e:
+            return {'command': name, 'ok': False, 'error': f"Invalid value: {e}",
+                    'usage': f"{name} {usage}"}
+        except Exception as e:
+            # Any other failure is this command's error; the rest of the run continues
+            return {'command': name, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    
+    def run(self, lines: Iterable[str], out: IO[str], stop_on_error: bool = False,
+            before_command: Optional[Callable[[], None]] = None) -> Dict:
+        """
+        Execute a command file, writing one JSON line per command.
+        
+        Args:
+            lines: Lines of the command file
+            out: Writable text stream for the results
+            stop_on_error: Stop at the first failed command
+            before_command: Called before each command is executed
+            
+        Returns:
+            Summary dictionary with succeeded and failed command counts
+        """
+        summary = {'succeeded': 0, 'failed': 0}
+        for line_number, line in enumerate(lines, 1):
+            try:
+                tokens = shlex.split(line, comments=True)
+            except ValueError as e:
+                tokens = None
+                result = {'command': line.strip(), 'ok': False, 'error': f"Parse error: {e}"}
+            if tokens == []:
+                continue
+            if tokens is not None:
+                if before_command is not None:
+                    before_command()
+                result = self.execute(tokens)
+            
+            result['line'] = line_number
+            out.write(json.dumps(result) + "\n")
+            summary['succeeded' if result['ok'] else 'failed'] += 1
+            if stop_on_error and not result['ok']:
+                break
+        return summary
+    
+    def add_student(self, args: List[str]):
+        student_id, name, age, gender, department = self._arguments(args, 5)
+        if not Student.is_valid_student_id(student_id):
+            raise BatchError(f"Invalid student ID: {student_id}")
+        student = Student(student_id, name, int(age), gender, department.upper())
+        if not self.university.add_student(student):
+            raise BatchError(f"Student {student_id} already exists")
+        return student.to_dict()
+    
+    def add_faculty(self, args: List[str]):
+        faculty_id, name, department = self._arguments(args, 3)
+        if not Faculty.is_valid_faculty_id(faculty_id):
+            raise BatchError(f"Invalid faculty ID: {faculty_id}")
+        faculty_member = Faculty(faculty_id, name, department.upper())
+        if not self.university.add_faculty(faculty_member):
+            raise BatchError(f"Faculty {faculty_id} already exists")
+        return faculty_member.to_dict()
+    
+    def add_course(self, args: List[str]):
+        course_id, name, credit_hours, capacity, department_id = self._arguments(args, 3, 2)
+        course = Course(course_id.upper(), name, int(credit_hours), int(capacity or 0))
+        if not self.university.add_course(course):
+            raise BatchError(f"Course {course.course_id} already exists")
+        self.university.add_course_to_department(department_id.upper(), course.course_id)
+        return course.to_dict()
+    
+    def add_department(self, args: List[str]):
+        department_id, name = self._arguments(args, 2)
+        department = Department(department_id.upper(), name)
+        if not self.university.add_department(department):
+            raise BatchError(f"Department {department.department_id} already exists")
+        return department.to_dict()
+    
+    def _update(self, update: Callable, id_key: str) -> Callable:
+        def handler(args: List[str]):
+            if len(args) < 2:
+                raise BatchError("Expected an ID and at least one FIELD=VALUE")
+            changes = {}
+            for assignment in args[1:]:
+                field, sep, value = assignment.partition('=')
+                if not sep:
+                    raise BatchError(f"Expected FIELD=VALUE, got {assignment}")
+                if field == id_key:
+                    raise BatchError(f"{id_key} cannot be updated")
+                changes[field] = int(value) if field in University.INTEGER_FIELDS else value
+            if not update(args[0], **changes):
+                raise BatchError(f"{args[0]} not found")
+            return {'updated': args[0]}
+        return handler
+    
+    def _remove(self, remove: Callable) -> Callable:
+        def handler(args: List[str]):
+            entity_id, = self._arguments(args, 1)
+            if not remove(entity_id):
+                raise BatchError(f"{entity_id} not found")
+            return {'removed': entity_id}
+        return handler
+    
+    def enroll(self, args: List[str]):
+        student_id, course_id = self._arguments(args, 2)
+        if not self.university.enroll_student_in_course(student_id, course_id):
+            raise BatchError("Enrollment failed; check IDs, existing enrollment and capacity")
+        return {'enrolled': True}
+    
+    def waitlist(self, args: List[str]):
+        student_id, course_id = self._arguments(args, 2)
+        if not self.university.join_waitlist(student_id, course_id):
+            raise BatchError("Could not join waitlist")
+        return {'waitlisted': True}
+    
+    def drop(self, args: List[str]):
+        student_id, course_id = self._arguments(args, 2)
+        if not self.university.drop_student_from_course(student_id, course_id):
+            raise BatchError("Enrollment not found")
+        return {'dropped': True}
+    
+    def grade(self, args: List[str]):
+        student_id, course_id, grade = self._arguments(args, 3)
+        if not self.university.assign_grade(student_id, course_id, float(grade)):
+            raise BatchError("Grade not assigned; check enrollment and grade range")
+        return {'graded': True}
+    
+    def assign(self, args: List[str]):
+        faculty_id, course_id = self._arguments(args, 2)
+        if not self.university.assign_faculty_to_course(faculty_id, course_id):
+            raise BatchError("Faculty or course not found")
+        return {'assigned': True}
+    
+    def set_capacity(self, args: List[str]):
+        course_id, capacity = self._arguments(args, 2)
+        if int(capacity) < 0:
+            raise BatchError("Capacity cannot be negative")
+        if not self.university.set_course_capacity(course_id, int(capacity)):
+            raise BatchError(f"{course_id} not found")
+        return {'max_capacity': int(capacity)}
+    
+    def show(self, args: List[str]):
+        collection, entity_id = self._arguments(args, 2)
+        find = {'students': self.university.find_student,
+                'faculty': self.university.find_faculty,
+                'courses': self.university.find_course,
+                'departments': self.university.find_department}.get(collection)
+        if find is None:
+            raise BatchError(f"Unknown collection: {collection}")
+        entity = find(entity_id)
+        if entity is None:
+            raise BatchError(f"{entity_id} not found")
+        return entity.to_dict()
+    
+    def search(self, args: List[str]):
+        query, types = self._arguments(args, 1, 1)
+        from fulltext import result_record
+        try:
+            results = self.university.search_all(query, types.split(',') if types else None)
+        except ValueError as e:
+            raise BatchError(str(e))
+        return [result_record(result) for result in results]
+    
+    def report(self, args: List[str]):
+        kind, = self._arguments(args, 1)
+        if kind == 'stats':
+            return self.university.get_university_stats()
+        if kind == 'gpa':
+            return [{'student_id': s.student_id, 'name': s.name, 'gpa': round(s.gpa, 2)}
+                    for s in self.university.sort_students_by_gpa()]
+        if kind == 'departments':
+            counts: Dict[str, Dict[str, int]] = {}
+            for collection in ('students', 'faculty'):
+                for entity in getattr(self.university, collection):
+                    dept = counts.setdefault(entity.department, {'students': 0, 'faculty': 0})
+                    dept[collection] += 1
+            return [{'department_id': d.department_id, 'name': d.name,
+                     'courses': len(d.courses_offered),
+                     **counts.get(d.department_id, {'students': 0, 'faculty': 0})}
+                    for d in self.university.departments]
+        if kind == 'memory':
+            from memory import memory_report
+            return memory_report(self.university)
+        raise BatchError(f"Unknown report: {kind}")
+    
+    def check(self, args: List[str]):
+        mode, = self._arguments(args, 0, 1)
+        if mode not in ('', 'repair'):
+            raise BatchError(f"Unknown check mode: {mode}")
+        from integrity import check_integrity
+        issues = check_integrity(self.university, repair=(mode == 'repair'))
+        return {'problems': len(issues), 'repaired': sum(issue['repaired'] for issue in issues),
+                'issues': issues}
+    
+    def export(self, args: List[str]):
+        mode, directory = self._arguments(args, 2)
+        from exporter import FrontendExporter
+        exporter = FrontendExporter(self.university, directory)
+        if mode == 'full':
+            return exporter.export_full()
+        if mode == 'delta':
+            return exporter.export_delta()
+        raise BatchError(f"Unknown export mode: {mode}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a batch command or command file.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Process exit status (0 if every command succeeded)
+    """
+    from file_handler import FileHandler, SaveConflictError
+    
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Run University Management System operations without the menu. "
+                    "Use 'run FILE' (or 'run -' for stdin) to execute a command file, "
+                    "or give a single command such as 'enroll S0001 CSE101'.")
+    parser.add_argument('--no-save', action='store_true', help="Do not save data at the end")
+    parser.add_argument('--stop-on-error', action='store_true',
+                        help="Stop at the first failed command")
+    parser.add_argument('command', help="'run', 'commands' or a command name")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="Command arguments")
+    args = parser.parse_args(argv)
+    
+    university = University("Tech University", "123 College Ave, Tech City")
+    runner = BatchRunner(university)
+    
+    if args.command == 'commands':
+        for name, (_, usage) in runner.commands.items():
+            print(f"{name} {usage}")
+        return 0
+    
+    # Status messages go to stderr so stdout carries only JSON lines
+    with redirect_stdout(sys.stderr):
+        FileHandler.load_all_data(university)
+    start_version = university.version
+    
+    def reload_changes() -> None:
+        # Data saved by another process meanwhile; only reloaded while we
+        # have no unsaved changes, which the final save merges instead
+        nonlocal start_version
+        if FileHandler.reload_if_changed(university):
+            start_version = university.version
+    
+    if args.command == 'run':
+        if len(args.args) != 1:
+            parser.error("run expects exactly one command file")
+        path = args.args[0]
+        try:
+            source = sys.stdin if path == '-' else open(path, 'r')
+        except OSError as e:
+            result = {'command': 'run', 'ok': False, 'error': f"Cannot read {path}: {e.strerror}"}
+            sys.stdout.write(json.dumps(result) + "\n")
+            summary = {'succeeded': 0, 'failed': 1}
+        else:
+            try:
+                summary = runner.run(source, sys.stdout, args.stop_on_error, reload_changes)
+            finally:
+                if source is not sys.stdin:
+                    source.close()
+    else:
+        reload_changes()
+        result = runner.execute([args.command] + args.args)
+        sys.stdout.write(json.dumps(result) + "\n")
+        summary = {'succeeded': int(result['ok']), 'failed': int(not result['ok'])}
+    
+    # Also saved when only the codec changed, which converts the data file
+    summary['saved'] = False
+    if not args.no_save and (university.version != start_version or FileHandler.codec_changed()):
+        with redirect_stdout(sys.stderr):
+            try:
+                FileHandler.save_all_data(university)
+                summary['saved'] = True
+            except SaveConflictError:
+                summary['conflict_copy'] = FileHandler.save_conflict_copy(university)
+    
+    sys.stdout.write(json.dumps({'summary': summary}) + "\n")
+    return 0 if summary['failed'] == 0 and 'conflict_copy' not in summary else 1
\ No newline at end of file
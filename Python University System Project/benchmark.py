@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for University Management System
+
+Times the core University and FileHandler operations on synthetic
+universities of several sizes, records the results as JSON and compares
+two result files to flag regressions. The codecs command compares data
+file size and save/load time for each compression codec. Runs offline
+using only the standard library.
+
+Examples:
+    python benchmark.py run --sizes 100 1000 10000 --output before.json
+    python benchmark.py compare before.json after.json --threshold 0.15
+    python benchmark.py codecs --sizes 1000 10000
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple
+from university import University
+from file_handler import FileHandler
+from generator import SyntheticUniversity
+from compression import CODECS
+from utils import write_table
+
+# A benchmark prepares state (untimed) and returns it with the number of
+# operations the timed call performs
+Setup = Callable[['BenchmarkContext'], Tuple[object, int]]
+Operation = Callable[[object], None]
+
+class BenchmarkContext:
+    """Dataset of one size shared by the benchmarks."""
+    
+    def __init__(self, size: int, seed: int, data_dir: str):
+        """
+        Generate the dataset.
+        
+        Args:
+            size: Number of students
+            seed: Random seed for data and benchmark inputs
+            data_dir: Scratch directory for file benchmarks
+        """
+        self.size = size
+        self.seed = seed
+        self.data_dir = data_dir
+        self.university = SyntheticUniversity(size, seed).build()
+        self.serialized = json.dumps(self.university.get_all_data())
+        self.rng = random.Random(seed)
+    
+    def fresh_university(self) -> University:
+        """Get an independent copy of the dataset for mutating benchmarks."""
+        university = University()
+        university.load_all_data(json.loads(self.serialized))
+        return university
+    
+    def sample(self, collection: str, key: str, count: int) -> List[str]:
+        """Pick count entity IDs (with repetition) from a collection."""
+        ids = [getattr(entity, key) for entity in getattr(self.university, collection)]
+        return [self.rng.choice(ids) for _ in range(count)] if ids else []
+
+# FileHandler class attributes changed while benchmarking and restored afterwards
+FILE_HANDLER_STATE = ('DATA_DIR', 'UNIVERSITY_FILE', 'CACHE_FILE', '_known_version',
+                      '_known_stat', '_known_hash', '_base_snapshot', 'COMPRESSION',
+                      'loaded_codec')
+
+def _quiet():
+    """Context manager discarding status messages printed by FileHandler."""
+    return redirect_stdout(io.StringIO())
+
+def _use_scratch_files(data_dir: str) -> None:
+    """Point FileHandler at a scratch directory and forget the known file state."""
+    FileHandler.DATA_DIR = data_dir
+    FileHandler.UNIVERSITY_FILE = os.path.join(data_dir, "university.json")
+    FileHandler.CACHE_FILE = os.path.join(data_dir, "university.cache.pickle")
+    FileHandler._known_version = 0
+    FileHandler._known_stat = None
+    FileHandler._known_hash = ""
+    FileHandler._base_snapshot = None
+    FileHandler.loaded_codec = None
+
+def _save_dataset(ctx: BenchmarkContext) -> None:
+    _use_scratch_files(ctx.data_dir)
+    for path in (FileHandler.UNIVERSITY_FILE, FileHandler.CACHE_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    with _quiet():
+        FileHandler.save_all_data(ctx.fresh_university())
+
+def _setup_load(warm: bool) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        if not os.path.exists(FileHandler.UNIVERSITY_FILE):
+            _save_dataset(ctx)
+        if warm and not os.path.exists(FileHandler.CACHE_FILE):
+            with _quiet():
+                FileHandler.load_all_data(University())
+        elif not warm and os.path.exists(FileHandler.CACHE_FILE):
+            os.remove(FileHandler.CACHE_FILE)
+        return University(), 1
+    return setup
+
+def _load(university: University) -> None:
+    FileHandler.load_all_data(university, verbose=False)
+
+def _setup_save(ctx: BenchmarkContext):
+    _save_dataset(ctx)
+    university = University()
+    with _quiet():
+        FileHandler.load_all_data(university)
+    if university.students:
+        university.update_student(university.students[0].student_id, name="Benchmark Student")
+    return university, 1
+
+def _save(university: University) -> None:
+    with _quiet():
+        FileHandler.save_all_data(university)
+
+def _setup_lookups(method: str, collection: str, key: str, count: int = 1000) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        return (getattr(ctx.university, method), ctx.sample(collection, key, count)), count
+    return setup
+
+def _lookups(state) -> None:
+    find, ids = state
+    for entity_id in ids:
+        find(entity_id)
+
+def _setup_search(cached: bool) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        # Distinct queries, so a cold run never hits an entry it cached itself
+        names = list(dict.fromkeys(s.name.split()[-1][:3].lower()
+                                   for s in ctx.university.students[:20])) or ["a"]
+        ctx.university.search_cache.clear()
+        if cached:
+            _search((ctx.university, names))
+        return (ctx.university, names), len(names)
+    return setup
+
+def _search(state) -> None:
+    university, queries = state
+    for query in queries:
+        university.search_students_by_name(query)
+
+def _setup_pairs(count: int = 200) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        university = ctx.fresh_university()
+        pairs = list(zip(ctx.sample('students', 'student_id', count),
+                         ctx.sample('courses', 'course_id', count)))
+        return (university, pairs), count
+    return setup
+
+def _enroll(state) -> None:
+    university, pairs = state
+    for student_id, course_id in pairs:
+        university.enroll_student_in_course(student_id, course_id)
+
+def _setup_grades(ctx: BenchmarkContext):
+    university = ctx.fresh_university()
+    grades = [(s.student_id, course_id, ctx.rng.uniform(0.0, 4.0))
+              for s in ctx.university.students[:500] for course_id in s.course_grades]
+    return (university, grades), max(1, len(grades))
+
+def _grade(state) -> None:
+    university, grades = state
+    for student_id, course_id, grade in grades:
+        university.assign_grade(student_id, course_id, grade)
+
+def _setup_removals(method: str, collection: str, key: str, count: int = 20) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        university = ctx.fresh_university()
+        ids = list(dict.fromkeys(ctx.sample(collection, key, count)))
+        return (getattr(university, method), ids), max(1, len(ids))
+    return setup
+
+def _remove(state) -> None:
+    remove, ids = state
+    for entity_id in ids:
+        remove(entity_id)
+
+def _setup_university(ctx: BenchmarkContext):
+    return ctx.university, 1
+
+def _setup_report(operation: Operation, cached: bool) -> Setup:
+    def setup(ctx: BenchmarkContext):
+        ctx.university.views.clear()
+        if cached:
+            operation(ctx.university)
+        return ctx.university, 1
+    return setup
+
+def _stats(university: University) -> None:
+    university.get_university_stats()
+
+def _ranking(university: University) -> None:
+    university.sort_students_by_gpa()
+
+BENCHMARKS: List[Tuple[str, Setup, Operation]] = [
+    ('load (cold)', _setup_load(warm=False), _load),
+    ('load (warm cache)', _setup_load(warm=True), _load),
+    ('save', _setup_save, _save),
+    ('find_student', _setup_lookups('find_student', 'students', 'student_id'), _lookups),
+    ('find_course', _setup_lookups('find_course', 'courses', 'course_id'), _lookups),
+    ('search_students_by_name', _setup_search(cached=False), _search),
+    ('search_students_by_name (cached)', _setup_search(cached=True), _search),
+    ('enroll_student_in_course', _setup_pairs(), _enroll),
+    ('assign_grade', _setup_grades, _grade),
+    ('remove_student', _setup_removals('remove_student', 'students', 'student_id'), _remove),
+    ('remove_course', _setup_removals('remove_course', 'courses', 'course_id'), _remove),
+    ('remove_faculty', _setup_removals('remove_faculty', 'faculty', 'faculty_id'), _remove),
+    ('get_university_stats', _setup_report(_stats, cached=False), _stats),
+    ('get_university_stats (cached)', _setup_report(_stats, cached=True), _stats),
+    ('sort_students_by_gpa', _setup_report(_ranking, cached=False), _ranking),
+    ('sort_students_by_gpa (cached)', _setup_report(_ranking, cached=True), _ranking),
+    ('snapshot', _setup_university, lambda u: u.snapshot())
+]
+
+def run_benchmarks(sizes: List[int], repeat: int = 5, seed: int = 0,
+                   only: Optional[List[str]] = None) -> Dict:
+    """
+    Run the benchmark suite.
+    
+    Each benchmark is set up afresh and timed repeat times per size. File
+    benchmarks use a scratch directory, never the real data directory.
+    
+    Args:
+        sizes: Dataset sizes (number of students)
+        repeat: Timed runs per benchmark and size
+        seed: Random seed for data and inputs
+        only: Names of benchmarks to run (all if None)
+        
+    Returns:
+        Results dictionary with 'meta' and per-benchmark, per-size timings
+        in seconds per operation
+    """
+    results: Dict[str, Dict[str, Dict]] = {}
+    saved_state = {attr: getattr(FileHandler, attr) for attr in FILE_HANDLER_STATE}
+    scratch = tempfile.mkdtemp(prefix="university-bench-")
+    
+    try:
+        for size in sizes:
+            ctx = BenchmarkContext(size, seed, os.path.join(scratch, str(size)))
+            os.makedirs(ctx.data_dir)
+            _use_scratch_files(ctx.data_dir)
+            
+            for name, setup, operation in BENCHMARKS:
+                if only and name not in only:
+                    continue
+                timings = []
+                for _ in range(repeat):
+                    state, ops = setup(ctx)
+                    started = time.perf_counter()
+                    operation(state)
+                    timings.append((time.perf_counter() - started) / ops)
+                results.setdefault(name, {})[str(size)] = {
+                    'min': min(timings),
+                    'median': statistics.median(timings),
+                    'ops': ops
+                }
+                print(f"  {name:<28} {size:>7} students  {min(timings) * 1e6:>12.1f} µs/op",
+                      file=sys.stderr)
+    finally:
+        for attr, value in saved_state.items():
+            setattr(FileHandler, attr, value)
+        shutil.rmtree(scratch, ignore_errors=True)
+    
+    return {'meta': _meta(sizes, repeat, seed), 'results': results}
+
+def _meta(sizes: List[int], repeat: int, seed: int) -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sizes': sizes,
+        'repeat': repeat,
+        'seed': seed
+    }
+
+def benchmark_codecs(sizes: List[int], repeat: int = 3, seed: int = 0) -> Dict:
+    """
+    Compare the data file codecs.
+    
+    For every codec (and plain JSON) the dataset is saved and then loaded
+    without the warm-start cache repeat times in a scratch directory.
+    
+    Args:
+        sizes: Dataset sizes (number of students)
+        repeat: Timed saves and loads per codec and size
+        seed: Random seed for the data
+        
+    Returns:
+        Results dictionary with 'meta' and per-codec, per-size file size in
+        bytes, size relative to plain JSON and best save and load seconds
+    """
+    results: Dict[str, Dict[str, Dict]] = {}
+    saved_state = {attr: getattr(FileHandler, attr) for attr in FILE_HANDLER_STATE}
+    scratch = tempfile.mkdtemp(prefix="university-bench-")
+    
+    try:
+        for size in sizes:
+            ctx = BenchmarkContext(size, seed, os.path.join(scratch, str(size)))
+            os.makedirs(ctx.data_dir)
+            plain_size = None
+            
+            for codec in [None] + list(CODECS):
+                _use_scratch_files(ctx.data_dir)
+                FileHandler.COMPRESSION = codec or 'none'
+                saves, loads = [], []
+                for _ in range(repeat):
+                    university, _ = _setup_save(ctx)
+                    started = time.perf_counter()
+                    _save(university)
+                    saves.append(time.perf_counter() - started)
+                    
+                    university, _ = _setup_load(warm=False)(ctx)
+                    started = time.perf_counter()
+                    _load(university)
+                    loads.append(time.perf_counter() - started)
+                
+                file_size = os.path.getsize(FileHandler.UNIVERSITY_FILE)
+                plain_size = plain_size or file_size
+                name = codec or 'none'
+                results.setdefault(name, {})[str(size)] = {
+                    'bytes': file_size,
+                    'ratio': file_size / plain_size,
+                    'save': min(saves),
+                    'load': min(loads)
+                }
+                print(f"  {name:<6} {size:>7} students  {file_size / 1024:>10.1f} KiB  "
+                      f"save {min(saves) * 1e3:>8.1f} ms  load {min(loads) * 1e3:>8.1f} ms",
+                      file=sys.stderr)
+    finally:
+        for attr, value in saved_state.items():
+            setattr(FileHandler, attr, value)
+        shutil.rmtree(scratch, ignore_errors=True)
+    
+    return {'meta': _meta(sizes, repeat, seed), 'results': results}
+
+def compare_results(old: Dict, new: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Compare two result sets.
+    
+    Args:
+        old: Baseline results
+        new: New results
+        threshold: Relative slowdown of the best time counted as a regression
+        
+    Returns:
+        One row per benchmark and size present in both runs, with the ratio
+        new/old and whether it is a regression
+    """
+    rows = []
+    for name, sizes in new['results'].items():
+        for size, timing in sizes.items():
+            baseline = old['results'].get(name, {}).get(size)
+            if baseline is None or baseline['min'] <= 0:
+                continue
+            ratio = timing['min'] / baseline['min']
+            rows.append({'benchmark': name, 'size': int(size), 'old': baseline['min'],
+                         'new': timing['min'], 'ratio': ratio,
+                         'regression': ratio > 1.0 + threshold})
+    return rows
+
+def print_results(results: Dict) -> None:
+    """Print a results dictionary as a table."""
+    rows = ((name, size, f"{timing['min'] * 1e6:.1f}", f"{timing['median'] * 1e6:.1f}", timing['ops'])
+            for name, sizes in results['results'].items() for size, timing in sizes.items())
+    write_table(['Benchmark', 'Students', 'Best µs/op', 'Median µs/op', 'Ops'], rows)
+
+def print_codec_results(results: Dict) -> None:
+    """Print a codec comparison built by benchmark_codecs() as a table."""
+    rows = ((codec, size, f"{r['bytes'] / 1024:,.1f}", f"{r['ratio']:.3f}",
+             f"{r['save'] * 1e3:.1f}", f"{r['load'] * 1e3:.1f}")
+            for codec, sizes in results['results'].items() for size, r in sizes.items())
+    write_table(['Codec', 'Students', 'KiB', 'Ratio', 'Save ms', 'Load ms'], rows)
+
+def main():
+    """Run or compare benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="University Management System benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    run = commands.add_parser('run', help="Run the benchmark suite")
+    run.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                     help="Dataset sizes (number of students)")
+    run.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark")
+    run.add_argument('--seed', type=int, default=0, help="Random seed")
+    run.add_argument('--only', nargs='+', help="Benchmarks to run")
+    run.add_argument('--output', help="Write results to this JSON file")
+    
+    compare = commands.add_parser('compare', help="Compare two result files")
+    compare.add_argument('old', help="Baseline results")
+    compare.add_argument('new', help="New results")
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help="Relative slowdown flagged as a regression")
+    
+    codecs = commands.add_parser('codecs', help="Compare data file compression codecs")
+    codecs.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help="Dataset sizes (number of students)")
+    codecs.add_argument('--repeat', type=int, default=3, help="Timed saves and loads per codec")
+    codecs.add_argument('--seed', type=int, default=0, help="Random seed")
+    codecs.add_argument('--output', help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    if args.command in ('run', 'codecs'):
+        if args.command == 'run':
+            results = run_benchmarks(args.sizes, args.repeat, args.seed, args.only)
+            print_results(results)
+        else:
+            results = benchmark_codecs(args.sizes, args.repeat, args.seed)
+            print_codec_results(results)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"✓ Results written to {args.output}")
+        return
+    
+    with open(args.old, 'r') as f:
+        old = json.load(f)
+    with open(args.new, 'r') as f:
+        new = json.load(f)
+    rows = compare_results(old, new, args.threshold)
+    write_table(['Benchmark', 'Students', 'Old µs/op', 'New µs/op', 'Change', ''],
+                ((r['benchmark'], r['size'], f"{r['old'] * 1e6:.1f}", f"{r['new'] * 1e6:.1f}",
+                  f"{(r['ratio'] - 1) * 100:+.1f}%", "REGRESSION" if r['regression'] else "")
+                 for r in rows))
+    
+    regressions = [r for r in rows if r['regression']]
+    if regressions:
+        print(f"⚠ {len(regressions)} regression(s) above {args.threshold:.0%}")
+        raise SystemExit(1)
+    print("✓ No regressions")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
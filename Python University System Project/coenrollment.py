@@ -0,0 +1,269 @@
+"""
+Co-enrollment module for University Management System
+"""
+
+from itertools import combinations
+from typing import Dict, List, Optional, Set
+from events import ChangeEvent
+
+class CoEnrollmentGraph:
+    """Weighted course-course conflict graph built from student enrollments."""
+    
+    def __init__(self):
+        """
+        Initialize an empty co-enrollment graph.
+        
+        The graph is built from the student -> courses adjacency, so the
+        cost of a build is the sum of k^2 over students (k = courses per
+        student) rather than a pairwise comparison of course rosters.
+        """
+        self.student_courses: Dict[str, Set[str]] = {}  # student_id -> course IDs
+        self.course_sizes: Dict[str, int] = {}  # course_id -> enrolled count
+        self.edges: Dict[str, Dict[str, int]] = {}  # course_id -> {course_id: shared students}
+        self._university = None  # University followed through its change events
+    
+    @classmethod
+    def from_university(cls, university) -> 'CoEnrollmentGraph':
+        """
+        Build the conflict graph for every course in a university.
+        
+        Args:
+            university: University object
+            
+        Returns:
+            CoEnrollmentGraph with one node per course
+        """
+        graph = cls()
+        for course in university.courses:
+            graph.add_course(course.course_id)
+        
+        graph._add_students(university.students)
+        return graph
+    
+    @classmethod
+    def follow(cls, university) -> 'CoEnrollmentGraph':
+        """
+        Build the conflict graph and keep it current as enrollments change.
+        
+        Enrollments, drops and removals update the affected edges only; a
+        bulk reload rebuilds the graph.
+        
+        Args:
+            university: University object whose change events are followed
+            
+        Returns:
+            CoEnrollmentGraph subscribed to the university's events
+        """
+        graph = cls.from_university(university)
+        graph._university = university
+        university.events.subscribe(graph._on_change, [ChangeEvent.ENROLLED,
+                                                       ChangeEvent.DROPPED,
+                                                       ChangeEvent.ENTITY_ADDED,
+                                                       ChangeEvent.ENTITY_REMOVED,
+                                                       ChangeEvent.RELOADED])
+        return graph
+    
+    def _add_students(self, students) -> None:
+        """Add the enrollments of students not yet in the graph."""
+        for student in students:
+            courses = set(student.course_grades)
+            if not courses:
+                continue
+            self.student_courses[student.student_id] = courses
+            for course_id in courses:
+                self.add_course(course_id)
+                self.course_sizes[course_id] += 1
+            for first, second in combinations(courses, 2):
+                self._change_weight(first, second, 1)
+    
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Event subscriber: apply an enrollment change to the graph."""
+        kind = event.kind
+        if kind == ChangeEvent.RELOADED:
+            self.student_courses, self.course_sizes, self.edges = {}, {}, {}
+            for course in self._university.courses:
+                self.add_course(course.course_id)
+            self._add_students(self._university.students)
+        elif kind == ChangeEvent.ENROLLED:
+            self.add_enrollment(event.entity_id, event.data['course_id'])
+        elif kind == ChangeEvent.DROPPED:
+            if not event.data.get('waitlist'):
+                self.remove_enrollment(event.entity_id, event.data['course_id'])
+        elif event.collection == 'courses':
+            if kind == ChangeEvent.ENTITY_ADDED:
+                self.add_course(event.entity_id)
+            else:
+                self.remove_course(event.entity_id)
+        elif event.collection == 'students':
+            if kind == ChangeEvent.ENTITY_ADDED:
+                student = self._university.find_student(event.entity_id)
+                if student is not None:
+                    self._add_students([student])
+            else:
+                self.remove_student(event.entity_id)
+    
+    def add_course(self, course_id: str) -> None:
+        """Add a course node to the graph (no-op if already present)."""
+        if course_id not in self.edges:
+            self.edges[course_id] = {}
+            self.course_sizes[course_id] = 0
+    
+    def add_enrollment(self, student_id: str, course_id: str) -> bool:
+        """
+        Record a new enrollment and update the affected edges.
+        
+        Args:
+            student_id: Student identifier
+            course_id: Course identifier
+            
+        Returns:
+            True if recorded, False if the enrollment already existed
+        """
+        courses = self.student_courses.setdefault(student_id, set())
+        if course_id in courses:
+            return False
+        
+        self.add_course(course_id)
+        for other_id in courses:
+            self._change_weight(course_id, other_id, 1)
+        courses.add(course_id)
+        self.course_sizes[course_id] += 1
+        return True
+    
+    def remove_enrollment(self, student_id: str, course_id: str) -> bool:
+        """
+        Remove an enrollment and update the affected edges.
+        
+        Args:
+            student_id: Student identifier
+            course_id: Course identifier
+            
+        Returns:
+            True if removed, False if the enrollment was not recorded
+        """
+        courses = self.student_courses.get(student_id)
+        if not courses or course_id not in courses:
+            return False
+        
+        courses.remove(course_id)
+        for other_id in courses:
+            self._change_weight(course_id, other_id, -1)
+        self.course_sizes[course_id] -= 1
+        if not courses:
+            del self.student_courses[student_id]
+        return True
+    
+    def remove_student(self, student_id: str) -> bool:
+        """Remove every enrollment of a student."""
+        courses = self.student_courses.get(student_id)
+        if not courses:
+            return False
+        
+        for course_id in list(courses):
+            self.remove_enrollment(student_id, course_id)
+        return True
+    
+    def remove_course(self, course_id: str) -> bool:
+        """Remove a course node together with its enrollments."""
+        if course_id not in self.edges:
+            return False
+        
+        for courses in self.student_courses.values():
+            courses.discard(course_id)
+        for other_id in self.edges.pop(course_id):
+            del self.edges[other_id][course_id]
+        del self.course_sizes[course_id]
+        self.student_courses = {s: c for s, c in self.student_courses.items() if c}
+        return True
+    
+    def _change_weight(self, first: str, second: str, delta: int) -> None:
+        """Adjust the weight of an undirected edge, dropping it at zero."""
+        for a, b in ((first, second), (second, first)):
+            neighbours = self.edges.setdefault(a, {})
+            weight = neighbours.get(b, 0) + delta
+            if weight > 0:
+                neighbours[b] = weight
+            else:
+                neighbours.pop(b, None)
+    
+    def get_conflicts(self, course_id: str) -> Dict[str, int]:
+        """Get courses sharing students with a course (course_id -> shared count)."""
+        return dict(self.edges.get(course_id, {}))
+    
+    def conflict_weight(self, first: str, second: str) -> int:
+        """Get the number of students enrolled in both courses."""
+        return self.edges.get(first, {}).get(second, 0)
+    
+    def assign_exam_slots(self, max_slots: Optional[int] = None) -> Dict[str, int]:
+        """
+        Assign exam slots with greedy graph coloring.
+        
+        Courses are colored in Welsh-Powell order (most conflicting students
+        first) and each takes the lowest slot not used by a neighbour. When
+        max_slots is given and no free slot exists, the slot with the fewest
+        clashing students is used instead.
+        
+        Args:
+            max_slots: Optional upper bound on the number of slots
+            
+        Returns:
+            Dictionary of course_id -> slot number (starting at 0)
+            
+        Raises:
+            ValueError: If max_slots is less than 1
+        """
+        if max_slots is not None and max_slots < 1:
+            raise ValueError(f"Number of exam slots must be at least 1, got {max_slots}")
+        order = sorted(self.edges,
+                       key=lambda c: (-sum(self.edges[c].values()), -len(self.edges[c]), c))
+        slots: Dict[str, int] = {}
+        
+        for course_id in order:
+            clashes: Dict[int, int] = {}
+            for other_id, weight in self.edges[course_id].items():
+                slot = slots.get(other_id)
+                if slot is not None:
+                    clashes[slot] = clashes.get(slot, 0) + weight
+            
+            slot = 0
+            while slot in clashes:
+                slot += 1
+            
+            if max_slots is not None and slot >= max_slots:
+                slot = min(range(max_slots), key=lambda s: (clashes.get(s, 0), s))
+            slots[course_id] = slot
+        
+        return slots
+    
+    def count_clashes(self, slots: Dict[str, int]) -> int:
+        """Count student exam clashes (pairs of same-slot exams) in an assignment."""
+        total = 0
+        for course_id, neighbours in self.edges.items():
+            for other_id, weight in neighbours.items():
+                if course_id < other_id and slots.get(course_id) == slots.get(other_id):
+                    total += weight
+        return total
+    
+    def get_stats(self) -> Dict:
+        """Get graph statistics."""
+        return {
+            'courses': len(self.edges),
+            'students': len(self.student_courses),
+            'conflict_edges': sum(len(n) for n in self.edges.values()) // 2
+        }
+    
+    def display_exam_schedule(self, max_slots: Optional[int] = None) -> None:
+        """Display an exam slot assignment grouped by slot."""
+        slots = self.assign_exam_slots(max_slots)
+        by_slot: Dict[int, List[str]] = {}
+        for course_id, slot in slots.items():
+            by_slot.setdefault(slot, []).append(course_id)
+        
+        print("\n" + "="*60)
+        print("EXAM SLOT ASSIGNMENT")
+        print("="*60)
+        for slot in sorted(by_slot):
+            print(f"Slot {slot + 1:<4} {', '.join(sorted(by_slot[slot]))}")
+        print("-"*60)
+        print(f"Slots used: {len(by_slot)}")
+        print(f"Student clashes: {self.count_clashes(slots)}")
\ No newline at end of file
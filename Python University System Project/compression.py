@@ -0,0 +1,134 @@
+"""
+Compression module for University Management System
+
+Standard-library codecs (gzip, bz2, lzma) for compressed data files. Data
+is compressed while it is written and decompressed while it is read, and
+the codec of a file is detected from its leading magic bytes, so plain
+and compressed files load the same way.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, TextIO
+
+# Codec name -> (module, magic bytes, default compression level)
+CODECS = {
+    'gzip': (gzip, b'\x1f\x8b', 6),
+    'bz2': (bz2, b'BZh', 9),
+    'lzma': (lzma, b'\xfd7zXZ\x00', 6)
+}
+MAGIC_LENGTH = max(len(magic) for _, magic, _ in CODECS.values())
+
+def check_codec(codec: Optional[str]) -> Optional[str]:
+    """
+    Validate a codec name.
+    
+    Args:
+        codec: Codec name; None, '' and 'none' mean no compression
+        
+    Returns:
+        The codec name, or None for no compression
+        
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    if not codec or codec == 'none':
+        return None
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec: {codec} "
+                         f"(expected one of none, {', '.join(CODECS)})")
+    return codec
+
+def detect_codec(head: bytes) -> Optional[str]:
+    """Detect the codec from the first bytes of a file (None for plain data)."""
+    for codec, (_, magic, _) in CODECS.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+def decompress(raw: bytes) -> bytes:
+    """Decompress data of any supported codec; plain data is returned as is."""
+    codec = detect_codec(raw[:MAGIC_LENGTH])
+    return raw if codec is None else CODECS[codec][0].decompress(raw)
+
+def _codec_file(codec: str, f: BinaryIO, mode: str, level: Optional[int] = None):
+    """Wrap a binary file in the codec's file object; closing it leaves f open."""
+    if mode == 'wb' and level is None:
+        level = CODECS[codec][2]
+    if codec == 'gzip':
+        # No file name or time in the header, so equal data compresses equally
+        return gzip.GzipFile(filename='', mode=mode, fileobj=f,
+                             compresslevel=9 if level is None else level, mtime=0)
+    if codec == 'bz2':
+        return bz2.BZ2File(f, mode, compresslevel=9 if level is None else level)
+    return lzma.LZMAFile(f, mode, preset=level)
+
+class _ChunkedTextWriter:
+    """Text stream that encodes what is written in large chunks."""
+    
+    CHUNK_SIZE = 1 << 16  # Characters collected before encoding
+    
+    def __init__(self, target: BinaryIO):
+        self._target = target
+        self._parts: List[str] = []
+        self._size = 0
+    
+    def write(self, text: str) -> None:
+        # json.dump writes many tiny pieces; each write to a codec file object
+        # (directly or through io.TextIOWrapper) has Python-level overhead
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.CHUNK_SIZE:
+            self.flush()
+    
+    def flush(self) -> None:
+        if self._parts:
+            self._target.write("".join(self._parts).encode('utf-8'))
+            self._parts = []
+            self._size = 0
+
+@contextmanager
+def compressed_writer(f: BinaryIO, codec: Optional[str],
+                      level: Optional[int] = None) -> Iterator[TextIO]:
+    """
+    Text stream that compresses what is written to it into a binary file.
+    
+    The compressed stream is finished when the block exits; f stays open,
+    so the caller can still flush and fsync it.
+    
+    Args:
+        f: Binary file opened for writing
+        codec: Codec name, or None to write plain text
+        level: Compression level (codec default if None)
+    """
+    target = f if codec is None else _codec_file(codec, f, 'wb', level)
+    text = _ChunkedTextWriter(target)
+    try:
+        yield text
+        text.flush()
+    finally:
+        if target is not f:
+            target.close()
+
+@contextmanager
+def open_text(path: str) -> Iterator[TextIO]:
+    """
+    Open a plain or compressed file for reading as decompressed text.
+    
+    Args:
+        path: File to read; its codec is detected from its magic bytes
+    """
+    with open(path, 'rb') as f:
+        codec = detect_codec(f.read(MAGIC_LENGTH))
+        f.seek(0)
+        source = f if codec is None else _codec_file(codec, f, 'rb')
+        text = io.TextIOWrapper(source, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            text.detach()
+            if source is not f:
+                source.close()
\ No newline at end of file
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Concurrency module for University Management System
+
+Provides a reader-writer lock and a thread-safe University wrapper so one
+University instance can be shared across worker threads.
+"""
+
+import argparse
+import random
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+from university import University
+from student import Student
+from course import Course
+
+class ReadWriteLock:
+    """Writer-preferring reader-writer lock.
+    
+    Any number of readers may hold the lock at once; a writer holds it
+    exclusively. Waiting writers block new readers so a steady stream of
+    reads cannot starve mutations. The writing thread may re-acquire the
+    lock for reading or writing.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer = None  # Thread ident of the active writer
+        self._write_depth = 0
+    
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_read(self) -> None:
+        """Release a read hold."""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._write_depth -= 1
+                return
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+    
+    def acquire_write(self) -> None:
+        """Acquire the lock exclusively."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+    
+    def release_write(self) -> None:
+        """Release an exclusive hold."""
+        with self._cond:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+    
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+    
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Context manager holding the lock exclusively."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class ThreadSafeUniversity:
+    """Proxy that serializes University mutations and runs reads concurrently.
+    
+    Query methods (find/search/stats/sort/display) take the shared read
+    lock; every other method takes the exclusive write lock, so cascades
+    such as remove_course are applied atomically. Code that iterates the
+    entity lists directly should do so inside read_locked().
+    """
+    
+    READ_METHODS = frozenset({
+        'find_student', 'find_faculty', 'find_course', 'find_department',
+        'search_students_by_name', 'search_faculty_by_name', 'search_courses_by_name',
+        'get_university_stats', 'get_average_gpa', 'sort_students_by_gpa',
+        'search_all', 'students_in_all_courses', 'students_in_any_course', 'count_shared_students',
+        'display_university_info', 'display_detailed_stats', 'get_all_data', 'snapshot'
+    })
+    
+    def __init__(self, university: University = None):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            university: University object to protect (a new one if omitted)
+        """
+        self._university = university if university is not None else University()
+        self._lock = ReadWriteLock()
+        self._wrapped: Dict[str, object] = {}
+    
+    @property
+    def unwrapped(self) -> University:
+        """The underlying University (unsynchronized)."""
+        return self._university
+    
+    @property
+    def lock(self) -> ReadWriteLock:
+        """The reader-writer lock guarding the University."""
+        return self._lock
+    
+    @contextmanager
+    def read_locked(self) -> Iterator[University]:
+        """Hold the read lock and yield the underlying University."""
+        with self._lock.read_locked():
+            yield self._university
+    
+    @contextmanager
+    def write_locked(self) -> Iterator[University]:
+        """Hold the write lock and yield the underlying University."""
+        with self._lock.write_locked():
+            yield self._university
+    
+    def __getattr__(self, name: str):
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        
+        attr = getattr(self._university, name)
+        if not callable(attr) or name.startswith('__'):
+            return attr
+        
+        locked = self._lock.read_locked if name in self.READ_METHODS else self._lock.write_locked
+        
+        def method(*args, **kwargs):
+            with locked():
+                return attr(*args, **kwargs)
+        
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        self._wrapped[name] = method
+        return method
+
+def check_referential_consistency(university: University) -> List[str]:
+    """
+    Check that enrollments and waitlists only reference existing entities
+    and that course rosters and student grade books agree.
+    
+    Args:
+        university: University object
+        
+    Returns:
+        List of problems found (empty if consistent)
+    """
+    problems = []
+    students = {s.student_id: s for s in university.students}
+    courses = {c.course_id: c for c in university.courses}
+    
+    if len(students) != len(university.students):
+        problems.append("Duplicate student IDs")
+    if len(courses) != len(university.courses):
+        problems.append("Duplicate course IDs")
+    
+    for course in university.courses:
+        for student_id in course.enrolled_students:
+            student = students.get(student_id)
+            if student is None:
+                problems.append(f"{course.course_id} lists missing student {student_id}")
+            elif course.course_id not in student.course_grades:
+                problems.append(f"{course.course_id} lists {student_id}, who is not enrolled")
+        for student_id in course.waitlist.get_ordered():
+            if student_id not in students:
+                problems.append(f"{course.course_id} waitlists missing student {student_id}")
+        if course.max_capacity and len(course.enrolled_students) > course.max_capacity:
+            problems.append(f"{course.course_id} is over capacity")
+    
+    for student in university.students:
+        for course_id in student.course_grades:
+            course = courses.get(course_id)
+            if course is None:
+                problems.append(f"{student.student_id} enrolled in missing course {course_id}")
+            elif not course.is_student_enrolled(student.student_id):
+                problems.append(f"{student.student_id} missing from {course_id} roster")
+    
+    return problems
+
+def run_stress_test(threads: int = 16, operations: int = 2000, seed: int = 0) -> Dict:
+    """
+    Hammer a shared ThreadSafeUniversity with mixed reads and writes.
+    
+    Args:
+        threads: Number of worker threads
+        operations: Operations per thread
+        seed: Random seed
+        
+    Returns:
+        Dictionary with operation counts, worker errors and consistency problems
+    """
+    university = ThreadSafeUniversity()
+    course_ids = [f"CSE{n:03d}" for n in range(100, 140)]
+    for course_id in course_ids:
+        university.add_course(Course(course_id, f"Course {course_id}", 3, max_capacity=25))
+    
+    errors: List[str] = []
+    counts: Dict[str, int] = {}
+    counts_lock = threading.Lock()
+    
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        local: Dict[str, int] = {}
+        try:
+            for _ in range(operations):
+                student_id = f"S{rng.randrange(2000):04d}"
+                course_id = rng.choice(course_ids)
+                op = rng.random()
+                if op < 0.15:
+                    name = 'add_student'
+                    university.add_student(Student(student_id, "Stress Student", 20, "Other", "CSE"))
+                elif op < 0.35:
+                    name = 'enroll'
+                    if not university.enroll_student_in_course(student_id, course_id):
+                        university.join_waitlist(student_id, course_id)
+                elif op < 0.45:
+                    name = 'drop'
+                    university.drop_student_from_course(student_id, course_id)
+                elif op < 0.50:
+                    name = 'grade'
+                    university.assign_grade(student_id, course_id, rng.uniform(0.0, 4.0))
+                elif op < 0.55:
+                    name = 'remove_student'
+                    university.remove_student(student_id)
+                elif op < 0.57:
+                    name = 'remove_course'
+                    if university.remove_course(course_id):
+                        university.add_course(Course(course_id, f"Course {course_id}", 3,
+                                                     max_capacity=25))
+                else:
+                    name = 'read'
+                    university.find_student(student_id)
+                    university.search_students_by_name("stress")
+                    university.search_all("stress")
+                    university.students_in_any_course([course_id])
+                    university.get_university_stats()
+                local[name] = local.get(name, 0) + 1
+        except Exception as e:
+            errors.append(f"worker {index}: {e!r}")
+        with counts_lock:
+            for name, count in local.items():
+                counts[name] = counts.get(name, 0) + count
+    
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    
+    with university.read_locked() as snapshot:
+        problems = check_referential_consistency(snapshot)
+    
+    return {'operations': counts, 'errors': errors, 'problems': problems}
+
+def main():
+    """Run the stress test from the command line."""
+    parser = argparse.ArgumentParser(description="Thread-safety stress test for University")
+    parser.add_argument('--threads', type=int, default=16, help="Number of worker threads")
+    parser.add_argument('--operations', type=int, default=2000, help="Operations per thread")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    
+    result = run_stress_test(args.threads, args.operations, args.seed)
+    print(f"Operations: {result['operations']}")
+    for error in result['errors']:
+        print(f"⚠ {error}")
+    for problem in result['problems'][:20]:
+        print(f"⚠ {problem}")
+    
+    if result['errors'] or result['problems']:
+        print(f"✗ Stress test failed: {len(result['errors'])} error(s), "
+              f"{len(result['problems'])} consistency problem(s)")
+        raise SystemExit(1)
+    print("✓ Stress test passed: University is referentially consistent")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
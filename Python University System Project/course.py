@@ -2,12 +2,28 @@
 Course module for University Management System
 """
 
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional
+from waitlist import Waitlist
+from snapshot import freeze_record
+from idcodec import encode_id, to_bitmap
 
 class Course:
     """Represents a course in the university."""
     
-    def __init__(self, course_id: str, name: str, credit_hours: int):
+    _record: Optional[Mapping] = None  # Cached frozen record for snapshots
+    _record_waitlist_version = -1
+    _enrollment_bitmap: Optional[int] = None  # Cached bitmap of enrolled student IDs
+    _enrollment_size = -1  # Roster length the bitmap was built for
+    # Data file fields the class does not model (description, schedule, ...),
+    # kept so saving writes them back; replaced by from_dict, never changed in place
+    extra: Mapping = MappingProxyType({})
+    _FIELDS = frozenset(('course_id', 'name', 'credit_hours', 'assigned_faculty',
+                         'enrolled_students', 'max_capacity', 'waitlist_policy', 'waitlist',
+                         'current_enrollment'))  # Keys written by to_dict, or derived
+    
+    def __init__(self, course_id: str, name: str, credit_hours: int,
+                 max_capacity: int = 0, waitlist_policy: str = 'registration'):
         """
         Initialize a new Course.
         
@@ -15,6 +31,8 @@ class Course:
             course_id: Unique course identifier (format: CSE101)
             name: Course name
             credit_hours: Number of credit hours
+            max_capacity: Maximum number of enrolled students (0 = unlimited)
+            waitlist_policy: Waitlist ordering ('registration', 'seniority' or 'gpa')
         """
         if not self.is_valid_course_id(course_id):
             raise ValueError(f"Invalid course ID format: {course_id}")
@@ -22,11 +40,42 @@ class Course:
         if credit_hours <= 0:
             raise ValueError("Credit hours must be positive")
         
+        if max_capacity < 0:
+            raise ValueError("Capacity cannot be negative")
+        
         self.course_id = course_id
         self.name = name
         self.credit_hours = credit_hours
         self.assigned_faculty: str = ""  # Faculty ID
         self.enrolled_students: List[str] = []  # List of student IDs
+        self.max_capacity = max_capacity
+        self.waitlist = Waitlist(waitlist_policy)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any change to a public field invalidates the cached snapshot record
+        if not name.startswith('_'):
+            object.__setattr__(self, '_record', None)
+        # A replaced roster invalidates the enrollment bitmap
+        if name == 'enrolled_students':
+            object.__setattr__(self, '_enrollment_bitmap', None)
+    
+    def snapshot_record(self, store: bool = True) -> Mapping:
+        """
+        Get an immutable record of the course, cached until it or its waitlist changes.
+        
+        Args:
+            store: Cache a newly built record; pass False when reading from a
+                   thread other than the one changing the course
+        """
+        record = self._record
+        if record is None or self._record_waitlist_version != self.waitlist.version:
+            waitlist_version = self.waitlist.version
+            record = freeze_record(self.to_dict())
+            if store:
+                self._record = record
+                self._record_waitlist_version = waitlist_version
+        return record
     
     def assign_faculty(self, faculty_id: str) -> bool:
         """
@@ -49,12 +98,15 @@ class Course:
             student_id: Student identifier
             
         Returns:
-            True if enrolled successfully, False if already enrolled
+            True if enrolled successfully, False if already enrolled or full
         """
-        if student_id in self.enrolled_students:
+        if self.is_student_enrolled(student_id) or self.is_full():
             return False
         
+        bitmap = self.enrollment_bitmap
         self.enrolled_students.append(student_id)
+        self._set_bitmap(bitmap | to_bitmap((student_id,)))
+        self._record = None
         return True
     
     def remove_student(self, student_id: str) -> bool:
@@ -67,14 +119,46 @@ class Course:
         Returns:
             True if removed successfully, False if not enrolled
         """
-        if student_id in self.enrolled_students:
+        if self.is_student_enrolled(student_id):
+            bitmap = self.enrollment_bitmap
             self.enrolled_students.remove(student_id)
+            self._set_bitmap(bitmap & ~to_bitmap((student_id,)))
+            self._record = None
             return True
         return False
     
+    @property
+    def enrollment_bitmap(self) -> int:
+        """
+        Bitmap of the enrolled student IDs (see idcodec), built on first use.
+        
+        Rebuilt if the roster was replaced, or changed directly (detected by
+        a size mismatch).
+        """
+        if self._enrollment_bitmap is None or self._enrollment_size != len(self.enrolled_students):
+            self._set_bitmap(to_bitmap(self.enrolled_students))
+        return self._enrollment_bitmap
+    
+    def _set_bitmap(self, bitmap: int) -> None:
+        self._enrollment_bitmap = bitmap
+        self._enrollment_size = len(self.enrolled_students)
+    
     def is_student_enrolled(self, student_id: str) -> bool:
         """Check if a student is enrolled in the course."""
-        return student_id in self.enrolled_students
+        number = encode_id(student_id)
+        if number is None:
+            return student_id in self.enrolled_students
+        return bool(self.enrollment_bitmap >> number & 1)
+    
+    def is_full(self) -> bool:
+        """Check if the course has reached its capacity."""
+        return self.max_capacity > 0 and len(self.enrolled_students) >= self.max_capacity
+    
+    def available_seats(self) -> int:
+        """Get the number of open seats (-1 if capacity is unlimited)."""
+        if self.max_capacity == 0:
+            return -1
+        return max(0, self.max_capacity - len(self.enrolled_students))
     
     def get_info(self) -> Dict:
         """Get course information as dictionary."""
@@ -83,7 +167,10 @@ class Course:
             'name': self.name,
             'credit_hours': self.credit_hours,
             'assigned_faculty': self.assigned_faculty,
-            'enrolled_students': self.enrolled_students
+            'enrolled_students': self.enrolled_students,
+            'max_capacity': self.max_capacity,
+            'waitlist_policy': self.waitlist.policy,
+            'waitlist': self.waitlist.to_list()
         }
     
     def display_info(self) -> None:
@@ -96,6 +183,8 @@ class Course:
         print(f"Credit Hours: {self.credit_hours}")
         print(f"Assigned Faculty: {self.assigned_faculty if self.assigned_faculty else 'Not assigned'}")
         print(f"Enrolled Students: {len(self.enrolled_students)}")
+        print(f"Capacity: {self.max_capacity if self.max_capacity else 'Unlimited'}")
+        print(f"Waitlisted Students: {len(self.waitlist)}")
         
         if self.enrolled_students:
             print("Enrolled Students:")
@@ -119,7 +208,9 @@ class Course:
     
     def to_dict(self) -> Dict:
         """Convert course to dictionary for serialization."""
-        return self.get_info()
+        # current_enrollment is derived, but the data file has always carried it
+        return {**self.get_info(), 'current_enrollment': len(self.enrolled_students),
+                **self.extra}
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Course':
@@ -127,8 +218,14 @@ class Course:
         course = cls(
             data['course_id'],
             data['name'],
-            data['credit_hours']
+            data['credit_hours'],
+            data.get('max_capacity', 0)
         )
         course.assigned_faculty = data['assigned_faculty']
         course.enrolled_students = data['enrolled_students']
+        course.waitlist = Waitlist.from_list(data.get('waitlist', []),
+                                             data.get('waitlist_policy', 'registration'))
+        extra = {k: v for k, v in data.items() if k not in cls._FIELDS}
+        if extra:
+            course.extra = extra
         return course
\ No newline at end of file
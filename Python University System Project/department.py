@@ -2,11 +2,19 @@
 Department module for University Management System
 """
 
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional
+from snapshot import freeze_record
 
 class Department:
     """Represents a department in the university."""
     
+    _record: Optional[Mapping] = None  # Cached frozen record for snapshots
+    # Data file fields the class does not model (additional_info), kept
+    # so saving writes them back; replaced by from_dict, never changed in place
+    extra: Mapping = MappingProxyType({})
+    _FIELDS = frozenset(('department_id', 'name', 'head_of_department', 'courses_offered'))  # Keys written by to_dict
+    
     def __init__(self, department_id: str, name: str):
         """
         Initialize a new Department.
@@ -23,6 +31,27 @@ class Department:
         self.head_of_department: str = ""  # Faculty ID
         self.courses_offered: List[str] = []  # List of course IDs
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any change to a public field invalidates the cached snapshot record
+        if not name.startswith('_'):
+            object.__setattr__(self, '_record', None)
+    
+    def snapshot_record(self, store: bool = True) -> Mapping:
+        """
+        Get an immutable record of the department, cached until it changes.
+        
+        Args:
+            store: Cache a newly built record; pass False when reading from a
+                   thread other than the one changing the department
+        """
+        record = self._record
+        if record is None:
+            record = freeze_record(self.to_dict())
+            if store:
+                self._record = record
+        return record
+    
     def set_head_of_department(self, faculty_id: str) -> bool:
         """
         Set head of department.
@@ -50,6 +79,7 @@ class Department:
             return False
         
         self.courses_offered.append(course_id)
+        self._record = None
         return True
     
     def remove_course(self, course_id: str) -> bool:
@@ -64,6 +94,7 @@ class Department:
         """
         if course_id in self.courses_offered:
             self.courses_offered.remove(course_id)
+            self._record = None
             return True
         return False
     
@@ -108,7 +139,7 @@ class Department:
     
     def to_dict(self) -> Dict:
         """Convert department to dictionary for serialization."""
-        return self.get_info()
+        return {**self.get_info(), **self.extra}
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Department':
@@ -119,4 +150,7 @@ class Department:
         )
         department.head_of_department = data['head_of_department']
         department.courses_offered = data['courses_offered']
+        extra = {k: v for k, v in data.items() if k not in cls._FIELDS}
+        if extra:
+            department.extra = extra
         return department
\ No newline at end of file
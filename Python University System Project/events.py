@@ -0,0 +1,153 @@
+"""
+Events module for University Management System
+
+Change-data capture for a University: every mutation publishes a typed
+ChangeEvent with a monotonically increasing sequence number. Subscribers
+are called synchronously, and a bounded replay buffer lets a consumer
+catch up with everything since the last sequence number it saw instead of
+reloading all data.
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+class ChangeEvent:
+    """A single change made to a University."""
+    
+    __slots__ = ('sequence', 'kind', 'collection', 'entity_id', 'data', 'timestamp')
+    
+    # Event kinds
+    ENTITY_ADDED = 'entity_added'
+    ENTITY_REMOVED = 'entity_removed'
+    ENTITY_UPDATED = 'entity_updated'
+    ENROLLED = 'enrolled'
+    DROPPED = 'dropped'
+    WAITLISTED = 'waitlisted'
+    GRADE_ASSIGNED = 'grade_assigned'
+    FACULTY_ASSIGNED = 'faculty_assigned'
+    CAPACITY_CHANGED = 'capacity_changed'
+    RELOADED = 'reloaded'  # Bulk change; consumers must resynchronize everything
+    
+    KINDS = (ENTITY_ADDED, ENTITY_REMOVED, ENTITY_UPDATED, ENROLLED, DROPPED, WAITLISTED,
+             GRADE_ASSIGNED, FACULTY_ASSIGNED, CAPACITY_CHANGED, RELOADED)
+    
+    def __init__(self, sequence: int, kind: str, collection: str = "",
+                 entity_id: str = "", data: Optional[Dict] = None):
+        """
+        Initialize an event.
+        
+        Args:
+            sequence: Position of the event in the stream (starts at 1)
+            kind: One of ChangeEvent.KINDS
+            collection: Collection of the changed entity ('students', ...)
+            entity_id: ID of the changed entity
+            data: Kind-specific details, e.g. the updated fields or the
+                  course of an enrollment
+        """
+        self.sequence = sequence
+        self.kind = kind
+        self.collection = collection
+        self.entity_id = entity_id
+        self.data = data or {}
+        self.timestamp = time.time()
+    
+    def __repr__(self) -> str:
+        return f"ChangeEvent({self.sequence}, {self.kind!r}, {self.collection!r}, {self.entity_id!r})"
+    
+    def to_dict(self) -> Dict:
+        """Convert the event to a dictionary for serialization."""
+        return {
+            'sequence': self.sequence,
+            'kind': self.kind,
+            'collection': self.collection,
+            'entity_id': self.entity_id,
+            'data': self.data,
+            'timestamp': self.timestamp
+        }
+
+class EventBus:
+    """Publishes ChangeEvents to subscribers and keeps the latest for replay."""
+    
+    DEFAULT_CAPACITY = 10000  # Events kept for replay
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize an empty event bus.
+        
+        Args:
+            capacity: Number of most recent events kept in the replay buffer
+        """
+        self.sequence = 0  # Sequence number of the last published event
+        self.stream_id = uuid.uuid4().hex  # Sequence numbers are only comparable within a stream
+        self._buffer: deque = deque(maxlen=capacity)
+        self._subscribers: Dict[int, tuple] = {}  # token -> (callback, kinds)
+        self._next_token = 0
+        self._lock = threading.Lock()
+    
+    def publish(self, kind: str, collection: str = "", entity_id: str = "",
+                **data) -> ChangeEvent:
+        """
+        Publish an event and notify the subscribers interested in its kind.
+        
+        A failing subscriber is reported and does not stop the others.
+        
+        Returns:
+            The published event
+        """
+        with self._lock:
+            self.sequence += 1
+            event = ChangeEvent(self.sequence, kind, collection, entity_id, data)
+            self._buffer.append(event)
+            subscribers = list(self._subscribers.values()) if self._subscribers else ()
+        
+        for callback, kinds in subscribers:
+            if kinds is None or kind in kinds:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"⚠ Event subscriber failed on {event}: {e}")
+        return event
+    
+    def subscribe(self, callback: Callable[[ChangeEvent], None],
+                  kinds: Optional[List[str]] = None) -> int:
+        """
+        Register a callback for future events.
+        
+        Args:
+            callback: Called with each event, on the thread that made the change
+            kinds: Event kinds to receive (default all)
+            
+        Returns:
+            Token to pass to unsubscribe()
+        """
+        with self._lock:
+            self._next_token += 1
+            self._subscribers[self._next_token] = (callback, frozenset(kinds) if kinds else None)
+            return self._next_token
+    
+    def unsubscribe(self, token: int) -> bool:
+        """Remove a subscription; returns False if the token is unknown."""
+        with self._lock:
+            return self._subscribers.pop(token, None) is not None
+    
+    def since(self, sequence: int) -> Optional[List[ChangeEvent]]:
+        """
+        Get every event published after a sequence number.
+        
+        Args:
+            sequence: Last sequence number the consumer has seen (0 for none)
+            
+        Returns:
+            Events in sequence order, or None if some of them have already
+            left the replay buffer and the consumer must reload everything
+        """
+        with self._lock:
+            if sequence >= self.sequence:
+                return []
+            oldest = self._buffer[0].sequence if self._buffer else self.sequence + 1
+            if sequence + 1 < oldest:
+                return None
+            return list(self._buffer)[sequence + 1 - oldest:]
\ No newline at end of file
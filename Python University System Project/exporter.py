@@ -0,0 +1,240 @@
+"""
+Exporter module for University Management System
+
+Exports data for the web frontend in the sheet layout its import expects
+(one CSV per sheet: Students, Faculty, Courses, Departments, University).
+A full export streams every row; a delta export writes only the rows that
+changed since the previous export, plus a Deleted sheet listing removed
+IDs. Each export records a per-row version stamp (a hash of the row) in
+the export directory, which the next delta is compared against. When the
+same University object made the previous export, its change events are
+used to find the changed rows without rebuilding every row.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from university import University
+from events import ChangeEvent
+
+STATE_FILE = ".export_state.json"
+DELETED_SHEET = 'Deleted'
+
+# Sheet -> (University collection, ID attribute, header row)
+SHEETS = {
+    'Students': ('students', 'student_id',
+                 ['ID', 'Name', 'Age', 'Gender', 'Department', 'Courses', 'Grades']),
+    'Faculty': ('faculty', 'faculty_id', ['ID', 'Name', 'Department', 'Courses Taught']),
+    'Courses': ('courses', 'course_id', ['ID', 'Name', 'Credit Hours', 'Faculty', 'Students']),
+    'Departments': ('departments', 'department_id', ['ID', 'Name', 'Head', 'Courses'])
+}
+UNIVERSITY_HEADER = ['Name', 'Address']
+COLLECTION_SHEETS = {collection: sheet for sheet, (collection, _, _) in SHEETS.items()}
+
+def sheet_row(sheet: str, entity) -> List:
+    """Build the frontend row of an entity; lists are joined with commas."""
+    if sheet == 'Students':
+        return [entity.student_id, entity.name, entity.age, entity.gender, entity.department,
+                ",".join(entity.course_grades), json.dumps(entity.course_grades)]
+    if sheet == 'Faculty':
+        return [entity.faculty_id, entity.name, entity.department, ",".join(entity.courses_taught)]
+    if sheet == 'Courses':
+        return [entity.course_id, entity.name, entity.credit_hours, entity.assigned_faculty,
+                ",".join(entity.enrolled_students)]
+    return [entity.department_id, entity.name, entity.head_of_department,
+            ",".join(entity.courses_offered)]
+
+def row_stamp(row: List) -> str:
+    """Version stamp of a row: a short hash of its values."""
+    return hashlib.blake2b(json.dumps(row).encode(), digest_size=8).hexdigest()
+
+class _SheetWriter:
+    """Streams rows to a CSV file that replaces the target only when closed."""
+    
+    def __init__(self, path: str, header: List[str]):
+        self.path = path
+        self.temp_path = f"{path}.{os.getpid()}.tmp"
+        self._f = open(self.temp_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(header)
+        self.rows = 0
+    
+    def write(self, row: List) -> None:
+        self._writer.writerow(row)
+        self.rows += 1
+    
+    def close(self) -> None:
+        self._f.close()
+        os.replace(self.temp_path, self.path)
+    
+    def discard(self) -> None:
+        self._f.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+class FrontendExporter:
+    """Full and incremental exports of one University for the frontend."""
+    
+    def __init__(self, university: University, directory: str):
+        """
+        Initialize the exporter.
+        
+        Args:
+            university: University object to export
+            directory: Export directory; full exports are written into it
+                       and each delta into a numbered subdirectory
+        """
+        self.university = university
+        self.directory = directory
+        self.state_path = os.path.join(directory, STATE_FILE)
+    
+    def _read_state(self) -> Optional[Dict]:
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_state(self, stamps: Dict[str, Dict[str, str]], export_number: int,
+                     sequence: int) -> None:
+        state = {'export': export_number, 'stream': self.university.events.stream_id,
+                 'sequence': sequence, 'stamps': stamps}
+        temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+    
+    def export_full(self) -> Dict:
+        """
+        Stream every row into one CSV per sheet.
+        
+        Returns:
+            Summary with the export number and the rows written per sheet
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        state = self._read_state()
+        # Read the sequence before the rows, so changes made while exporting are
+        # picked up by the next delta rather than lost
+        sequence = self.university.events.sequence
+        stamps: Dict[str, Dict[str, str]] = {}
+        rows: Dict[str, int] = {}
+        
+        for sheet, header, entries in self._sheets():
+            writer = _SheetWriter(os.path.join(self.directory, f"{sheet}.csv"), header)
+            sheet_stamps = stamps[sheet] = {}
+            try:
+                for entity_id, row in entries:
+                    writer.write(row)
+                    sheet_stamps[entity_id] = row_stamp(row)
+            except BaseException:
+                writer.discard()
+                raise
+            writer.close()
+            rows[sheet] = writer.rows
+        
+        export_number = (state['export'] if state else 0) + 1
+        self._write_state(stamps, export_number, sequence)
+        return {'export': export_number, 'full': True, 'directory': self.directory, 'rows': rows}
+    
+    def export_delta(self) -> Dict:
+        """
+        Write the rows changed since the previous export.
+        
+        Falls back to a full export if there is no previous export.
+        
+        Returns:
+            Summary with the export number, the output directory, the rows
+            written per sheet and whether change events were used
+        """
+        state = self._read_state()
+        if state is None:
+            return self.export_full()
+        
+        sequence = self.university.events.sequence
+        stamps = state['stamps']
+        dirty = self._dirty_from_events(state)
+        export_number = state['export'] + 1
+        output = os.path.join(self.directory, f"delta-{export_number:04d}")
+        os.makedirs(output, exist_ok=True)
+        
+        rows: Dict[str, int] = {}
+        deleted: List[Tuple[str, str]] = []
+        for sheet, header, entries in self._sheets(dirty):
+            writer = _SheetWriter(os.path.join(output, f"{sheet}.csv"), header)
+            previous = stamps.setdefault(sheet, {})
+            current: Set[str] = set()
+            try:
+                for entity_id, row in entries:
+                    current.add(entity_id)
+                    stamp = row_stamp(row)
+                    if previous.get(entity_id) != stamp:
+                        writer.write(row)
+                        previous[entity_id] = stamp
+            except BaseException:
+                writer.discard()
+                raise
+            writer.close()
+            rows[sheet] = writer.rows
+            
+            # Rows not produced any more were deleted; with events only the
+            # dirty IDs were produced, so only those can have disappeared
+            candidates = previous if dirty is None else dirty.get(sheet, ())
+            for entity_id in [i for i in candidates if i in previous and i not in current]:
+                del previous[entity_id]
+                deleted.append((sheet, entity_id))
+        
+        writer = _SheetWriter(os.path.join(output, f"{DELETED_SHEET}.csv"), ['Sheet', 'ID'])
+        for entry in deleted:
+            writer.write(list(entry))
+        writer.close()
+        rows[DELETED_SHEET] = writer.rows
+        
+        self._write_state(stamps, export_number, sequence)
+        return {'export': export_number, 'full': False, 'directory': output, 'rows': rows,
+                'used_events': dirty is not None}
+    
+    def _sheets(self, dirty: Optional[Dict[str, Set[str]]] = None
+                ) -> Iterator[Tuple[str, List[str], Iterator[Tuple[str, List]]]]:
+        """Yield (sheet, header, (ID, row) iterator), limited to dirty IDs if given."""
+        university = self.university
+        for sheet, (collection, key, header) in SHEETS.items():
+            if dirty is None:
+                entities = getattr(university, collection)
+            else:
+                index = university._id_index(collection, key)
+                entities = [index[i] for i in sorted(dirty.get(sheet, ())) if i in index]
+            yield sheet, header, ((getattr(e, key), sheet_row(sheet, e)) for e in entities)
+        yield 'University', UNIVERSITY_HEADER, iter([('', [university.name, university.address])])
+    
+    def _dirty_from_events(self, state: Dict) -> Optional[Dict[str, Set[str]]]:
+        """
+        Collect the rows touched since the previous export from change events.
+        
+        Returns:
+            Sheet -> IDs of rows that may have changed, or None if the events
+            are not available and every row must be compared
+        """
+        events = self.university.events
+        if state.get('stream') != events.stream_id:
+            return None
+        changes = events.since(state.get('sequence', 0))
+        if changes is None:
+            return None
+        
+        dirty: Dict[str, Set[str]] = {sheet: set() for sheet in SHEETS}
+        for event in changes:
+            if event.kind == ChangeEvent.RELOADED:
+                return None
+            sheet = COLLECTION_SHEETS.get(event.collection)
+            if sheet:
+                dirty[sheet].add(event.entity_id)
+            # Related rows whose list columns may have changed
+            if 'course_id' in event.data:
+                dirty['Courses'].add(event.data['course_id'])
+            if 'faculty_id' in event.data:
+                dirty['Faculty'].add(event.data['faculty_id'])
+            for collection, sheet in COLLECTION_SHEETS.items():
+                dirty[sheet].update(event.data.get(collection, ()))
+        return dirty
\ No newline at end of file
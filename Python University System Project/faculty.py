@@ -2,11 +2,19 @@
 Faculty module for University Management System
 """
 
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional
+from snapshot import freeze_record
 
 class Faculty:
     """Represents a faculty member in the university."""
     
+    _record: Optional[Mapping] = None  # Cached frozen record for snapshots
+    # Data file fields the class does not model (position, office, ...), kept
+    # so saving writes them back; replaced by from_dict, never changed in place
+    extra: Mapping = MappingProxyType({})
+    _FIELDS = frozenset(('faculty_id', 'name', 'department', 'courses_taught'))  # Keys written by to_dict
+    
     def __init__(self, faculty_id: str, name: str, department: str):
         """
         Initialize a new Faculty member.
@@ -24,6 +32,27 @@ class Faculty:
         self.department = department
         self.courses_taught: List[str] = []  # List of course IDs
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any change to a public field invalidates the cached snapshot record
+        if not name.startswith('_'):
+            object.__setattr__(self, '_record', None)
+    
+    def snapshot_record(self, store: bool = True) -> Mapping:
+        """
+        Get an immutable record of the faculty member, cached until it changes.
+        
+        Args:
+            store: Cache a newly built record; pass False when reading from a
+                   thread other than the one changing the faculty member
+        """
+        record = self._record
+        if record is None:
+            record = freeze_record(self.to_dict())
+            if store:
+                self._record = record
+        return record
+    
     def assign_course(self, course_id: str) -> bool:
         """
         Assign a course to faculty.
@@ -38,6 +67,7 @@ class Faculty:
             return False
         
         self.courses_taught.append(course_id)
+        self._record = None
         return True
     
     def remove_course(self, course_id: str) -> bool:
@@ -52,6 +82,7 @@ class Faculty:
         """
         if course_id in self.courses_taught:
             self.courses_taught.remove(course_id)
+            self._record = None
             return True
         return False
     
@@ -98,7 +129,7 @@ class Faculty:
     
     def to_dict(self) -> Dict:
         """Convert faculty to dictionary for serialization."""
-        return self.get_info()
+        return {**self.get_info(), **self.extra}
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Faculty':
@@ -109,4 +140,7 @@ class Faculty:
             data['department']
         )
         faculty.courses_taught = data['courses_taught']
+        extra = {k: v for k, v in data.items() if k not in cls._FIELDS}
+        if extra:
+            faculty.extra = extra
         return faculty
\ No newline at end of file
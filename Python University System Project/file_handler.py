@@ -2,10 +2,69 @@
 File Handler module for University Management System
 """
 
+import gc
+import hashlib
+import hmac
 import json
+import operator
 import os
-from typing import Dict
+import pickle
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 from university import University
+from student import Student
+from faculty import Faculty
+from course import Course
+from department import Department
+from snapshot import UniversitySnapshot, freeze_record, thaw_record, unfreeze_record
+from file_lock import FileLock
+from integrity import check_integrity
+from events import ChangeEvent
+from compression import (MAGIC_LENGTH, check_codec, compressed_writer, decompress,
+                         detect_codec, open_text)
+
+class SaveConflictError(Exception):
+    """Raised when another process changed the same records since our last load."""
+    
+    def __init__(self, conflicts: List[str]):
+        super().__init__(f"{len(conflicts)} conflicting change(s): {', '.join(conflicts[:10])}")
+        self.conflicts = conflicts
+
+class _HashingWriter:
+    """File wrapper that hashes written text and holds back the closing brace."""
+    
+    HOLD_BACK = 2  # json.dump(indent=2) of a dict always ends with "\n}"
+    
+    def __init__(self, f=None):
+        """
+        Initialize the writer.
+        
+        Args:
+            f: Text file to write to, or None to only hash
+        """
+        self._f = f
+        self._hash = hashlib.sha256()
+        self._pending = ""
+    
+    def write(self, text: str) -> None:
+        text = self._pending + text
+        self._pending = text[-self.HOLD_BACK:]
+        emitted = text[:-self.HOLD_BACK]
+        if emitted:
+            self._hash.update(emitted.encode('utf-8'))
+            if self._f is not None:
+                self._f.write(emitted)
+    
+    def close_object(self, meta: Dict) -> str:
+        """Append the _meta entry, close the JSON object and return the content hash."""
+        if self._pending != "\n}":
+            raise ValueError("Unexpected end of JSON document")
+        content_hash = self._hash.hexdigest()
+        meta['content_hash'] = content_hash
+        if self._f is not None:
+            self._f.write(',\n  "_meta": ' + json.dumps(meta) + "\n}")
+        return content_hash
 
 class FileHandler:
     """Handles file operations for the University Management System."""
@@ -16,6 +75,36 @@ class FileHandler:
     COURSES_FILE = os.path.join(DATA_DIR, "courses.json")
     DEPARTMENTS_FILE = os.path.join(DATA_DIR, "departments.json")
     UNIVERSITY_FILE = os.path.join(DATA_DIR, "university.json")
+    CACHE_FILE = os.path.join(DATA_DIR, "university.cache.pickle")
+    CACHE_FORMAT = 3  # Bump when entity classes change shape
+    # Per-user secret signing the cache, so a cache written by anyone else
+    # into the shared data directory is never unpickled
+    CACHE_KEY_FILE = os.path.join(os.path.expanduser("~"), ".university_cache_key")
+    
+    COLLECTIONS = (('departments', 'department_id'), ('students', 'student_id'),
+                   ('faculty', 'faculty_id'), ('courses', 'course_id'))
+    
+    # State of the data file as last seen by this process
+    _known_version = 0
+    _known_stat: Optional[Tuple[int, int]] = None  # (mtime_ns, size)
+    _known_hash = ""
+    _base_snapshot: Optional[UniversitySnapshot] = None  # File content at last load/save
+    _state_lock = threading.Lock()
+    
+    last_load_timings: Dict[str, float] = {}  # Phase -> seconds for the last load
+    # Messages of quiet loads, shown by the caller when convenient (e.g. once
+    # the menu uses the data instead of in the middle of its prompt)
+    pending_load_messages: List[str] = []
+    last_save_skipped = False  # The last save found the data unchanged and wrote nothing
+    
+    # Codec of saved data files: 'none' (plain JSON), 'gzip', 'bz2' or 'lzma';
+    # None keeps the codec of the loaded file. Files of any codec are loaded.
+    COMPRESSION: Optional[str] = None
+    COMPRESSION_LEVEL: Optional[int] = None  # Codec default if None
+    loaded_codec: Optional[str] = None  # Codec of the data file when last loaded or saved
+    
+    INTEGRITY_ON_LOAD = 'report'  # 'off', 'report' or 'repair'
+    last_integrity_issues: List[Dict] = []  # Problems found by the last load
     
     @staticmethod
     def ensure_data_dir() -> None:
@@ -23,35 +112,272 @@ class FileHandler:
         if not os.path.exists(FileHandler.DATA_DIR):
             os.makedirs(FileHandler.DATA_DIR)
     
+    @staticmethod
+    def lock_file() -> str:
+        """Path of the advisory lock file guarding the data file."""
+        return FileHandler.UNIVERSITY_FILE + ".lock"
+    
     @staticmethod
     def save_all_data(university: University) -> None:
         """
         Save all university data to files.
         
+        If another process saved since our last load, non-overlapping
+        changes are merged and the university is reloaded with the merged
+        data; overlapping changes raise SaveConflictError.
+        
         Args:
             university: University object
         """
+        merged = FileHandler.save_snapshot(university.snapshot())
+        if merged is not None:
+            university.load_all_data(unfreeze_record(merged))
+            with FileHandler._state_lock:
+                FileHandler._base_snapshot = university.snapshot()
+    
+    @staticmethod
+    def save_snapshot(snapshot: UniversitySnapshot, verbose: bool = True,
+                      merge: bool = True) -> Optional[Dict]:
+        """
+        Save a university snapshot to file under an exclusive file lock.
+        
+        The file is compressed while it is written (see FileHandler.COMPRESSION).
+        Nothing is written if the snapshot has the same content as the file
+        as we last loaded or saved it; FileHandler.last_save_skipped tells
+        whether the last save was skipped.
+        
+        Args:
+            snapshot: Immutable UniversitySnapshot to write
+            verbose: Print status and error messages
+            merge: Merge with changes saved by another process; if False,
+                   such changes make the save fail instead
+                   
+        Returns:
+            The merged data if the file had been changed by another process
+            and was merged with ours, otherwise None
+            
+        Raises:
+            SaveConflictError: If both sides changed the same record
+                differently, or merge is False and another process changed
+                the file
+        """
         FileHandler.ensure_data_dir()
         
         try:
-            # Save all data in one file
-            all_data = university.get_all_data()
-            
-            with open(FileHandler.UNIVERSITY_FILE, 'w') as f:
-                json.dump(all_data, f, indent=2)
+            with FileLock(FileHandler.lock_file()), FileHandler._state_lock:
+                disk_version, disk_data = FileHandler._read_changed_file()
+                merged = None
+                
+                if disk_data is not None and disk_version != FileHandler._known_version:
+                    if not merge:
+                        raise SaveConflictError([f"{FileHandler.UNIVERSITY_FILE} (version {disk_version})"])
+                    merged = FileHandler._merge(FileHandler._base_snapshot, disk_data, snapshot)
+                    all_data = merged
+                else:
+                    all_data = snapshot.get_all_data()
+                    # Skipped only while the file is exactly as we last saw it
+                    FileHandler.last_save_skipped = (
+                        disk_data is None and disk_version == FileHandler._known_version and
+                        FileHandler._unchanged(snapshot, all_data))
+                    if FileHandler.last_save_skipped:
+                        if verbose:
+                            print(f"✓ No changes to save to {FileHandler.UNIVERSITY_FILE}")
+                        return None
+                
+                FileHandler.last_save_skipped = False
+                version = max(disk_version, FileHandler._known_version) + 1
+                FileHandler._write_data_file(all_data, version)
+                FileHandler._base_snapshot = snapshot if merged is None else UniversitySnapshot(
+                    version, merged['name'], merged['address'],
+                    *(tuple(merged[name]) for name, _ in FileHandler.COLLECTIONS))
             
-            print(f"✓ Data saved to {FileHandler.UNIVERSITY_FILE}")
+            if verbose:
+                if merged is not None:
+                    print(f"✓ Merged changes saved by another process (version {version})")
+                print(f"✓ Data saved to {FileHandler.UNIVERSITY_FILE}")
+            return merged
+        except SaveConflictError as e:
+            if verbose:
+                print(f"⚠ Save rejected, data file was changed by another process: {e}")
+            raise
         except Exception as e:
-            print(f"⚠ Error saving data: {e}")
+            if verbose:
+                print(f"⚠ Error saving data: {e}")
             raise
     
     @staticmethod
-    def load_all_data(university: University) -> None:
+    def _unchanged(snapshot: UniversitySnapshot, all_data: Dict) -> bool:
+        """
+        True if a snapshot has the content of the data file as we last
+        loaded or saved it. Must be called with the state lock held.
+        
+        Snapshots share the records of unchanged entities, so the records
+        are compared by identity first; only if that fails is the snapshot
+        serialized (without writing) and its hash compared.
+        """
+        if not FileHandler._known_hash or FileHandler.codec_changed():
+            return False
+        base = FileHandler._base_snapshot
+        if (base is not None and base.name == snapshot.name and base.address == snapshot.address and
+                all(len(getattr(base, name)) == len(getattr(snapshot, name)) and
+                    all(map(operator.is_, getattr(base, name), getattr(snapshot, name)))
+                    for name, _ in FileHandler.COLLECTIONS)):
+            return True
+        return FileHandler._content_hash(all_data) == FileHandler._known_hash
+    
+    @staticmethod
+    def _content_hash(all_data: Dict) -> str:
+        """Content hash the data would be saved with (see _HashingWriter)."""
+        writer = _HashingWriter()
+        json.dump(all_data, writer, indent=2, default=thaw_record)
+        return writer.close_object({})
+    
+    @staticmethod
+    def save_conflict_copy(university: University) -> str:
+        """
+        Write the university to a timestamped side file without touching the
+        shared data file, so work is not lost after a rejected save.
+        
+        Returns:
+            Path of the written file
+        """
+        FileHandler.ensure_data_dir()
+        base, ext = os.path.splitext(FileHandler.UNIVERSITY_FILE)
+        path = f"{base}.conflict-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}{ext}"
+        with open(path, 'w') as f:
+            json.dump(university.snapshot().get_all_data(), f, indent=2, default=thaw_record)
+        return path
+    
+    @staticmethod
+    def _write_data_file(all_data: Dict, version: int) -> None:
+        """
+        Atomically replace the data file, stamping it with a version and a
+        content hash. Must be called with the file lock held.
+        """
+        path = FileHandler.UNIVERSITY_FILE
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        meta = {'version': version, 'saved_at': time.time(), 'saved_by': os.getpid()}
+        codec = FileHandler.save_codec()
+        
+        try:
+            # Compressed as it is serialized; the content hash covers the JSON
+            # text, so it does not depend on the codec
+            with open(temp_path, 'wb') as f:
+                with compressed_writer(f, codec, FileHandler.COMPRESSION_LEVEL) as text:
+                    writer = _HashingWriter(text)
+                    json.dump(all_data, writer, indent=2, default=thaw_record)
+                    content_hash = writer.close_object(meta)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        stat = os.stat(path)
+        FileHandler._known_version = version
+        FileHandler._known_stat = (stat.st_mtime_ns, stat.st_size)
+        FileHandler._known_hash = content_hash
+        FileHandler.loaded_codec = codec
+    
+    @staticmethod
+    def _read_changed_file() -> Tuple[int, Optional[Dict]]:
+        """
+        Read the data file only if it changed since we last saw it.
+        
+        Returns:
+            Tuple of (file version, parsed data or None if unchanged/missing)
+        """
+        try:
+            stat = os.stat(FileHandler.UNIVERSITY_FILE)
+        except FileNotFoundError:
+            return 0, None
+        
+        if (stat.st_mtime_ns, stat.st_size) == FileHandler._known_stat:
+            return FileHandler._known_version, None
+        
+        with open_text(FileHandler.UNIVERSITY_FILE) as f:
+            data = json.load(f)
+        return data.get('_meta', {}).get('version', 0), data
+    
+    @staticmethod
+    def _merge(base: Optional[UniversitySnapshot], theirs: Dict,
+               ours: UniversitySnapshot) -> Dict:
+        """
+        Three-way merge of whole records keyed by entity ID.
+        
+        A record changed (or deleted) on only one side takes that side's
+        version; a record changed differently on both sides is a conflict.
+        """
+        conflicts: List[str] = []
+        
+        def pick(base_value, their_value, our_value, label):
+            if our_value is base_value or our_value == base_value:
+                return their_value
+            if their_value == base_value or their_value == our_value:
+                return our_value
+            conflicts.append(label)
+            return our_value
+        
+        merged = {
+            'name': pick(base.name if base else None, theirs.get('name'), ours.name, 'name'),
+            'address': pick(base.address if base else None, theirs.get('address'),
+                            ours.address, 'address')
+        }
+        
+        for collection, key in FileHandler.COLLECTIONS:
+            base_records = {r[key]: r for r in getattr(base, collection)} if base else {}
+            their_records = {r[key]: freeze_record(r) for r in theirs.get(collection, [])}
+            our_records = {r[key]: r for r in getattr(ours, collection)}
+            
+            records = []
+            for entity_id in list(their_records) + [i for i in our_records if i not in their_records]:
+                record = pick(base_records.get(entity_id), their_records.get(entity_id),
+                              our_records.get(entity_id), f"{collection}/{entity_id}")
+                if record is not None:
+                    records.append(record)
+            merged[collection] = records
+        
+        if conflicts:
+            raise SaveConflictError(conflicts)
+        return merged
+    
+    @staticmethod
+    def save_in_background(university: University) -> threading.Thread:
+        """
+        Snapshot the university and save it on a background thread.
+        
+        Only taking the snapshot happens on the caller's thread; the
+        university can be modified while the file is being written.
+        
+        Args:
+            university: University object
+            
+        Returns:
+            The started saver thread (join it to wait for completion)
+        """
+        snapshot = university.snapshot()
+        saver = threading.Thread(target=FileHandler.save_snapshot, args=(snapshot,),
+                                 name="university-saver", daemon=False)
+        saver.start()
+        return saver
+    
+    @staticmethod
+    def load_all_data(university: University, verbose: bool = True) -> None:
         """
         Load all university data from files.
         
+        The file may be plain or compressed JSON; the codec is detected
+        from its first bytes. A warm-start cache of the object graph is used
+        instead of parsing the file when it matches the file's size, mtime
+        and hash, and is rebuilt after loading otherwise. Parse and object-construction
+        times of the last load are kept in FileHandler.last_load_timings.
+        
         Args:
             university: University object to load data into
+            verbose: Print the outcome of the load; when False, messages
+                     about missing or unreadable files are kept in
+                     FileHandler.pending_load_messages instead
         """
         if not os.path.exists(FileHandler.UNIVERSITY_FILE):
             # Try loading from individual files (backward compatibility)
@@ -60,51 +386,280 @@ class FileHandler:
                 os.path.exists(FileHandler.COURSES_FILE) and
                 os.path.exists(FileHandler.DEPARTMENTS_FILE)):
                 
-                FileHandler._load_legacy_data(university)
+                FileHandler._load_legacy_data(university, verbose)
                 return
         
         try:
-            with open(FileHandler.UNIVERSITY_FILE, 'r') as f:
-                all_data = json.load(f)
+            FileHandler.ensure_data_dir()
+            started = time.perf_counter()
+            with FileLock(FileHandler.lock_file(), shared=True):
+                stat = os.stat(FileHandler.UNIVERSITY_FILE)
+                with open(FileHandler.UNIVERSITY_FILE, 'rb') as f:
+                    raw = f.read()
+            key = (FileHandler.CACHE_FORMAT, stat.st_size, stat.st_mtime_ns,
+                   hashlib.sha256(raw).hexdigest())
             
-            university.load_all_data(all_data)
-            print(f"✓ Data loaded from {FileHandler.UNIVERSITY_FILE}")
+            # Building the object graph allocates many containers; pausing
+            # the cyclic garbage collector keeps it from rescanning them
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                cached = FileHandler._read_cache(key)
+                if cached is not None:
+                    parsed = time.perf_counter()
+                    all_data = {'_meta': cached['meta']}
+                    with university.lock:
+                        university.name, university.address = cached['name'], cached['address']
+                        university.clear()
+                        for collection, _ in FileHandler.COLLECTIONS:
+                            getattr(university, collection).extend(cached[collection])
+                        university.events.publish(ChangeEvent.RELOADED)
+                else:
+                    all_data = json.loads(decompress(raw))
+                    parsed = time.perf_counter()
+                    university.load_all_data(all_data)
+                    FileHandler._write_cache(key, university, all_data.get('_meta', {}))
+                
+                FileHandler._remember_loaded(university, all_data, stat)
+                FileHandler.loaded_codec = detect_codec(raw[:MAGIC_LENGTH])
+                # Checked after the file state is recorded, so repairs count
+                # as our own unsaved changes
+                FileHandler.last_integrity_issues = []
+                if FileHandler.INTEGRITY_ON_LOAD != 'off':
+                    FileHandler.last_integrity_issues = check_integrity(
+                        university, repair=FileHandler.INTEGRITY_ON_LOAD == 'repair')
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            
+            FileHandler.last_load_timings = {'parse': parsed - started,
+                                             'construct': time.perf_counter() - parsed,
+                                             'cache_hit': cached is not None}
+            if verbose:
+                print(f"✓ Data loaded from {FileHandler.UNIVERSITY_FILE}")
+                summary = FileHandler.integrity_summary()
+                if summary:
+                    print(summary)
         except FileNotFoundError:
-            print("ℹ No data file found. Starting fresh.")
+            FileHandler._load_message("ℹ No data file found. Starting fresh.", verbose)
         except json.JSONDecodeError as e:
-            print(f"⚠ Error reading data file: {e}")
+            FileHandler._load_message(f"⚠ Error reading data file: {e}", verbose)
         except Exception as e:
-            print(f"⚠ Error loading data: {e}")
+            # Quiet callers report the raised error themselves
+            if verbose:
+                print(f"⚠ Error loading data: {e}")
             raise
     
     @staticmethod
-    def _load_legacy_data(university: University) -> None:
+    def _load_message(message: str, verbose: bool) -> None:
+        """Print a load message, or keep it for later for a quiet load."""
+        if verbose:
+            print(message)
+        else:
+            FileHandler.pending_load_messages.append(message)
+    
+    @staticmethod
+    def take_load_messages() -> List[str]:
+        """Get and clear the messages kept by quiet loads."""
+        messages = FileHandler.pending_load_messages
+        FileHandler.pending_load_messages = []
+        return messages
+    
+    @staticmethod
+    def save_codec() -> Optional[str]:
+        """Codec the next save writes (None for plain JSON)."""
+        if FileHandler.COMPRESSION is None:
+            return FileHandler.loaded_codec
+        return check_codec(FileHandler.COMPRESSION)
+    
+    @staticmethod
+    def codec_changed() -> bool:
+        """True if the data file would be saved with another codec than it has now."""
+        return (os.path.exists(FileHandler.UNIVERSITY_FILE) and
+                FileHandler.save_codec() != FileHandler.loaded_codec)
+    
+    @staticmethod
+    def integrity_summary() -> Optional[str]:
+        """Describe the integrity problems found by the last load, if any."""
+        issues = FileHandler.last_integrity_issues
+        if not issues:
+            return None
+        repaired = sum(issue['repaired'] for issue in issues)
+        if repaired:
+            return f"✓ Repaired {repaired} of {len(issues)} integrity problem(s) in the data file"
+        return (f"⚠ Found {len(issues)} integrity problem(s) in the data file "
+                f"(run 'python main.py check' for details, 'check repair' to fix)")
+    
+    @staticmethod
+    def _cache_secret(create: bool = False) -> Optional[bytes]:
+        """
+        Get the per-user secret signing the warm-start cache.
+        
+        Args:
+            create: Create the secret (readable by the user only) if there is none
+            
+        Returns:
+            The secret, or None if there is none and it was not created
+        """
+        path = FileHandler.CACHE_KEY_FILE
+        for _ in range(2):
+            try:
+                with open(path, 'rb') as f:
+                    secret = f.read()
+                return secret if len(secret) >= 32 else None
+            except FileNotFoundError:
+                if not create:
+                    return None
+            except OSError:
+                return None
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                continue  # Created by another process meanwhile
+            except OSError:
+                return None
+            secret = os.urandom(32)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secret)
+            return secret
+        return None
+    
+    @staticmethod
+    def _cache_signature(secret: bytes, payload: bytes) -> bytes:
+        return hmac.new(secret, payload, hashlib.sha256).digest()
+    
+    @staticmethod
+    def _read_cache(key: Tuple) -> Optional[Dict]:
+        """
+        Read the warm-start cache if it was built from the file identified by
+        key. The cache is only unpickled if it carries our signature.
+        """
+        secret = FileHandler._cache_secret()
+        if secret is None:
+            return None
+        try:
+            with open(FileHandler.CACHE_FILE, 'rb') as f:
+                signature, payload = f.read(32), f.read()
+            if not hmac.compare_digest(signature, FileHandler._cache_signature(secret, payload)):
+                return None
+            cached = pickle.loads(payload)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(cached, dict) or cached.get('key') != key:
+            return None
+        return cached
+    
+    @staticmethod
+    def _write_cache(key: Tuple, university: University, meta: Dict) -> None:
+        """
+        Write the warm-start cache for a freshly loaded university.
+        
+        Must run before the first snapshot, whose cached records are not
+        picklable. A failed write only costs the next start its speed-up.
+        The pickle is preceded by its HMAC-SHA256 under the per-user secret.
+        """
+        secret = FileHandler._cache_secret(create=True)
+        if secret is None:
+            return
+        cached = {'key': key, 'meta': meta, 'name': university.name, 'address': university.address}
+        for collection, _ in FileHandler.COLLECTIONS:
+            cached[collection] = getattr(university, collection)
+        
+        temp_path = f"{FileHandler.CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            payload = pickle.dumps(cached, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(temp_path, 'wb') as f:
+                f.write(FileHandler._cache_signature(secret, payload))
+                f.write(payload)
+            os.replace(temp_path, FileHandler.CACHE_FILE)
+        except (OSError, pickle.PicklingError, TypeError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    @staticmethod
+    def reload_if_changed(university: University) -> bool:
+        """
+        Reload the university if another process saved a new version.
+        
+        Checking is a single stat() call while the file is unchanged. A
+        university with unsaved changes is not reloaded, so they are never
+        lost; its next save merges the other process's changes instead. A
+        file that cannot be read is left to the next check or save.
+        
+        Args:
+            university: University object to reload
+            
+        Returns:
+            True if new data was loaded, False otherwise
+        """
+        try:
+            stat = os.stat(FileHandler.UNIVERSITY_FILE)
+        except FileNotFoundError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == FileHandler._known_stat:
+            return False
+        
+        try:
+            with FileLock(FileHandler.lock_file(), shared=True):
+                stat = os.stat(FileHandler.UNIVERSITY_FILE)
+                with open_text(FileHandler.UNIVERSITY_FILE) as f:
+                    all_data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        meta = all_data.get('_meta', {})
+        with university.lock:
+            if (meta.get('version', 0) == FileHandler._known_version and
+                    meta.get('content_hash') == FileHandler._known_hash):
+                FileHandler._known_stat = (stat.st_mtime_ns, stat.st_size)
+                return False
+            base = FileHandler._base_snapshot
+            if base is None or base.version != university.version:
+                return False
+            
+            university.load_all_data(all_data)
+            FileHandler._remember_loaded(university, all_data, stat)
+        return True
+    
+    @staticmethod
+    def _remember_loaded(university: University, all_data: Dict, stat: os.stat_result) -> None:
+        """Record the version of the file the university was loaded from."""
+        meta = all_data.get('_meta', {})
+        with FileHandler._state_lock:
+            FileHandler._known_version = meta.get('version', 0)
+            FileHandler._known_hash = meta.get('content_hash', "")
+            FileHandler._known_stat = (stat.st_mtime_ns, stat.st_size)
+            FileHandler._base_snapshot = university.snapshot()
+    
+    @staticmethod
+    def _load_legacy_data(university: University, verbose: bool = True) -> None:
         """Load data from legacy individual files (for backward compatibility)."""
         try:
             # Load departments
             with open(FileHandler.DEPARTMENTS_FILE, 'r') as f:
                 departments_data = json.load(f)
                 for dept_data in departments_data:
-                    university.departments.append(Department.from_dict(dept_data))
+                    university.add_department(Department.from_dict(dept_data))
             
             # Load faculty
             with open(FileHandler.FACULTY_FILE, 'r') as f:
                 faculty_data = json.load(f)
                 for faculty_data_item in faculty_data:
-                    university.faculty.append(Faculty.from_dict(faculty_data_item))
+                    university.add_faculty(Faculty.from_dict(faculty_data_item))
             
             # Load students
             with open(FileHandler.STUDENTS_FILE, 'r') as f:
                 students_data = json.load(f)
                 for student_data in students_data:
-                    university.students.append(Student.from_dict(student_data))
+                    university.add_student(Student.from_dict(student_data))
             
             # Load courses
             with open(FileHandler.COURSES_FILE, 'r') as f:
                 courses_data = json.load(f)
                 for course_data in courses_data:
-                    university.courses.append(Course.from_dict(course_data))
+                    university.add_course(Course.from_dict(course_data))
             
-            print("✓ Legacy data loaded successfully")
+            if verbose:
+                print("✓ Legacy data loaded successfully")
         except Exception as e:
-            print(f"⚠ Error loading legacy data: {e}")
\ No newline at end of file
+            FileHandler._load_message(f"⚠ Error loading legacy data: {e}", verbose)
\ No newline at end of file
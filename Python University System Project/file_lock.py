@@ -0,0 +1,85 @@
+"""
+File lock module for University Management System
+
+Advisory inter-process locks so several processes can share one data
+directory. Uses fcntl on POSIX and msvcrt on Windows.
+"""
+
+import os
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+class LockTimeoutError(Exception):
+    """Raised when a file lock cannot be acquired in time."""
+
+class FileLock:
+    """Advisory lock on a companion .lock file."""
+    
+    POLL_INTERVAL = 0.05
+    
+    def __init__(self, path: str, shared: bool = False, timeout: Optional[float] = 10.0):
+        """
+        Initialize the lock.
+        
+        Args:
+            path: Path of the lock file (created if missing)
+            shared: Take a shared (reader) lock instead of an exclusive one.
+                    Windows only supports exclusive locks, so readers are
+                    serialized there.
+            timeout: Seconds to wait for the lock (None waits forever)
+        """
+        self.path = path
+        self.shared = shared
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+    
+    def acquire(self) -> None:
+        """Acquire the lock, polling until the timeout expires."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        
+        while True:
+            try:
+                self._try_lock(fd)
+                self._fd = fd
+                return
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeoutError(f"Timed out waiting for lock on {self.path}")
+                time.sleep(self.POLL_INTERVAL)
+    
+    def _try_lock(self, fd: int) -> None:
+        if fcntl is not None:
+            mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    
+    def release(self) -> None:
+        """Release the lock."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+    
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
\ No newline at end of file
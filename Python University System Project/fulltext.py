@@ -0,0 +1,260 @@
+"""
+Full-text search module for University Management System
+
+One inverted index over students, faculty, courses and departments. Each
+entity is a document made of weighted fields: its ID, its name, the ID
+and name of its department, and the other text it carries from the data
+file (course descriptions, contact details, additional information, ...).
+Every word of a query must start a word of a document, so results appear
+while typing, and matches are ranked by the field they were found in and
+by how rare the matched word is.
+
+The index is built once and then kept current from change events: a
+change reindexes only the changed entity, and renaming a department
+reindexes its students and faculty. A bulk reload rebuilds it on the
+next search.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from events import ChangeEvent
+
+# Indexed collections and their ID attributes, in result order for equal scores
+ID_KEYS = {'students': 'student_id', 'faculty': 'faculty_id',
+           'courses': 'course_id', 'departments': 'department_id'}
+
+# Field weights: how strongly a word found in the field ranks the entity
+ID_WEIGHT = 8.0
+NAME_WEIGHT = 4.0
+DEPARTMENT_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+PREFIX_FACTOR = 0.5  # Score of a word the query only starts, relative to an exact match
+
+_WORD = re.compile(r'[^\W_]+')
+
+DocKey = Tuple[str, str]  # (collection, ID)
+SearchResult = Tuple[str, object, float]  # (collection, entity, score)
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case words of letters and digits."""
+    return _WORD.findall(text.casefold())
+
+def _texts(value) -> Iterator[str]:
+    """Strings found in a data file value, including nested lists and dictionaries."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _texts(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _texts(item)
+
+def result_record(result: SearchResult) -> Dict:
+    """Summary dictionary of a search result (type, ID, name and score)."""
+    collection, entity, score = result
+    return {'type': collection, 'id': getattr(entity, ID_KEYS[collection]),
+            'name': entity.name, 'score': round(score, 3)}
+
+class FullTextIndex:
+    """Ranked word search over all entities of a University, kept current by its change events."""
+    
+    DEFAULT_LIMIT = 20  # Results returned by a search
+    
+    def __init__(self, university):
+        """
+        Build the index and subscribe to the university's changes.
+        
+        Args:
+            university: University object searched
+        """
+        self.university = university
+        self._lock = threading.RLock()
+        self._documents: Dict[DocKey, Dict[str, float]] = {}     # document -> word -> weight
+        self._postings: Dict[str, Dict[DocKey, float]] = {}      # word -> document -> weight
+        self._vocabulary: List[str] = []                         # Sorted words, for prefixes
+        self._members: Dict[str, Set[DocKey]] = {}               # department ID -> documents
+        self._member_departments: Dict[DocKey, str] = {}         # document -> department ID
+        self._stale = True
+        self.rebuilds = 0
+        self.updates = 0  # Documents reindexed by change events
+        university.events.subscribe(self._on_change, [ChangeEvent.ENTITY_ADDED,
+                                                      ChangeEvent.ENTITY_REMOVED,
+                                                      ChangeEvent.ENTITY_UPDATED,
+                                                      ChangeEvent.RELOADED])
+        self.rebuild()
+    
+    def rebuild(self) -> None:
+        """Index every entity from scratch."""
+        with self._lock:
+            self._documents = {}
+            self._postings = {}
+            self._members = {}
+            self._member_departments = {}
+            departments = self.university._id_index('departments', 'department_id')
+            for collection, key in ID_KEYS.items():
+                for entity in getattr(self.university, collection):
+                    self._add(collection, getattr(entity, key), entity, departments, index_words=False)
+            self._vocabulary = sorted(self._postings)
+            self._stale = False
+            self.rebuilds += 1
+    
+    def _document(self, entity_id: str, entity, departments: Dict) -> Dict[str, float]:
+        """Words of an entity with the weight of the best field each appears in."""
+        words: Dict[str, float] = {}
+        
+        def add(text: str, weight: float) -> None:
+            for word in tokenize(text):
+                if words.get(word, 0.0) < weight:
+                    words[word] = weight
+        
+        add(entity_id, ID_WEIGHT)
+        add(entity.name, NAME_WEIGHT)
+        department_id = getattr(entity, 'department', None)
+        if department_id:
+            add(department_id, DEPARTMENT_WEIGHT)
+            department = departments.get(department_id)
+            if department is not None:
+                add(department.name, DEPARTMENT_WEIGHT)
+        for text in _texts(entity.extra):
+            add(text, TEXT_WEIGHT)
+        return words
+    
+    def _add(self, collection: str, entity_id: str, entity, departments: Dict,
+             index_words: bool = True) -> None:
+        """Index an entity; lock must be held and the entity not indexed."""
+        doc = (collection, entity_id)
+        words = self._document(entity_id, entity, departments)
+        self._documents[doc] = words
+        for word, weight in words.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                if index_words:
+                    bisect.insort(self._vocabulary, word)
+            postings[doc] = weight
+        department_id = getattr(entity, 'department', None)
+        if department_id:
+            self._members.setdefault(department_id, set()).add(doc)
+            self._member_departments[doc] = department_id
+    
+    def _remove(self, doc: DocKey) -> None:
+        """Remove a document if it is indexed; lock must be held."""
+        words = self._documents.pop(doc, None)
+        if words is None:
+            return
+        for word in words:
+            postings = self._postings[word]
+            del postings[doc]
+            if not postings:
+                del self._postings[word]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, word)]
+        department_id = self._member_departments.pop(doc, None)
+        if department_id is not None:
+            members = self._members[department_id]
+            members.discard(doc)
+            if not members:
+                del self._members[department_id]
+    
+    def _reindex(self, collection: str, entity_id: str) -> None:
+        """Bring one document up to date with its entity; lock must be held."""
+        doc = (collection, entity_id)
+        self._remove(doc)
+        entity = self.university._id_index(collection, ID_KEYS[collection]).get(entity_id)
+        if entity is not None:
+            self._add(collection, entity_id, entity,
+                      self.university._id_index('departments', 'department_id'))
+        self.updates += 1
+    
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Event subscriber: reindex the entities whose words a change may have changed."""
+        with self._lock:
+            if event.kind == ChangeEvent.RELOADED:
+                self._stale = True
+                return
+            if self._stale or event.collection not in ID_KEYS:
+                return
+            self._reindex(event.collection, event.entity_id)
+            # Students and faculty are found by their department's name
+            if event.collection == 'departments' and (
+                    event.kind != ChangeEvent.ENTITY_UPDATED
+                    or 'name' in event.data.get('changes', {})):
+                for collection, entity_id in list(self._members.get(event.entity_id, ())):
+                    self._reindex(collection, entity_id)
+    
+    def _matches(self, term: str) -> Dict[DocKey, float]:
+        """Score of each document containing a word that starts with the term."""
+        scores: Dict[DocKey, float] = {}
+        total = len(self._documents)
+        vocabulary = self._vocabulary
+        i = bisect.bisect_left(vocabulary, term)
+        while i < len(vocabulary) and vocabulary[i].startswith(term):
+            word = vocabulary[i]
+            postings = self._postings[word]
+            # Rare words say more about a document than common ones
+            factor = math.log(1 + total / len(postings))
+            if word != term:
+                factor *= PREFIX_FACTOR
+            for doc, weight in postings.items():
+                score = weight * factor
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+            i += 1
+        return scores
+    
+    def search(self, query: str, collections: Optional[Iterable[str]] = None,
+               limit: int = DEFAULT_LIMIT) -> List[SearchResult]:
+        """
+        Find the entities matching every word of a query.
+        
+        Args:
+            query: Search text; each word must start a word of the entity
+            collections: Entity types to return ('students', 'faculty',
+                         'courses', 'departments'; default all)
+            limit: Maximum number of results
+            
+        Returns:
+            (collection, entity, score) tuples, best match first
+            
+        Raises:
+            ValueError: If a collection is unknown
+        """
+        wanted = set(collections) if collections else set(ID_KEYS)
+        unknown = wanted - set(ID_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown entity type: {', '.join(sorted(unknown))} "
+                             f"(expected one of {', '.join(ID_KEYS)})")
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        
+        with self._lock:
+            if self._stale:
+                self.rebuild()
+            # Intersect from the most selective term
+            matches = sorted((self._matches(term) for term in terms), key=len)
+            scores = {doc: score for doc, score in matches[0].items() if doc[0] in wanted}
+            for other in matches[1:]:
+                scores = {doc: score + other[doc] for doc, score in scores.items() if doc in other}
+                if not scores:
+                    return []
+            order = list(ID_KEYS)
+            best = heapq.nsmallest(limit, scores.items(),
+                                   key=lambda item: (-item[1], order.index(item[0][0]), item[0][1]))
+            results = []
+            for (collection, entity_id), score in best:
+                entity = self.university._id_index(collection, ID_KEYS[collection]).get(entity_id)
+                if entity is not None:
+                    results.append((collection, entity, score))
+            return results
+    
+    def stats(self) -> Dict:
+        """Index size and maintenance counters."""
+        with self._lock:
+            return {'documents': len(self._documents), 'words': len(self._postings),
+                    'postings': sum(len(words) for words in self._documents.values()),
+                    'rebuilds': self.rebuilds, 'updates': self.updates}
\ No newline at end of file
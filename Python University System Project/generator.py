@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for University Management System
+
+Produces realistic universities of configurable size from a seed: the same
+seed and sizes always give the same data. Course popularity follows a
+power law, and grades come from per-student ability and per-course
+difficulty. A university can be built through the University API or
+streamed straight to the JSON storage format.
+"""
+
+import argparse
+import json
+import os
+import random
+from bisect import bisect_left
+from itertools import accumulate, product
+from string import ascii_uppercase
+from typing import Dict, Iterator, List, Tuple
+from university import University
+from student import Student
+from faculty import Faculty
+from course import Course
+from department import Department
+
+# ID formats limit the population: S0000-S9999 and F0000-F9999, and
+# course numbers 100-999 within a department
+MAX_STUDENTS = 10000
+MAX_FACULTY = 10000
+MAX_COURSES_PER_DEPARTMENT = 900
+
+DEPARTMENTS = [
+    ("CSE", "Computer Science and Engineering", "Computing"),
+    ("EEE", "Electrical and Electronics Engineering", "Electronics"),
+    ("ME", "Mechanical Engineering", "Mechanics"),
+    ("CE", "Civil Engineering", "Structures"),
+    ("MAT", "Mathematics", "Mathematics"),
+    ("PHY", "Physics", "Physics"),
+    ("CHE", "Chemical Engineering", "Chemical Processes"),
+    ("BUS", "Business Administration", "Management"),
+    ("ECO", "Economics", "Economics"),
+    ("PSY", "Psychology", "Psychology"),
+    ("BIO", "Biology", "Biology"),
+    ("CHEM", "Chemistry", "Chemistry"),
+    ("HIST", "History", "History"),
+    ("PHIL", "Philosophy", "Philosophy"),
+    ("ENG", "English Literature", "Literature"),
+    ("ARCH", "Architecture", "Design"),
+    ("STAT", "Statistics", "Statistics"),
+    ("LAW", "Law", "Legal Studies"),
+    ("MED", "Medicine", "Clinical Science"),
+    ("ART", "Fine Arts", "Studio Art")
+]
+
+COURSE_PREFIXES = ["Introduction to", "Foundations of", "Principles of", "Topics in",
+                   "Applied", "Advanced", "Methods in", "Seminar in", "Research in"]
+
+FIRST_NAMES = ["James", "Mary", "Wei", "Aisha", "Carlos", "Sofia", "Liam", "Priya",
+               "Noah", "Fatima", "Lucas", "Yuki", "Omar", "Elena", "Mateo", "Chloe",
+               "Ivan", "Amara", "Kenji", "Grace", "Diego", "Leila", "Hugo", "Zara",
+               "Arjun", "Maya", "Tomas", "Ines", "Kwame", "Hana"]
+
+LAST_NAMES = ["Smith", "Chen", "Garcia", "Khan", "Nguyen", "Müller", "Okafor", "Rossi",
+              "Kim", "Patel", "Silva", "Novak", "Haddad", "Tanaka", "Johnson", "Lopez",
+              "Ivanova", "Mensah", "Dubois", "Larsen", "Cohen", "Singh", "Murphy", "Sato",
+              "Kowalski", "Ali", "Brown", "Fischer", "Moreau", "Santos"]
+
+TITLES = ["Dr.", "Prof.", "Assoc. Prof.", "Asst. Prof."]
+
+StudentPlan = Tuple[Student, List[Tuple[str, float]]]  # (student, [(course_id, grade)])
+
+class SyntheticUniversity:
+    """Deterministic plan of a synthetic university."""
+    
+    def __init__(self, students: int = 1000, seed: int = 0, departments: int = None,
+                 courses: int = None, faculty: int = None, courses_per_student: int = 5,
+                 popularity_exponent: float = 1.1):
+        """
+        Initialize the plan.
+        
+        Args:
+            students: Number of students (at most MAX_STUDENTS)
+            seed: Random seed
+            departments: Number of departments (default scales with students)
+            courses: Number of courses (default one per 20 students, at least 4 per department)
+            faculty: Number of faculty (default one per 25 students, at least one per department)
+            courses_per_student: Average number of courses a student takes
+            popularity_exponent: Power-law exponent of course popularity
+                                 (0 = uniform, larger = more skewed)
+        """
+        if not 0 <= students <= MAX_STUDENTS:
+            raise ValueError(f"Number of students must be between 0 and {MAX_STUDENTS}")
+        
+        if departments is None:
+            departments = min(len(DEPARTMENTS), max(2, students // 500))
+        if courses is None:
+            courses = max(departments * 4, students // 20)
+        if faculty is None:
+            faculty = max(departments, students // 25)
+        
+        if departments <= 0:
+            raise ValueError("Number of departments must be positive")
+        if not departments <= courses <= departments * MAX_COURSES_PER_DEPARTMENT:
+            raise ValueError(f"Number of courses must be between {departments} and "
+                             f"{departments * MAX_COURSES_PER_DEPARTMENT}")
+        if not departments <= faculty <= MAX_FACULTY:
+            raise ValueError(f"Number of faculty must be between {departments} and {MAX_FACULTY}")
+        if courses_per_student <= 0:
+            raise ValueError("Courses per student must be positive")
+        
+        self.students = students
+        self.seed = seed
+        self.departments = departments
+        self.courses = courses
+        self.faculty = faculty
+        self.courses_per_student = courses_per_student
+        self.popularity_exponent = popularity_exponent
+        self.name = f"Synthetic University {seed}"
+        self.address = "1 Generator Way, Testville"
+    
+    def _department_specs(self) -> List[Tuple[str, str, str]]:
+        """(code, name, subject) for each department."""
+        specs = DEPARTMENTS[:self.departments]
+        taken = {code for code, _, _ in specs}
+        extra = (''.join(letters) for size in (2, 3, 4)
+                 for letters in product(ascii_uppercase, repeat=size))
+        for code in extra:
+            if len(specs) >= self.departments:
+                break
+            if code not in taken:
+                specs.append((code, f"Department of {code} Studies", f"{code} Studies"))
+        return specs
+    
+    def _plan(self) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str, str]],
+                             List[Tuple[str, str, int, str, str]], Dict[str, float]]:
+        """
+        Plan the structure of the university.
+        
+        Returns:
+            Tuple of (departments as (code, name, subject), faculty as
+            (faculty_id, name, department), courses as (course_id, name,
+            credit_hours, department, faculty_id), course difficulties)
+        """
+        rng = random.Random(f"{self.seed}-structure")
+        departments = self._department_specs()
+        codes = [code for code, _, _ in departments]
+        
+        faculty = []
+        for i in range(self.faculty):
+            name = f"{rng.choice(TITLES)} {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            faculty.append((f"F{i:04d}", name, codes[i % len(codes)]))
+        
+        faculty_by_department: Dict[str, List[str]] = {}
+        for faculty_id, _, code in faculty:
+            faculty_by_department.setdefault(code, []).append(faculty_id)
+        
+        courses = []
+        difficulty = {}
+        for i in range(self.courses):
+            code, _, subject = departments[i % len(departments)]
+            number = 100 + i // len(departments)
+            course_id = f"{code}{number}"
+            courses.append((course_id, f"{rng.choice(COURSE_PREFIXES)} {subject} {number}",
+                            rng.choice((1, 2, 3, 3, 3, 4, 4)), code,
+                            rng.choice(faculty_by_department[code])))
+            difficulty[course_id] = rng.gauss(0.0, 0.3)
+        
+        return departments, faculty, courses, difficulty
+    
+    def _popularity(self, course_ids: List[str], rng: random.Random) -> Tuple[List[str], List[float]]:
+        """Shuffle courses and give them power-law cumulative weights by rank."""
+        ranked = list(course_ids)
+        rng.shuffle(ranked)
+        weights = [1.0 / (rank + 1) ** self.popularity_exponent for rank in range(len(ranked))]
+        return ranked, list(accumulate(weights))
+    
+    def _student_plans(self, courses: List[Tuple], difficulty: Dict[str, float]) -> Iterator[StudentPlan]:
+        """Yield each student with the (course, grade) pairs they take."""
+        rng = random.Random(f"{self.seed}-students")
+        codes = [code for code, _, _ in self._department_specs()]
+        department_weights = list(accumulate(1.0 / (rank + 1) ** 0.5 for rank in range(len(codes))))
+        
+        by_department: Dict[str, List[str]] = {}
+        for course_id, _, _, code, _ in courses:
+            by_department.setdefault(code, []).append(course_id)
+        everything = self._popularity([course[0] for course in courses], rng)
+        local = {code: self._popularity(ids, rng) for code, ids in by_department.items()}
+        
+        def pick(ranked: List[str], cumulative: List[float]) -> str:
+            return ranked[bisect_left(cumulative, rng.random() * cumulative[-1])]
+        
+        for i in range(self.students):
+            department = rng.choices(codes, cum_weights=department_weights)[0]
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            age = min(40, 17 + int(rng.expovariate(0.35)))
+            gender = rng.choices(("M", "F", "Other"), weights=(48, 48, 4))[0]
+            student = Student(f"S{i:04d}", name, age, gender, department)
+            
+            wanted = min(len(courses), max(1, round(rng.gauss(self.courses_per_student, 1.2))))
+            taken: Dict[str, float] = {}
+            ability = rng.gauss(3.0, 0.45)
+            attempts = 0
+            while len(taken) < wanted and attempts < wanted * 20:
+                attempts += 1
+                course_id = pick(*(local[department] if rng.random() < 0.7 else everything))
+                if course_id not in taken:
+                    grade = ability - difficulty[course_id] + rng.gauss(0.0, 0.4)
+                    taken[course_id] = round(min(4.0, max(0.0, grade)), 2)
+            yield student, list(taken.items())
+    
+    def populate(self, university: University) -> University:
+        """
+        Replace the contents of a university with the generated data,
+        using the University API.
+        
+        Args:
+            university: University object to fill
+            
+        Returns:
+            The same university
+        """
+        departments, faculty, courses, difficulty = self._plan()
+        university.clear()
+        university.name = self.name
+        university.address = self.address
+        
+        for code, name, _ in departments:
+            university.add_department(Department(code, name))
+        for faculty_id, name, code in faculty:
+            university.add_faculty(Faculty(faculty_id, name, code))
+        for (code, _, _), (faculty_id, _, _) in zip(departments, faculty):
+            university.update_department(code, head_of_department=faculty_id)
+        for course_id, name, credit_hours, code, faculty_id in courses:
+            university.add_course(Course(course_id, name, credit_hours))
+            university.add_course_to_department(code, course_id)
+            university.assign_faculty_to_course(faculty_id, course_id)
+        
+        for student, grades in self._student_plans(courses, difficulty):
+            university.add_student(student)
+            for course_id, grade in grades:
+                university.enroll_student_in_course(student.student_id, course_id)
+                university.assign_grade(student.student_id, course_id, grade)
+        return university
+    
+    def build(self) -> University:
+        """Build a new University with the generated data."""
+        return self.populate(University(self.name, self.address))
+    
+    def write(self, path: str) -> Dict[str, int]:
+        """
+        Stream the generated data to a JSON file in the storage format.
+        
+        Students are serialized one at a time and never held in a
+        University; only course rosters are kept while writing.
+        
+        Args:
+            path: Output file (replaced atomically)
+            
+        Returns:
+            Number of records written per collection
+        """
+        plan_departments, plan_faculty, plan_courses, difficulty = self._plan()
+        
+        departments = {code: Department(code, name) for code, name, _ in plan_departments}
+        faculty = {faculty_id: Faculty(faculty_id, name, code)
+                   for faculty_id, name, code in plan_faculty}
+        for (code, _, _), (faculty_id, _, _) in zip(plan_departments, plan_faculty):
+            departments[code].set_head_of_department(faculty_id)
+        courses = []
+        for course_id, name, credit_hours, code, faculty_id in plan_courses:
+            course = Course(course_id, name, credit_hours)
+            course.assign_faculty(faculty_id)
+            faculty[faculty_id].assign_course(course_id)
+            departments[code].add_course(course_id)
+            courses.append(course)
+        
+        rosters: Dict[str, List[str]] = {course.course_id: [] for course in courses}
+        counts = {'departments': len(departments), 'students': 0,
+                  'faculty': len(faculty), 'courses': len(courses)}
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        
+        def write_records(f, name: str, records, last: bool = False) -> None:
+            f.write(f'  "{name}": [')
+            for i, record in enumerate(records):
+                f.write(("\n    " if i == 0 else ",\n    ") + json.dumps(record))
+            f.write("\n  ]" + ("\n" if last else ",\n"))
+        
+        def student_records():
+            for student, grades in self._student_plans(plan_courses, difficulty):
+                for course_id, grade in grades:
+                    student.enroll_in_course(course_id)
+                    student.assign_grade(course_id, grade)
+                    rosters[course_id].append(student.student_id)
+                counts['students'] += 1
+                yield student.to_dict()
+        
+        def course_records():
+            for course in courses:
+                course.enrolled_students = rosters[course.course_id]
+                yield course.to_dict()
+        
+        try:
+            with open(temp_path, 'w') as f:
+                f.write("{\n")
+                f.write(f'  "name": {json.dumps(self.name)},\n')
+                f.write(f'  "address": {json.dumps(self.address)},\n')
+                write_records(f, 'departments', (d.to_dict() for d in departments.values()))
+                write_records(f, 'students', student_records())
+                write_records(f, 'faculty', (m.to_dict() for m in faculty.values()))
+                write_records(f, 'courses', course_records(), last=True)
+                f.write("}\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        return counts
+
+def main():
+    """Generate a synthetic university from the command line."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic university")
+    parser.add_argument('--students', type=int, default=1000, help="Number of students")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--departments', type=int, help="Number of departments")
+    parser.add_argument('--courses', type=int, help="Number of courses")
+    parser.add_argument('--faculty', type=int, help="Number of faculty")
+    parser.add_argument('--courses-per-student', type=int, default=5,
+                        help="Average courses per student")
+    parser.add_argument('--exponent', type=float, default=1.1,
+                        help="Power-law exponent of course popularity")
+    parser.add_argument('--output', default=os.path.join("data", "university.json"),
+                        help="Output JSON file")
+    args = parser.parse_args()
+    
+    try:
+        plan = SyntheticUniversity(args.students, args.seed, args.departments, args.courses,
+                                   args.faculty, args.courses_per_student, args.exponent)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    counts = plan.write(args.output)
+    print(f"✓ Wrote {counts['students']} students, {counts['faculty']} faculty, "
+          f"{counts['courses']} courses and {counts['departments']} departments to {args.output}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+ID codec module for University Management System
+
+Student and faculty IDs are a prefix letter plus four digits, so they map
+one-to-one onto the integers 0-9999. A set of student IDs can then be held
+as a bitmap in a single Python int (bit n set = student n is a member),
+which makes membership, union, intersection and counting bit operations.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+STUDENT_PREFIX = 'S'
+FACULTY_PREFIX = 'F'
+ID_DIGITS = 4
+
+def encode_id(entity_id: str, prefix: str = STUDENT_PREFIX) -> Optional[int]:
+    """
+    Encode a prefixed ID as a small integer.
+    
+    Args:
+        entity_id: ID such as S0042 or F0007
+        prefix: Expected prefix letter
+        
+    Returns:
+        The integer part of the ID, or None if the ID has another format
+    """
+    if len(entity_id) != ID_DIGITS + 1 or entity_id[0] != prefix:
+        return None
+    digits = entity_id[1:]
+    if not digits.isdigit():
+        return None
+    return int(digits)
+
+def decode_id(number: int, prefix: str = STUDENT_PREFIX) -> str:
+    """Decode an integer back into its prefixed ID (42 -> S0042)."""
+    return f"{prefix}{number:0{ID_DIGITS}d}"
+
+def to_bitmap(entity_ids: Iterable[str], prefix: str = STUDENT_PREFIX) -> int:
+    """
+    Build a bitmap from IDs; IDs in another format are skipped.
+    
+    Args:
+        entity_ids: IDs to include
+        prefix: Prefix letter of the IDs
+        
+    Returns:
+        Bitmap with the bit of every valid ID set
+    """
+    bitmap = 0
+    for entity_id in entity_ids:
+        number = encode_id(entity_id, prefix)
+        if number is not None:
+            bitmap |= 1 << number
+    return bitmap
+
+def iter_bitmap(bitmap: int, prefix: str = STUDENT_PREFIX) -> Iterator[str]:
+    """Yield the IDs of the set bits in ascending ID order."""
+    # Binary digits lowest bit first; str.find skips runs of zeros in C
+    digits = bin(bitmap)[:1:-1]
+    number = digits.find('1')
+    while number >= 0:
+        yield decode_id(number, prefix)
+        number = digits.find('1', number + 1)
+
+def bitmap_count(bitmap: int) -> int:
+    """Count the IDs in a bitmap."""
+    if hasattr(bitmap, 'bit_count'):  # Python 3.10+
+        return bitmap.bit_count()
+    return bin(bitmap).count('1')
\ No newline at end of file
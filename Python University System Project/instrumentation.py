@@ -0,0 +1,189 @@
+"""
+Instrumentation module for University Management System
+
+Opt-in timing of every public University and FileHandler method: call
+counts, cumulative time, latency histograms (p50/p95/p99) and an estimate
+of the entities each call scans. Scanned figures are estimated from the
+collection sizes before the call, not counted during it. Timing wrappers
+are only installed while instrumentation is enabled, so a disabled
+system runs the original methods untouched.
+"""
+
+import functools
+import json
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from university import University
+from file_handler import FileHandler
+
+def _all_entities(u: University, *args, **kwargs) -> int:
+    return len(u.students) + len(u.faculty) + len(u.courses) + len(u.departments)
+
+def _enroll_scan(u: University, student_id: str = "", course_id: str = "", *args, **kwargs) -> int:
+    course = u._id_index('courses', 'course_id').get(course_id)
+    return 2 + (len(course.enrolled_students) if course else 0)
+
+# Estimated entities scanned per call, from collection sizes before the call (not counted)
+SCANNED: Dict[str, Callable[..., int]] = {
+    'find_student': lambda u, *a, **k: 1,
+    'find_faculty': lambda u, *a, **k: 1,
+    'find_course': lambda u, *a, **k: 1,
+    'find_department': lambda u, *a, **k: 1,
+    'enroll_student_in_course': _enroll_scan,
+    'remove_student': lambda u, *a, **k: len(u.students) + len(u.courses),
+    'remove_faculty': lambda u, *a, **k: len(u.faculty) + len(u.courses) + len(u.departments),
+    'remove_course': _all_entities,
+    'remove_department': lambda u, *a, **k: len(u.departments),
+    'snapshot': _all_entities,
+    'get_all_data': _all_entities
+}
+
+class OperationStats:
+    """Call statistics of one operation with a log-scale latency histogram."""
+    
+    BUCKETS_PER_OCTAVE = 4  # Bucket bounds grow by 2 ** (1/4), about 19%
+    
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.scanned_estimate = 0
+        self.buckets: Dict[int, int] = {}  # bucket index -> calls
+    
+    def record(self, seconds: float, scanned: Optional[int] = None) -> None:
+        """Record one call and its estimated scanned entities."""
+        self.calls += 1
+        self.total_time += seconds
+        self.max_time = max(self.max_time, seconds)
+        if scanned is not None:
+            self.scanned_estimate += scanned
+        nanoseconds = max(seconds * 1e9, 1.0)
+        bucket = int(math.log2(nanoseconds) * self.BUCKETS_PER_OCTAVE)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+    
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a latency percentile from the histogram.
+        
+        Args:
+            p: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound (seconds) of the bucket holding the percentile
+        """
+        if not self.calls:
+            return 0.0
+        rank = math.ceil(self.calls * p / 100.0)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                upper = 2 ** ((bucket + 1) / self.BUCKETS_PER_OCTAVE) / 1e9
+                return min(upper, self.max_time)
+        return self.max_time
+    
+    def to_dict(self) -> Dict:
+        """Get the statistics as a dictionary (times in seconds)."""
+        return {
+            'calls': self.calls,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / self.calls if self.calls else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max_time': self.max_time,
+            'scanned_estimate': self.scanned_estimate,
+            'scanned_estimate_per_call': self.scanned_estimate / self.calls if self.calls else 0.0
+        }
+
+class Instrumentation:
+    """Installs timing wrappers and collects per-operation statistics."""
+    
+    TARGETS = (University, FileHandler)
+    
+    def __init__(self):
+        self.stats: Dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+        self._originals: Dict[tuple, object] = {}  # (class, name) -> original attribute
+        self.started_at: Optional[float] = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether timing wrappers are installed."""
+        return bool(self._originals)
+    
+    def enable(self) -> None:
+        """Install timing wrappers on every public method."""
+        if self.enabled:
+            return
+        self.started_at = time.time()
+        for cls in self.TARGETS:
+            for name, attr in list(vars(cls).items()):
+                if name.startswith('_'):
+                    continue
+                if isinstance(attr, staticmethod):
+                    wrapped = staticmethod(self._wrap(f"{cls.__name__}.{name}", attr.__func__))
+                elif callable(attr):
+                    wrapped = self._wrap(f"{cls.__name__}.{name}", attr, SCANNED.get(name))
+                else:
+                    continue
+                self._originals[(cls, name)] = attr
+                setattr(cls, name, wrapped)
+    
+    def disable(self) -> None:
+        """Restore the original methods; collected statistics are kept."""
+        for (cls, name), attr in self._originals.items():
+            setattr(cls, name, attr)
+        self._originals.clear()
+    
+    def reset(self) -> None:
+        """Discard collected statistics."""
+        with self._lock:
+            self.stats.clear()
+        self.started_at = time.time() if self.enabled else None
+    
+    def _wrap(self, label: str, func: Callable, scanned: Callable = None) -> Callable:
+        record = self.record
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            count = scanned(*args, **kwargs) if scanned is not None else None
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - started, count)
+        return wrapper
+    
+    def record(self, label: str, seconds: float, scanned: Optional[int] = None) -> None:
+        """Record one call of an operation and its estimated scanned entities."""
+        with self._lock:
+            stats = self.stats.get(label)
+            if stats is None:
+                stats = self.stats[label] = OperationStats()
+            stats.record(seconds, scanned)
+    
+    def report(self) -> Dict[str, Dict]:
+        """Get statistics per operation, slowest cumulative time first."""
+        with self._lock:
+            items = [(label, stats.to_dict()) for label, stats in self.stats.items()]
+        items.sort(key=lambda item: item[1]['total_time'], reverse=True)
+        return dict(items)
+    
+    def dump(self, path: str) -> None:
+        """Write the report to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump({'enabled': self.enabled, 'started_at': self.started_at,
+                       'dumped_at': time.time(), 'operations': self.report()}, f, indent=2)
+    
+    def rows(self) -> List[tuple]:
+        """Report rows for display (times in microseconds)."""
+        return [(label, s['calls'], f"{s['total_time'] * 1e3:.1f}", f"{s['p50'] * 1e6:.1f}",
+                 f"{s['p95'] * 1e6:.1f}", f"{s['p99'] * 1e6:.1f}",
+                 f"~{s['scanned_estimate_per_call']:.0f}" if s['scanned_estimate'] else "-")
+                for label, s in self.report().items()]
+
+# Shared instance used by the menu and main
+instrumentation = Instrumentation()
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Integrity module for University Management System
+
+Checks every cross-reference in a University in one pass over hash maps,
+so the cost is linear in the number of references, and optionally repairs
+what it finds. Student grade books are the source of truth for
+enrollments and a course's assigned_faculty for teaching assignments; the
+other side of each relationship is rebuilt to match.
+"""
+
+from typing import Dict, List, Set
+from university import University
+from events import ChangeEvent
+
+class IntegrityChecker:
+    """Finds, and optionally repairs, broken references in a University."""
+    
+    def __init__(self, university: University, repair: bool = False):
+        """
+        Initialize the checker.
+        
+        Args:
+            university: University object to check
+            repair: Fix every problem that has a safe repair
+        """
+        self.university = university
+        self.repair = repair
+        self.issues: List[Dict] = []
+    
+    def _issue(self, entity_id: str, problem: str, repairable: bool = True) -> None:
+        self.issues.append({'entity': entity_id, 'problem': problem,
+                            'repaired': self.repair and repairable})
+    
+    def check(self) -> List[Dict]:
+        """
+        Run the check.
+        
+        Returns:
+            One dictionary per problem with 'entity', 'problem' and 'repaired'
+        """
+        # Repairs are mutations; holding the lock also keeps the data still while checking
+        with self.university.lock:
+            return self._check()
+    
+    def _check(self) -> List[Dict]:
+        self.issues = []
+        students = self._index('students', 'student_id')
+        faculty = self._index('faculty', 'faculty_id')
+        courses = self._index('courses', 'course_id')
+        departments = self._index('departments', 'department_id')
+        
+        # Students: grade books may only reference existing courses
+        rosters: Dict[str, Set[str]] = {course_id: set() for course_id in courses}
+        for student in students.values():
+            for course_id in list(student.course_grades):
+                if course_id in rosters:
+                    rosters[course_id].add(student.student_id)
+                else:
+                    self._issue(student.student_id, f"enrolled in missing course {course_id}")
+                    if self.repair:
+                        student.drop_course(course_id)
+            if student.department not in departments:
+                self._issue(student.student_id,
+                            f"belongs to missing department {student.department}", False)
+        
+        # Courses: rosters must match the grade books
+        teaching: Dict[str, List[str]] = {faculty_id: [] for faculty_id in faculty}
+        for course in courses.values():
+            self._check_roster(course, students, rosters[course.course_id])
+            
+            for student_id in course.waitlist.get_ordered():
+                if student_id not in students:
+                    problem = f"waitlists missing student {student_id}"
+                elif student_id in rosters[course.course_id]:
+                    problem = f"waitlists enrolled student {student_id}"
+                else:
+                    continue
+                self._issue(course.course_id, problem)
+                if self.repair:
+                    course.waitlist.remove(student_id)
+            
+            if course.assigned_faculty and course.assigned_faculty not in faculty:
+                self._issue(course.course_id, f"assigned to missing faculty {course.assigned_faculty}")
+                if self.repair:
+                    course.assigned_faculty = ""
+            if course.assigned_faculty in teaching:
+                teaching[course.assigned_faculty].append(course.course_id)
+            
+            if course.max_capacity and len(course.enrolled_students) > course.max_capacity:
+                self._issue(course.course_id, f"over capacity ({len(course.enrolled_students)}/"
+                                              f"{course.max_capacity})", False)
+        
+        # Faculty: course lists must match the courses' assignments
+        for member in faculty.values():
+            expected = teaching[member.faculty_id]
+            assigned = set(expected)
+            kept, seen = [], set()
+            for course_id in member.courses_taught:
+                if course_id in seen:
+                    self._issue(member.faculty_id, f"lists course {course_id} twice")
+                elif course_id not in courses:
+                    self._issue(member.faculty_id, f"teaches missing course {course_id}")
+                elif course_id not in assigned:
+                    self._issue(member.faculty_id, f"lists {course_id}, which is assigned to "
+                                                   f"{courses[course_id].assigned_faculty or 'nobody'}")
+                else:
+                    kept.append(course_id)
+                seen.add(course_id)
+            for course_id in expected:
+                if course_id not in seen:
+                    self._issue(member.faculty_id, f"is missing assigned course {course_id}")
+                    kept.append(course_id)
+            if self.repair and kept != member.courses_taught:
+                member.courses_taught = kept
+            if member.department not in departments:
+                self._issue(member.faculty_id,
+                            f"belongs to missing department {member.department}", False)
+        
+        # Departments: heads and offered courses must exist
+        for department in departments.values():
+            head = department.head_of_department
+            if head and head not in faculty:
+                self._issue(department.department_id, f"headed by missing faculty {head}")
+                if self.repair:
+                    department.head_of_department = ""
+            kept, seen = [], set()
+            for course_id in department.courses_offered:
+                if course_id in seen:
+                    self._issue(department.department_id, f"offers course {course_id} twice")
+                elif course_id not in courses:
+                    self._issue(department.department_id, f"offers missing course {course_id}")
+                else:
+                    kept.append(course_id)
+                seen.add(course_id)
+            if self.repair and kept != department.courses_offered:
+                department.courses_offered = kept
+        
+        if self.repair and any(issue['repaired'] for issue in self.issues):
+            self.university.version += 1
+            self.university.events.publish(ChangeEvent.RELOADED)
+        return self.issues
+    
+    def _index(self, collection: str, key: str) -> Dict:
+        """ID -> entity map keeping the first of duplicate IDs."""
+        entities = getattr(self.university, collection)
+        index = {}
+        for entity in entities:
+            entity_id = getattr(entity, key)
+            if entity_id in index:
+                self._issue(entity_id, f"duplicate ID in {collection}")
+            else:
+                index[entity_id] = entity
+        if self.repair and len(index) != len(entities):
+            entities[:] = index.values()
+        return index
+    
+    def _check_roster(self, course, students: Dict, enrolled: Set[str]) -> None:
+        """Rebuild a course roster from the students enrolled in the course."""
+        kept, seen = [], set()
+        for student_id in course.enrolled_students:
+            if student_id in seen:
+                self._issue(course.course_id, f"lists student {student_id} twice")
+            elif student_id not in students:
+                self._issue(course.course_id, f"lists missing student {student_id}")
+            elif student_id not in enrolled:
+                self._issue(course.course_id, f"lists {student_id}, who is not enrolled")
+            else:
+                kept.append(student_id)
+            seen.add(student_id)
+        for student_id in sorted(enrolled - seen):
+            self._issue(course.course_id, f"roster is missing enrolled student {student_id}")
+            kept.append(student_id)
+        if self.repair and kept != course.enrolled_students:
+            course.enrolled_students = kept
+
+def check_integrity(university: University, repair: bool = False) -> List[Dict]:
+    """
+    Check, and optionally repair, every cross-reference in a University.
+    
+    Args:
+        university: University object
+        repair: Fix every problem that has a safe repair
+        
+    Returns:
+        One dictionary per problem with 'entity', 'problem' and 'repaired'
+    """
+    return IntegrityChecker(university, repair).check()
\ No newline at end of file
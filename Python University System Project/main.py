@@ -3,25 +3,75 @@
 University Management System - Main Entry Point
 """
 
-from university import University
-from menu import Menu
-from file_handler import FileHandler
+import os
 import sys
 
+def dump_instrumentation(path: str, out=None) -> None:
+    """Write the collected operation timings to a JSON file."""
+    from instrumentation import instrumentation
+    try:
+        instrumentation.dump(path)
+        print(f"✓ Operation timings written to {path}", file=out)
+    except OSError as e:
+        print(f"⚠ Error writing operation timings: {e}", file=out)
+
 def main():
     """Main function to run the University Management System."""
     
-    # Create university instance
-    university = University("Tech University", "123 College Ave, Tech City")
+    # Report startup phase timings
+    if sys.argv[1:] == ['--startup-time']:
+        from startup import report_startup
+        report_startup()
+        return
     
-    # Load existing data
-    try:
-        FileHandler.load_all_data(university)
-        print("✓ Data loaded successfully!")
-    except FileNotFoundError:
-        print("ℹ No existing data found. Starting with empty system.")
-    except Exception as e:
-        print(f"⚠ Error loading data: {e}")
+    # Opt-in operation timings, written to the given file on exit
+    instrumentation_path = os.environ.get('UNIVERSITY_INSTRUMENTATION')
+    if instrumentation_path:
+        from instrumentation import instrumentation
+        instrumentation.enable()
+    
+    # Codec of saved data files (gzip, bz2, lzma or none)
+    compression = os.environ.get('UNIVERSITY_COMPRESSION')
+    if compression is not None:
+        from file_handler import FileHandler
+        from compression import check_codec
+        try:
+            check_codec(compression)
+        except ValueError as e:
+            print(f"⚠ {e}")
+            sys.exit(2)
+        FileHandler.COMPRESSION = compression
+    
+    # Command-line arguments select non-interactive batch mode
+    if len(sys.argv) > 1:
+        import batch
+        status = batch.main(sys.argv[1:])
+        if instrumentation_path:
+            dump_instrumentation(instrumentation_path, sys.stderr)
+        sys.exit(status)
+    
+    # Save in the background once changes settle (UNIVERSITY_AUTOSAVE=0 disables).
+    # Started by the loader thread, which also does the import, and only
+    # after a successful load so a failed one is never saved over the file
+    autosavers = []
+    
+    def start_autosave(loaded) -> None:
+        from autosave import Autosaver
+        try:
+            quiet_period = float(os.environ.get('UNIVERSITY_AUTOSAVE', Autosaver.DEFAULT_QUIET_PERIOD))
+        except ValueError:
+            quiet_period = Autosaver.DEFAULT_QUIET_PERIOD
+        if quiet_period > 0:
+            autosaver = Autosaver(loaded, quiet_period)
+            autosaver.start()
+            autosavers.append(autosaver)
+    
+    # Load existing data in the background while the menu starts
+    from startup import DeferredUniversity
+    university = DeferredUniversity("Tech University", "123 College Ave, Tech City",
+                                    on_loaded=start_autosave)
+    
+    from menu import Menu
     
     # Display welcome message
     print("\n" + "="*50)
@@ -36,13 +86,24 @@ def main():
     except Exception as e:
         print(f"\n⚠ An error occurred: {e}")
     
-    # Save data before exiting
+    # Save data before exiting; unchanged data is not rewritten
+    university.resolve()  # The loader thread has started the autosaver by now
+    for autosaver in autosavers:
+        autosaver.stop()
+    from file_handler import FileHandler, SaveConflictError
     try:
         FileHandler.save_all_data(university)
-        print("\n✓ All data saved successfully!")
+        if not FileHandler.last_save_skipped:
+            print("\n✓ All data saved successfully!")
+    except SaveConflictError:
+        path = FileHandler.save_conflict_copy(university)
+        print(f"\n⚠ Your changes were saved to {path} for manual review.")
     except Exception as e:
         print(f"\n⚠ Error saving data: {e}")
     
+    if instrumentation_path:
+        dump_instrumentation(instrumentation_path)
+    
     print("\nThank you for using University Management System!")
     print("Goodbye!")
 
@@ -0,0 +1,222 @@
+"""
+Memory module for University Management System
+
+Reports where the memory of a loaded University goes: a deep size walk
+(sys.getsizeof over every reachable object, each counted once) broken down
+by entity type, field and Python type, plus the top allocation sites of a
+load and a save measured with tracemalloc.
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Callable, Dict
+from university import University
+from file_handler import FileHandler
+from snapshot import thaw_record
+from compression import decompress
+from utils import write_table
+
+# Shared objects that never belong to the data
+EXCLUDED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+# Collections and the ID field each entity owns
+COLLECTIONS = (('departments', 'department_id'), ('faculty', 'faculty_id'),
+               ('courses', 'course_id'), ('students', 'student_id'))
+
+def _field_pass(name: str, key: str) -> int:
+    """Walk pass of a field: IDs, then other public fields, then caches."""
+    if name == key:
+        return 0
+    return 2 if name.startswith('_') else 1
+
+class SizeWalker:
+    """Deep sys.getsizeof walker that counts every object only once."""
+    
+    def __init__(self):
+        self.seen = set()
+        self.by_type: Dict[str, int] = {}  # type name -> bytes
+    
+    def shallow(self, obj) -> int:
+        """Count a single object without following its references."""
+        if id(obj) in self.seen:
+            return 0
+        self.seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        name = type(obj).__name__
+        self.by_type[name] = self.by_type.get(name, 0) + size
+        return size
+    
+    def deep(self, obj) -> int:
+        """Count an object and everything reachable from it not counted yet."""
+        total = 0
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if id(current) in self.seen or isinstance(current, EXCLUDED_TYPES):
+                continue
+            total += self.shallow(current)
+            stack.extend(gc.get_referents(current))
+        return total
+
+def entity_breakdown(university: University) -> Dict:
+    """
+    Measure the memory held by a University's object graph.
+    
+    Args:
+        university: University to measure
+        
+    Returns:
+        Dictionary with per-collection counts, object overhead and bytes per
+        field, the bytes held by containers and indexes, bytes per Python
+        type and the total
+    """
+    walker = SizeWalker()
+    overhead = {collection: 0 for collection, _ in COLLECTIONS}
+    fields: Dict[str, Dict[str, int]] = {collection: {} for collection, _ in COLLECTIONS}
+    # An object shared between fields is counted under the first one walked,
+    # so ID strings count for the entity that owns them and values shared
+    # with cached snapshot records count as data
+    for walk_pass in range(3):
+        for collection, key in COLLECTIONS:
+            sizes = fields[collection]
+            for entity in getattr(university, collection):
+                state = vars(entity)
+                if walk_pass == 0:
+                    overhead[collection] += walker.shallow(entity) + walker.shallow(state)
+                for name, value in state.items():
+                    if _field_pass(name, key) == walk_pass:
+                        sizes[name] = sizes.get(name, 0) + walker.deep(value)
+    
+    collections = {}
+    for collection, _ in COLLECTIONS:
+        count = len(getattr(university, collection))
+        total = overhead[collection] + sum(fields[collection].values())
+        collections[collection] = {
+            'count': count,
+            'object': overhead[collection],
+            'fields': dict(sorted(fields[collection].items(), key=lambda item: item[1], reverse=True)),
+            'total': total,
+            'per_entity': total / count if count else 0.0
+        }
+    
+    # Entity lists and ID indexes; the entities themselves are already counted
+    containers = sum(walker.deep(getattr(university, collection)) for collection, _ in COLLECTIONS)
+    containers += walker.deep(university._indexes)
+    total = sum(c['total'] for c in collections.values()) + containers
+    return {
+        'collections': collections,
+        'containers': containers,
+        'types': dict(sorted(walker.by_type.items(), key=lambda item: item[1], reverse=True)),
+        'total': total
+    }
+
+def allocation_sites(operation: Callable, limit: int = 10) -> Dict:
+    """
+    Trace the allocations of an operation with tracemalloc.
+    
+    Sites are ranked by the memory they still hold when the operation
+    returns; the peak also covers temporary allocations.
+    
+    Args:
+        operation: Callable to trace; its return value is kept alive until
+                   the allocations have been measured
+        limit: Number of allocation sites to report
+        
+    Returns:
+        Dictionary with the retained and peak bytes and the top sites
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = operation()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+    sites = [{'site': f"{os.path.basename(diff.traceback[0].filename)}:{diff.traceback[0].lineno}",
+              'size': diff.size_diff, 'count': diff.count_diff}
+             for diff in differences[:limit] if diff.size_diff > 0]
+    return {'retained': current - start_size, 'peak': peak - start_size, 'sites': sites}
+
+def _load_from_file() -> University:
+    """Parse the data file and build a new University, like an uncached load."""
+    with open(FileHandler.UNIVERSITY_FILE, 'rb') as f:
+        data = json.loads(decompress(f.read()))
+    university = University()
+    university.load_all_data(data)
+    return university
+
+def _serialize(university: University) -> None:
+    """Snapshot and serialize the university like a save, writing nothing."""
+    with open(os.devnull, 'w') as f:
+        json.dump(university.snapshot().get_all_data(), f, indent=2, default=thaw_record)
+
+def memory_report(university: University, trace: bool = True, limit: int = 10) -> Dict:
+    """
+    Build a memory report for a loaded University.
+    
+    Args:
+        university: University to measure
+        trace: Also trace the allocations of a load and a save
+        limit: Number of allocation sites per traced operation
+        
+    Returns:
+        Report dictionary with 'entities' and, when traced, 'load' and 'save'
+    """
+    report = {'entities': entity_breakdown(university)}
+    if trace:
+        # The load is traced from the data file into a separate University and
+        # the save writes to os.devnull, so neither touches the loaded state
+        if os.path.exists(FileHandler.UNIVERSITY_FILE):
+            report['load'] = allocation_sites(_load_from_file, limit)
+        report['save'] = allocation_sites(lambda: _serialize(university), limit)
+    return report
+
+def _kib(size: float) -> str:
+    return f"{size / 1024:,.1f}"
+
+def print_memory_report(report: Dict) -> None:
+    """Print a memory report built by memory_report()."""
+    entities = report['entities']
+    print("\nMEMORY BY ENTITY TYPE (KiB)")
+    write_table(["Collection", "Count", "Objects", "Fields", "Total", "Bytes/entity"],
+                [(name, c['count'], _kib(c['object']), _kib(c['total'] - c['object']),
+                  _kib(c['total']), f"{c['per_entity']:,.0f}")
+                 for name, c in entities['collections'].items()] +
+                [("containers", "", "", "", _kib(entities['containers']), ""),
+                 ("total", "", "", "", _kib(entities['total']), "")],
+                col_widths=[12, 8, 10, 10, 10, 12])
+    
+    print("\nMEMORY BY FIELD (KiB)")
+    write_table(["Collection", "Field", "Size"],
+                ((name, field, _kib(size))
+                 for name, c in entities['collections'].items()
+                 for field, size in c['fields'].items()),
+                col_widths=[12, 24, 10])
+    
+    print("\nMEMORY BY PYTHON TYPE (KiB)")
+    write_table(["Type", "Size"], ((name, _kib(size)) for name, size in entities['types'].items()),
+                col_widths=[24, 10])
+    
+    for operation in ('load', 'save'):
+        traced = report.get(operation)
+        if traced is None:
+            continue
+        print(f"\nTOP ALLOCATION SITES DURING {operation.upper()} "
+              f"(retained {_kib(traced['retained'])} KiB, peak {_kib(traced['peak'])} KiB)")
+        write_table(["Site", "KiB", "Blocks"],
+                    ((site['site'], _kib(site['size']), site['count']) for site in traced['sites']),
+                    col_widths=[None, 10, 8])
\ No newline at end of file
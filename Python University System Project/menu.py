@@ -8,11 +8,23 @@ from student import Student
 from faculty import Faculty
 from course import Course
 from department import Department
+from fulltext import ID_KEYS
+from pager import Pager
+from utils import write_table
+from file_handler import FileHandler
 import sys
 
 class Menu:
     """Handles the menu interface for the University Management System."""
     
+    PAGE_SIZE = 20  # Rows per page in list views
+    
+    @staticmethod
+    def reload_changes(university: University) -> None:
+        """Pick up data saved by another process since the last menu choice."""
+        if FileHandler.reload_if_changed(university):
+            print(f"ℹ Loaded changes saved by another process to {FileHandler.UNIVERSITY_FILE}")
+    
     @staticmethod
     def display_main_menu(university: University) -> None:
         """Display the main menu and handle user input."""
@@ -32,6 +44,7 @@ class Menu:
             print("="*50)
             
             choice = input("\nEnter your choice (0-8): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -75,6 +88,7 @@ class Menu:
             print("="*50)
             
             choice = input("\nEnter your choice (0-8): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -160,18 +174,25 @@ class Menu:
             print("\nNo students found in the system.")
             return
         
-        print("\n" + "="*80)
-        print("ALL STUDENTS")
-        print("="*80)
-        print(f"{'ID':<10} {'Name':<20} {'Age':<5} {'Gender':<8} {'Department':<15} {'GPA':<6}")
-        print("-"*80)
-        
-        for student in university.students:
-            print(f"{student.student_id:<10} {student.name:<20} {student.age:<5} "
-                  f"{student.gender:<8} {student.department:<15} {student.gpa:<6.2f}")
+        columns = [
+            ('ID', 10, lambda s: s.student_id),
+            ('Name', 20, lambda s: s.name),
+            ('Age', 5, lambda s: s.age),
+            ('Gender', 8, lambda s: s.gender),
+            ('Department', 15, lambda s: s.department),
+            ('GPA', 6, lambda s: f"{s.gpa:.2f}")
+        ]
+        sort_options = {
+            'id': (lambda s: s.student_id, False),
+            'name': (lambda s: s.name.lower(), False),
+            'gpa': (lambda s: s.gpa, True),
+            'age': (lambda s: s.age, False)
+        }
         
-        print("="*80)
-        print(f"Total Students: {len(university.students)}")
+        Pager(lambda: university.students, Menu.PAGE_SIZE).browse(
+            "ALL STUDENTS", columns, sort_options,
+            lambda s: f"{s.student_id} {s.name} {s.department}".lower(),
+            total=len(university.students))
     
     @staticmethod
     def search_student_by_id(university: University) -> None:
@@ -201,25 +222,27 @@ class Menu:
         print("Leave field blank to keep current value.")
         
         try:
+            changes = {}
             name = input(f"New Name [{student.name}]: ").strip()
             if name:
-                student.name = name
+                changes['name'] = name
             
             age_str = input(f"New Age [{student.age}]: ").strip()
             if age_str:
                 if not age_str.isdigit() or int(age_str) <= 0:
                     print("⚠ Invalid age! Age must be a positive number.")
                     return
-                student.age = int(age_str)
+                changes['age'] = int(age_str)
             
             gender = input(f"New Gender [{student.gender}]: ").strip()
             if gender:
-                student.gender = gender
+                changes['gender'] = gender
             
             department = input(f"New Department [{student.department}]: ").strip()
             if department:
-                student.department = department
+                changes['department'] = department
             
+            university.update_student(student_id, **changes)
             print(f"✓ Student {student_id} updated successfully!")
         
         except Exception as e:
@@ -296,13 +319,10 @@ class Menu:
         print(f"\n" + "="*80)
         print(f"STUDENTS SORTED BY GPA ({order_text})")
         print("="*80)
-        print(f"{'ID':<10} {'Name':<20} {'Department':<15} {'GPA':<6} {'Courses':<10}")
-        print("-"*80)
-        
-        for student in sorted_students:
-            print(f"{student.student_id:<10} {student.name:<20} "
-                  f"{student.department:<15} {student.gpa:<6.2f} "
-                  f"{len(student.course_grades):<10}")
+        write_table(['ID', 'Name', 'Department', 'GPA', 'Courses'],
+                    ((s.student_id, s.name, s.department, f"{s.gpa:.2f}", len(s.course_grades))
+                     for s in sorted_students),
+                    col_widths=[10, 20, 15, 6, 10], separator=" ")
     
     @staticmethod
     def display_faculty_menu(university: University) -> None:
@@ -321,6 +341,7 @@ class Menu:
             print("="*50)
             
             choice = input("\nEnter your choice (0-6): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -392,18 +413,22 @@ class Menu:
             print("\nNo faculty members found in the system.")
             return
         
-        print("\n" + "="*70)
-        print("ALL FACULTY MEMBERS")
-        print("="*70)
-        print(f"{'ID':<10} {'Name':<20} {'Department':<15} {'Courses':<10}")
-        print("-"*70)
+        columns = [
+            ('ID', 10, lambda f: f.faculty_id),
+            ('Name', 20, lambda f: f.name),
+            ('Department', 15, lambda f: f.department),
+            ('Courses', 10, lambda f: len(f.courses_taught))
+        ]
+        sort_options = {
+            'id': (lambda f: f.faculty_id, False),
+            'name': (lambda f: f.name.lower(), False),
+            'courses': (lambda f: len(f.courses_taught), True)
+        }
         
-        for faculty in university.faculty:
-            print(f"{faculty.faculty_id:<10} {faculty.name:<20} "
-                  f"{faculty.department:<15} {len(faculty.courses_taught):<10}")
-        
-        print("="*70)
-        print(f"Total Faculty: {len(university.faculty)}")
+        Pager(lambda: university.faculty, Menu.PAGE_SIZE).browse(
+            "ALL FACULTY MEMBERS", columns, sort_options,
+            lambda f: f"{f.faculty_id} {f.name} {f.department}".lower(),
+            total=len(university.faculty))
     
     @staticmethod
     def search_faculty_by_id(university: University) -> None:
@@ -432,10 +457,13 @@ class Menu:
             print("5. Delete Course")
             print("6. Assign Faculty to Course")
             print("7. Enroll Student in Course")
+            print("8. Set Course Capacity")
+            print("9. View Course Waitlist")
             print("0. Back to Main Menu")
             print("="*50)
             
-            choice = input("\nEnter your choice (0-7): ").strip()
+            choice = input("\nEnter your choice (0-9): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -453,6 +481,10 @@ class Menu:
                 Menu.assign_faculty_to_course_menu(university)
             elif choice == '7':
                 Menu.enroll_student_in_course_menu(university)
+            elif choice == '8':
+                Menu.set_course_capacity(university)
+            elif choice == '9':
+                Menu.view_course_waitlist(university)
             else:
                 print("⚠ Invalid choice! Please try again.")
             
@@ -490,13 +522,11 @@ class Menu:
             # Create new course
             course = Course(course_id, name, credit_hours)
             
-            # Add to department
             dept_id = input("Enter Department ID for this course: ").strip().upper()
-            department = university.find_department(dept_id)
-            if department:
-                department.add_course(course_id)
             
             if university.add_course(course):
+                # Add to department
+                university.add_course_to_department(dept_id, course_id)
                 print(f"✓ Course {name} added successfully!")
             else:
                 print("⚠ Failed to add course!")
@@ -513,19 +543,23 @@ class Menu:
             print("\nNo courses found in the system.")
             return
         
-        print("\n" + "="*90)
-        print("ALL COURSES")
-        print("="*90)
-        print(f"{'ID':<10} {'Name':<25} {'Credits':<8} {'Faculty':<12} {'Students':<10}")
-        print("-"*90)
-        
-        for course in university.courses:
-            print(f"{course.course_id:<10} {course.name:<25} "
-                  f"{course.credit_hours:<8} {course.assigned_faculty if course.assigned_faculty else 'None':<12} "
-                  f"{len(course.enrolled_students):<10}")
+        columns = [
+            ('ID', 10, lambda c: c.course_id),
+            ('Name', 25, lambda c: c.name),
+            ('Credits', 8, lambda c: c.credit_hours),
+            ('Faculty', 12, lambda c: c.assigned_faculty if c.assigned_faculty else 'None'),
+            ('Students', 10, lambda c: len(c.enrolled_students))
+        ]
+        sort_options = {
+            'id': (lambda c: c.course_id, False),
+            'name': (lambda c: c.name.lower(), False),
+            'students': (lambda c: len(c.enrolled_students), True)
+        }
         
-        print("="*90)
-        print(f"Total Courses: {len(university.courses)}")
+        Pager(lambda: university.courses, Menu.PAGE_SIZE).browse(
+            "ALL COURSES", columns, sort_options,
+            lambda c: f"{c.course_id} {c.name} {c.assigned_faculty}".lower(),
+            total=len(university.courses))
     
     @staticmethod
     def assign_faculty_to_course_menu(university: University) -> None:
@@ -546,9 +580,67 @@ class Menu:
         
         if university.enroll_student_in_course(student_id, course_id):
             print(f"✓ Student {student_id} enrolled in course {course_id} successfully!")
+            return
+        
+        course = university.find_course(course_id)
+        if course and course.is_full() and university.find_student(student_id):
+            confirm = input(f"Course {course_id} is full. Join the waitlist? (yes/no): ").strip().lower()
+            if confirm == 'yes' and university.join_waitlist(student_id, course_id):
+                position = course.waitlist.position(student_id)
+                print(f"✓ Student {student_id} added to the waitlist (position {position}).")
+            elif confirm == 'yes':
+                print("⚠ Failed to join waitlist! Student may already be enrolled or waiting.")
         else:
             print("⚠ Failed to enroll student in course! Check if both exist.")
     
+    @staticmethod
+    def drop_student_from_course_menu(university: University) -> None:
+        """Drop a student from a course or its waitlist."""
+        student_id = input("Enter Student ID: ").strip()
+        course_id = input("Enter Course ID: ").strip()
+        
+        if university.drop_student_from_course(student_id, course_id):
+            print(f"✓ Student {student_id} dropped from course {course_id} successfully!")
+        else:
+            print("⚠ Failed to drop student! Check if the student is enrolled or waiting.")
+    
+    @staticmethod
+    def set_course_capacity(university: University) -> None:
+        """Set the capacity of a course."""
+        course_id = input("Enter Course ID: ").strip()
+        capacity = input("Enter Capacity (0 for unlimited): ").strip()
+        
+        if not capacity.isdigit():
+            print("⚠ Capacity must be a non-negative number!")
+            return
+        
+        if university.set_course_capacity(course_id, int(capacity)):
+            print(f"✓ Capacity of course {course_id} set to {capacity}!")
+        else:
+            print(f"⚠ Course with ID {course_id} not found!")
+    
+    @staticmethod
+    def view_course_waitlist(university: University) -> None:
+        """View the waitlist of a course."""
+        course_id = input("Enter Course ID: ").strip()
+        
+        course = university.find_course(course_id)
+        if not course:
+            print(f"⚠ Course with ID {course_id} not found!")
+            return
+        
+        waiting = course.waitlist.get_ordered()
+        if not waiting:
+            print(f"\nNo students waiting for course {course_id}.")
+            return
+        
+        print(f"\nWAITLIST - {course_id} ({course.waitlist.policy} priority)")
+        print("="*40)
+        write_table(['Position', 'Student ID', 'Name'],
+                    ((position, student_id, getattr(university.find_student(student_id), 'name', '?'))
+                     for position, student_id in enumerate(waiting, 1)),
+                    col_widths=[8, 10, 20], separator=" ")
+    
     @staticmethod
     def display_department_menu(university: University) -> None:
         """Display department management menu."""
@@ -566,6 +658,7 @@ class Menu:
             print("="*50)
             
             choice = input("\nEnter your choice (0-6): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -629,19 +722,22 @@ class Menu:
             print("\nNo departments found in the system.")
             return
         
-        print("\n" + "="*70)
-        print("ALL DEPARTMENTS")
-        print("="*70)
-        print(f"{'ID':<8} {'Name':<25} {'Head':<12} {'Courses':<10}")
-        print("-"*70)
-        
-        for department in university.departments:
-            print(f"{department.department_id:<8} {department.name:<25} "
-                  f"{department.head_of_department if department.head_of_department else 'None':<12} "
-                  f"{len(department.courses_offered):<10}")
+        columns = [
+            ('ID', 8, lambda d: d.department_id),
+            ('Name', 25, lambda d: d.name),
+            ('Head', 12, lambda d: d.head_of_department if d.head_of_department else 'None'),
+            ('Courses', 10, lambda d: len(d.courses_offered))
+        ]
+        sort_options = {
+            'id': (lambda d: d.department_id, False),
+            'name': (lambda d: d.name.lower(), False),
+            'courses': (lambda d: len(d.courses_offered), True)
+        }
         
-        print("="*70)
-        print(f"Total Departments: {len(university.departments)}")
+        Pager(lambda: university.departments, Menu.PAGE_SIZE).browse(
+            "ALL DEPARTMENTS", columns, sort_options,
+            lambda d: f"{d.department_id} {d.name}".lower(),
+            total=len(university.departments))
     
     @staticmethod
     def set_head_of_department(university: University) -> None:
@@ -660,7 +756,7 @@ class Menu:
             print(f"⚠ Faculty {faculty_id} not found!")
             return
         
-        if department.set_head_of_department(faculty_id):
+        if university.update_department(department_id, head_of_department=faculty_id):
             print(f"✓ {faculty.name} set as head of {department.name} department!")
         else:
             print("⚠ Failed to set head of department!")
@@ -677,10 +773,15 @@ class Menu:
             print("3. Assign Grade to Student")
             print("4. Set Head of Department")
             print("5. Calculate All GPAs")
+            print("6. Schedule Exam Slots")
+            print("7. Drop Student from Course")
+            print("8. Instrumentation")
+            print("9. Memory Report")
             print("0. Back to Main Menu")
             print("="*50)
             
-            choice = input("\nEnter your choice (0-5): ").strip()
+            choice = input("\nEnter your choice (0-9): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -695,11 +796,70 @@ class Menu:
             elif choice == '5':
                 university.get_average_gpa()
                 print("✓ All GPAs calculated!")
+            elif choice == '6':
+                Menu.schedule_exam_slots(university)
+            elif choice == '7':
+                Menu.drop_student_from_course_menu(university)
+            elif choice == '8':
+                Menu.instrumentation_screen(university)
+            elif choice == '9':
+                Menu.memory_report(university)
             else:
                 print("⚠ Invalid choice! Please try again.")
             
             input("\nPress Enter to continue...")
     
+    @staticmethod
+    def instrumentation_screen(university: University) -> None:
+        """Show operation timings and toggle instrumentation."""
+        from instrumentation import instrumentation
+        
+        status = "enabled" if instrumentation.enabled else "disabled"
+        print(f"\nInstrumentation is {status}.")
+        rows = instrumentation.rows()
+        if rows:
+            print()
+            write_table(["Operation", "Calls", "Total ms", "p50 µs", "p95 µs", "p99 µs", "Est. scanned/call"],
+                        rows, col_widths=[None, 8, 10, 10, 10, 10, 17])
+        else:
+            print("ℹ No operations recorded yet.")
+        
+        action = input("\n[E]nable, [D]isable, [R]eset, [S]ave JSON or Enter to return: ").strip().lower()
+        if action == 'e':
+            instrumentation.enable()
+            print("✓ Instrumentation enabled!")
+        elif action == 'd':
+            instrumentation.disable()
+            print("✓ Instrumentation disabled!")
+        elif action == 'r':
+            instrumentation.reset()
+            print("✓ Statistics reset!")
+        elif action == 's':
+            path = input("Output file [instrumentation.json]: ").strip() or "instrumentation.json"
+            try:
+                instrumentation.dump(path)
+                print(f"✓ Statistics written to {path}")
+            except OSError as e:
+                print(f"⚠ Error writing statistics: {e}")
+    
+    @staticmethod
+    def memory_report(university: University) -> None:
+        """Show memory use by entity type and field."""
+        from memory import memory_report, print_memory_report
+        
+        trace = input("Also trace allocations of a load and a save? (y/N): ").strip().lower() == 'y'
+        print_memory_report(memory_report(university, trace=trace))
+    
+    @staticmethod
+    def schedule_exam_slots(university: University) -> None:
+        """Assign conflict-free exam slots from co-enrollments."""
+        max_slots = input("Maximum number of slots (blank for no limit): ").strip()
+        if max_slots and (not max_slots.isdigit() or int(max_slots) <= 0):
+            print("⚠ Number of slots must be a positive number!")
+            return
+        
+        university.coenrollment.display_exam_schedule(int(max_slots) if max_slots else None)
+    
     @staticmethod
     def display_search_menu(university: University) -> None:
         """Display search operations menu."""
@@ -710,10 +870,15 @@ class Menu:
             print("1. Search Students by Name")
             print("2. Search Faculty by Name")
             print("3. Search Courses by Name")
+            print("4. Advanced Student Query")
+            print("5. Students Shared Between Courses")
+            print("6. Search Cache Statistics")
+            print("7. Global Search")
             print("0. Back to Main Menu")
             print("="*50)
             
-            choice = input("\nEnter your choice (0-3): ").strip()
+            choice = input("\nEnter your choice (0-7): ").strip()
+            Menu.reload_changes(university)
             
             if choice == '0':
                 break
@@ -723,11 +888,58 @@ class Menu:
                 Menu.search_faculty_by_name(university)
             elif choice == '3':
                 Menu.search_courses_by_name(university)
+            elif choice == '4':
+                Menu.advanced_student_query(university)
+            elif choice == '5':
+                Menu.students_shared_between_courses(university)
+            elif choice == '6':
+                Menu.search_cache_statistics(university)
+            elif choice == '7':
+                Menu.global_search(university)
             else:
                 print("⚠ Invalid choice! Please try again.")
             
             input("\nPress Enter to continue...")
     
+    @staticmethod
+    def search_cache_statistics(university: University) -> None:
+        """Display hit/miss statistics of the search result cache."""
+        stats = university.search_cache.stats()
+        print("\n" + "="*50)
+        print("SEARCH CACHE STATISTICS")
+        print("="*50)
+        print(f"Cached queries: {stats['entries']} of {stats['capacity']}")
+        print(f"Hits: {stats['hits']}")
+        print(f"Misses: {stats['misses']}")
+        print(f"Hit rate: {stats['hit_rate']:.1%}")
+        print(f"Evictions: {stats['evictions']}")
+        print(f"Invalidations: {stats['invalidations']}")
+    
+    @staticmethod
+    def global_search(university: University) -> None:
+        """Search students, faculty, courses and departments at once."""
+        query = input("Search for: ").strip()
+        if not query:
+            print("⚠ Enter something to search for!")
+            return
+        types = input("Limit to (students, faculty, courses, departments; blank for all): ").strip().lower()
+        
+        try:
+            results = university.search_all(query, types.replace(',', ' ').split() or None)
+        except ValueError as e:
+            print(f"⚠ {e}")
+            return
+        
+        if not results:
+            print(f"No matches found for '{query}'")
+            return
+        
+        print(f"\nTop {len(results)} match(es):")
+        print("="*70)
+        write_table(['Type', 'ID', 'Name', 'Score'],
+                    ((c, getattr(e, ID_KEYS[c]), e.name, f"{score:.2f}") for c, e, score in results),
+                    col_widths=[12, 10, 35, 6], separator=" ")
+    
     @staticmethod
     def search_students_by_name(university: University) -> None:
         """Search students by name."""
@@ -741,12 +953,7 @@ class Menu:
         
         print(f"\nFound {len(results)} student(s):")
         print("="*70)
-        print(f"{'ID':<10} {'Name':<20} {'Department':<15} {'GPA':<6}")
-        print("-"*70)
-        
-        for student in results:
-            print(f"{student.student_id:<10} {student.name:<20} "
-                  f"{student.department:<15} {student.gpa:<6.2f}")
+        Menu._write_student_rows(results)
     
     @staticmethod
     def search_faculty_by_name(university: University) -> None:
@@ -761,11 +968,9 @@ class Menu:
         
         print(f"\nFound {len(results)} faculty member(s):")
         print("="*60)
-        print(f"{'ID':<10} {'Name':<20} {'Department':<15}")
-        print("-"*60)
-        
-        for faculty in results:
-            print(f"{faculty.faculty_id:<10} {faculty.name:<20} {faculty.department:<15}")
+        write_table(['ID', 'Name', 'Department'],
+                    ((f.faculty_id, f.name, f.department) for f in results),
+                    col_widths=[10, 20, 15], separator=" ")
     
     @staticmethod
     def search_courses_by_name(university: University) -> None:
@@ -780,13 +985,105 @@ class Menu:
         
         print(f"\nFound {len(results)} course(s):")
         print("="*80)
-        print(f"{'ID':<10} {'Name':<25} {'Credits':<8} {'Faculty':<12} {'Students':<10}")
-        print("-"*80)
+        write_table(['ID', 'Name', 'Credits', 'Faculty', 'Students'],
+                    ((c.course_id, c.name, c.credit_hours, c.assigned_faculty or 'None',
+                      len(c.enrolled_students)) for c in results),
+                    col_widths=[10, 25, 8, 12, 10], separator=" ")
+    
+    @staticmethod
+    def advanced_student_query(university: University) -> None:
+        """Query students with combined filters."""
+        from query import Query
+        
+        print("Leave a filter blank to skip it.")
+        query = Query(university, 'students')
+        
+        try:
+            department = input("Department ID: ").strip().upper()
+            if department:
+                query.department(department)
+            
+            gender = input("Gender: ").strip()
+            if gender:
+                query.gender(gender)
+            
+            course_id = input("Enrolled in Course ID: ").strip().upper()
+            if course_id:
+                query.enrolled_in(course_id)
+            
+            name = input("Name contains: ").strip()
+            if name:
+                query.name_contains(name)
+            
+            min_age, max_age = input("Age range (min-max): ").strip(), ''
+            if min_age:
+                min_age, _, max_age = min_age.partition('-')
+                query.age_between(int(min_age) if min_age.strip() else None,
+                                  int(max_age) if max_age.strip() else None)
+            
+            min_gpa, max_gpa = input("GPA range (min-max): ").strip(), ''
+            if min_gpa:
+                min_gpa, _, max_gpa = min_gpa.partition('-')
+                query.gpa_between(float(min_gpa) if min_gpa.strip() else None,
+                                  float(max_gpa) if max_gpa.strip() else None)
+            
+            sort_field = input("Sort by (gpa/name/age, blank for none): ").strip().lower()
+            if sort_field in ('gpa', 'name', 'age'):
+                query.order_by(sort_field, descending=(sort_field == 'gpa'))
+            
+            limit = input("Maximum rows (blank for all): ").strip()
+            if limit:
+                query.limit(int(limit))
+        except ValueError as e:
+            print(f"⚠ Invalid filter: {e}")
+            return
+        
+        result = query.execute()
+        print("\nQUERY PLAN")
+        print("-"*50)
+        print(query.explain())
+        
+        if not result.rows:
+            print("\nNo students matched the query.")
+            return
         
-        for course in results:
-            print(f"{course.course_id:<10} {course.name:<25} "
-                  f"{course.credit_hours:<8} {course.assigned_faculty if course.assigned_faculty else 'None':<12} "
-                  f"{len(course.enrolled_students):<10}")
+        print(f"\nFound {len(result)} student(s):")
+        print("="*70)
+        Menu._write_student_rows(result)
+    
+    @staticmethod
+    def students_shared_between_courses(university: University) -> None:
+        """List students enrolled in all (or any) of several courses."""
+        course_ids = input("Course IDs (separated by spaces): ").strip().upper().split()
+        if not course_ids:
+            print("⚠ Enter at least one course ID!")
+            return
+        
+        unknown = [c for c in course_ids if not university.find_course(c)]
+        if unknown:
+            print(f"⚠ Course(s) not found: {', '.join(unknown)}")
+            return
+        
+        match_any = input("Match students in [A]ll or a[N]y of the courses? (A/n): ").strip().lower() == 'n'
+        if match_any:
+            student_ids = university.students_in_any_course(course_ids)
+        else:
+            student_ids = university.students_in_all_courses(course_ids)
+        
+        if not student_ids:
+            print("No students matched.")
+            return
+        
+        print(f"\nFound {len(student_ids)} student(s):")
+        print("="*70)
+        Menu._write_student_rows(s for s in map(university.find_student, student_ids) if s)
+    
+    @staticmethod
+    def _write_student_rows(students) -> None:
+        """Write the ID/Name/Department/GPA table used by student searches."""
+        write_table(['ID', 'Name', 'Department', 'GPA'],
+                    ((s.student_id, s.name, s.department, f"{s.gpa:.2f}") for s in students),
+                    col_widths=[10, 20, 15, 6], separator=" ")
     
     @staticmethod
     def generate_sample_data(university: University) -> None:
@@ -795,12 +1092,24 @@ class Menu:
         print("GENERATING SAMPLE DATA")
         print("="*50)
         
+        size = input("Number of students (blank for the small fixed sample): ").strip()
+        if size:
+            from generator import SyntheticUniversity
+            
+            seed = input("Random seed (blank for 0): ").strip()
+            try:
+                SyntheticUniversity(int(size), int(seed) if seed else 0).populate(university)
+            except ValueError as e:
+                print(f"⚠ Error generating sample data: {e}")
+                return
+            
+            print("✓ Synthetic data generated")
+            university.display_university_info()
+            return
+        
         try:
             # Clear existing data first
-            university.departments.clear()
-            university.faculty.clear()
-            university.students.clear()
-            university.courses.clear()
+            university.clear()
             
             # Add sample departments
             departments = [
@@ -832,10 +1141,10 @@ class Menu:
             print("✓ Sample faculty added")
             
             # Set heads of departments
-            university.find_department("CSE").set_head_of_department("F0001")
-            university.find_department("EEE").set_head_of_department("F0003")
-            university.find_department("MAT").set_head_of_department("F0004")
-            university.find_department("PHY").set_head_of_department("F0005")
+            university.update_department("CSE", head_of_department="F0001")
+            university.update_department("EEE", head_of_department="F0003")
+            university.update_department("MAT", head_of_department="F0004")
+            university.update_department("PHY", head_of_department="F0005")
             
             # Add sample courses
             courses = [
@@ -854,9 +1163,7 @@ class Menu:
                 university.add_course(course)
                 
                 # Add to department
-                department = university.find_department(dept)
-                if department:
-                    department.add_course(course_id)
+                university.add_course_to_department(dept, course_id)
             
             print("✓ Sample courses added")
             
@@ -928,6 +1235,6 @@ class Menu:
             
             # Display statistics
             university.display_university_info()
-            
+        
         except Exception as e:
             print(f"⚠ Error generating sample data: {e}")
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Pager module for University Management System
+
+Shows large collections one page at a time. Rows are pulled lazily from the
+source iterable, so the first page of a long list renders immediately and
+filtering or sorting never copies the whole collection.
+"""
+
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from utils import write_table
+
+Column = Tuple[str, int, Callable[[Any], Any]]  # (header, width, value getter)
+
+class Pager:
+    """Lazily paginates, filters and sorts an iterable of entities."""
+    
+    def __init__(self, source: Callable[[], Iterable], page_size: int = 20):
+        """
+        Initialize the pager.
+        
+        Args:
+            source: Callable returning a fresh iterable of rows on each call
+            page_size: Rows per page
+        """
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        
+        self.source = source
+        self.page_size = page_size
+        self.filter_func: Optional[Callable[[Any], bool]] = None
+        self.sort_key: Optional[Callable[[Any], Any]] = None
+        self.descending = False
+    
+    def set_filter(self, filter_func: Optional[Callable[[Any], bool]]) -> None:
+        """Set (or clear with None) the row filter."""
+        self.filter_func = filter_func
+    
+    def set_sort(self, sort_key: Optional[Callable[[Any], Any]], descending: bool = False) -> None:
+        """Set (or clear with None) the sort key."""
+        self.sort_key = sort_key
+        self.descending = descending
+    
+    def _rows(self) -> Iterable:
+        rows = self.source()
+        if self.filter_func is not None:
+            rows = filter(self.filter_func, rows)
+        return rows
+    
+    def get_page(self, page: int) -> Tuple[List, bool]:
+        """
+        Get one page of rows.
+        
+        Unsorted pages stop reading the source right after the page; sorted
+        pages keep only the top (page + 1) * page_size rows in a heap.
+        
+        Args:
+            page: Page number (0-based)
+            
+        Returns:
+            Tuple of (rows on the page, whether a later page exists)
+        """
+        start = page * self.page_size
+        end = start + self.page_size
+        
+        if self.sort_key is None:
+            rows = list(islice(self._rows(), start, end + 1))
+        else:
+            select = heapq.nlargest if self.descending else heapq.nsmallest
+            rows = select(end + 1, self._rows(), key=self.sort_key)[start:]
+        
+        return rows[:self.page_size], len(rows) > self.page_size
+    
+    def browse(self, title: str, columns: List[Column],
+               sort_options: Dict[str, Tuple[Callable[[Any], Any], bool]] = None,
+               search_text: Callable[[Any], str] = None, total: int = None) -> None:
+        """
+        Interactively browse pages until the user quits.
+        
+        Args:
+            title: Heading printed above each page
+            columns: Column definitions (header, width, value getter)
+            sort_options: Sort name -> (key function, descending)
+            search_text: Function giving the text a row is filtered on
+            total: Number of rows in the unfiltered source, if known
+        """
+        sort_options = sort_options or {}
+        page = 0
+        filter_text = ""
+        
+        while True:
+            rows, has_next = self.get_page(page)
+            if not rows and page > 0:
+                print("⚠ No rows on that page.")
+                page = 0
+                continue
+            
+            self.render_page(title, columns, rows, page, has_next, total, filter_text)
+            
+            commands = ["[n]ext", "[p]rev", "[j]ump <page>"]
+            if sort_options:
+                commands.append(f"[s]ort <{'/'.join(sort_options)}>")
+            if search_text:
+                commands.append("[f]ilter <text>")
+            commands.append("[q]uit")
+            choice = input(f"\n{' '.join(commands)}: ").strip()
+            command, _, argument = choice.partition(' ')
+            command = command.lower()
+            argument = argument.strip()
+            
+            if command in ('q', ''):
+                break
+            elif command == 'n':
+                if has_next:
+                    page += 1
+                else:
+                    print("⚠ Already on the last page.")
+            elif command == 'p':
+                page = max(0, page - 1)
+            elif command == 'j' and argument.isdigit() and int(argument) > 0:
+                page = int(argument) - 1
+            elif command == 's' and argument.lower() in sort_options:
+                key, descending = sort_options[argument.lower()]
+                self.set_sort(key, descending)
+                page = 0
+            elif command == 'f' and search_text:
+                filter_text = argument.lower()
+                self.set_filter((lambda row: filter_text in search_text(row))
+                                if filter_text else None)
+                page = 0
+            else:
+                print("⚠ Invalid command!")
+    
+    def render_page(self, title: str, columns: List[Column], rows: List, page: int,
+                    has_next: bool, total: int = None, filter_text: str = "") -> None:
+        """Print one page of rows."""
+        width = sum(w for _, w, _ in columns) + len(columns) - 1
+        print("\n" + "="*width)
+        print(title)
+        print("="*width)
+        write_table([header for header, _, _ in columns],
+                    ([getter(row) for _, _, getter in columns] for row in rows),
+                    col_widths=[w for _, w, _ in columns], separator=" ")
+        print("="*width)
+        first = page * self.page_size + 1
+        status = f"Page {page + 1}  Rows {first}-{first + len(rows) - 1}" if rows else f"Page {page + 1}"
+        if total is not None:
+            status += f" of {total}" if not filter_text else f" (filter '{filter_text}', {total} total)"
+        if has_next:
+            status += "  (more)"
+        print(status)
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+Query module for University Management System
+
+Composable queries over a University. Each query picks the cheapest access
+path available for its filters (ID lookup, course roster, department index,
+GPA index, name trigram index or full scan), applies the remaining filters
+to the candidates and reports the plan it chose.
+"""
+
+import heapq
+import weakref
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class QueryIndexes:
+    """Secondary indexes over one University, rebuilt lazily after mutations."""
+    
+    def __init__(self, university):
+        """
+        Initialize the index set.
+        
+        Args:
+            university: University object to index
+        """
+        self.university = university
+        self.version = university.version
+        self._indexes: Dict[Tuple[str, str], Any] = {}
+    
+    def _get(self, collection: str, kind: str, build: Callable) -> Any:
+        """Get an index, discarding all indexes if the university changed."""
+        if self.version != self.university.version:
+            self._indexes.clear()
+            self.version = self.university.version
+        key = (collection, kind)
+        if key not in self._indexes:
+            self._indexes[key] = build(getattr(self.university, collection))
+        return self._indexes[key]
+    
+    def department(self, collection: str) -> Dict[str, List]:
+        """Department ID -> entities."""
+        def build(entities):
+            index: Dict[str, List] = {}
+            for entity in entities:
+                index.setdefault(entity.department, []).append(entity)
+            return index
+        return self._get(collection, 'department', build)
+    
+    def gpa(self) -> Tuple[List[float], List]:
+        """Students sorted by GPA, as parallel (keys, students) lists."""
+        def build(students):
+            ordered = sorted(students, key=lambda s: s.gpa)
+            return [s.gpa for s in ordered], ordered
+        return self._get('students', 'gpa', build)
+    
+    def name_trigrams(self, collection: str) -> Dict[str, List]:
+        """Lower-case name trigram -> entities containing it."""
+        def build(entities):
+            index: Dict[str, List] = {}
+            for entity in entities:
+                for trigram in set(_trigrams(entity.name.lower())):
+                    index.setdefault(trigram, []).append(entity)
+            return index
+        return self._get(collection, 'trigrams', build)
+
+_index_cache: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+def get_indexes(university) -> QueryIndexes:
+    """Get the shared QueryIndexes for a university."""
+    indexes = _index_cache.get(university)
+    if indexes is None:
+        indexes = QueryIndexes(university)
+        _index_cache[university] = indexes
+    return indexes
+
+def _trigrams(text: str) -> List[str]:
+    return [text[i:i + 3] for i in range(len(text) - 2)]
+
+class QueryResult:
+    """Rows returned by a query together with the plan used."""
+    
+    def __init__(self, rows: List, plan: Dict):
+        self.rows = rows
+        self.plan = plan
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
+class Query:
+    """Composable query over students, faculty or courses.
+    
+    Example:
+        Query(university).department('CSE').gpa_between(3.0, 4.0) \\
+            .order_by('gpa', descending=True).limit(10).execute()
+    """
+    
+    COLLECTIONS = {
+        'students': 'student_id',
+        'faculty': 'faculty_id',
+        'courses': 'course_id'
+    }
+    
+    FILTERS = {
+        'students': {'id', 'department', 'age', 'gpa', 'gender', 'course', 'name'},
+        'faculty': {'id', 'department', 'course', 'name'},
+        'courses': {'id', 'name', 'credit_hours', 'faculty'}
+    }
+    
+    SORT_FIELDS = {
+        'students': {'student_id', 'name', 'age', 'gender', 'department', 'gpa'},
+        'faculty': {'faculty_id', 'name', 'department'},
+        'courses': {'course_id', 'name', 'credit_hours', 'max_capacity', 'assigned_faculty'}
+    }
+    
+    def __init__(self, university, collection: str = 'students'):
+        """
+        Initialize a query.
+        
+        Args:
+            university: University object to query
+            collection: 'students', 'faculty' or 'courses'
+        """
+        if collection not in self.COLLECTIONS:
+            raise ValueError(f"Unknown collection: {collection}")
+        
+        self.university = university
+        self.collection = collection
+        self.filters: Dict[str, Any] = {}
+        self.sort_field: Optional[str] = None
+        self.sort_descending = False
+        self._limit: Optional[int] = None
+        self._offset = 0
+    
+    def _add_filter(self, name: str, value: Any) -> 'Query':
+        if name not in self.FILTERS[self.collection]:
+            raise ValueError(f"Filter '{name}' is not supported for {self.collection}")
+        self.filters[name] = value
+        return self
+    
+    def with_id(self, entity_id: str) -> 'Query':
+        """Match a single entity ID."""
+        return self._add_filter('id', entity_id)
+    
+    def department(self, department_id: str) -> 'Query':
+        """Match entities of a department."""
+        return self._add_filter('department', department_id)
+    
+    def age_between(self, low: int = None, high: int = None) -> 'Query':
+        """Match students with low <= age <= high (either bound optional)."""
+        return self._add_filter('age', (low, high))
+    
+    def gpa_between(self, low: float = None, high: float = None) -> 'Query':
+        """Match students with low <= GPA <= high (either bound optional)."""
+        return self._add_filter('gpa', (low, high))
+    
+    def gender(self, gender: str) -> 'Query':
+        """Match students of a gender (case-insensitive)."""
+        return self._add_filter('gender', gender.lower())
+    
+    def enrolled_in(self, course_id: str) -> 'Query':
+        """Match students enrolled in, or faculty teaching, a course."""
+        return self._add_filter('course', course_id)
+    
+    def credit_hours(self, credit_hours: int) -> 'Query':
+        """Match courses with a number of credit hours."""
+        return self._add_filter('credit_hours', credit_hours)
+    
+    def taught_by(self, faculty_id: str) -> 'Query':
+        """Match courses assigned to a faculty member."""
+        return self._add_filter('faculty', faculty_id)
+    
+    def name_contains(self, text: str) -> 'Query':
+        """Match names containing text (case-insensitive)."""
+        return self._add_filter('name', text.lower())
+    
+    def order_by(self, field: str, descending: bool = False) -> 'Query':
+        """Sort results by an attribute (e.g. 'gpa', 'name', 'age')."""
+        if field not in self.SORT_FIELDS[self.collection]:
+            raise ValueError(f"Cannot sort {self.collection} by '{field}'")
+        self.sort_field = field
+        self.sort_descending = descending
+        return self
+    
+    def limit(self, count: int) -> 'Query':
+        """Return at most count rows."""
+        if count < 0:
+            raise ValueError("Limit cannot be negative")
+        self._limit = count
+        return self
+    
+    def offset(self, count: int) -> 'Query':
+        """Skip the first count rows."""
+        if count < 0:
+            raise ValueError("Offset cannot be negative")
+        self._offset = count
+        return self
+    
+    def _predicate(self, name: str) -> Callable[[Any], bool]:
+        """Build the row predicate for one filter."""
+        value = self.filters[name]
+        key = self.COLLECTIONS[self.collection]
+        
+        if name == 'id':
+            return lambda e: getattr(e, key) == value
+        if name == 'department':
+            return lambda e: e.department == value
+        if name in ('age', 'gpa'):
+            low, high = value
+            return lambda e: ((low is None or getattr(e, name) >= low) and
+                              (high is None or getattr(e, name) <= high))
+        if name == 'gender':
+            return lambda e: e.gender.lower() == value
+        if name == 'course':
+            if self.collection == 'students':
+                return lambda e: value in e.course_grades
+            return lambda e: value in e.courses_taught
+        if name == 'name':
+            return lambda e: value in e.name.lower()
+        if name == 'credit_hours':
+            return lambda e: e.credit_hours == value
+        if name == 'faculty':
+            return lambda e: e.assigned_faculty == value
+        raise ValueError(f"Unknown filter: {name}")
+    
+    def _access_paths(self) -> List[Tuple[int, str, Callable[[], List]]]:
+        """List usable access paths as (estimated rows, name, candidate fetcher)."""
+        university = self.university
+        indexes = get_indexes(university)
+        entities = getattr(university, self.collection)
+        paths = [(len(entities), 'full scan', lambda: entities)]
+        
+        if 'id' in self.filters:
+            find = {'students': university.find_student, 'faculty': university.find_faculty,
+                    'courses': university.find_course}[self.collection]
+            entity = find(self.filters['id'])
+            paths.append((1 if entity else 0, 'id lookup', lambda: [entity] if entity else []))
+        
+        if 'course' in self.filters and self.collection == 'students':
+            course = university.find_course(self.filters['course'])
+            roster = course.enrolled_students if course else []
+            paths.append((len(roster), 'course roster',
+                          lambda: [s for s in map(university.find_student, roster) if s]))
+        
+        if 'department' in self.filters:
+            bucket = indexes.department(self.collection).get(self.filters['department'], [])
+            paths.append((len(bucket), 'department index', lambda: bucket))
+        
+        if 'gpa' in self.filters:
+            keys, ordered = indexes.gpa()
+            low, high = self.filters['gpa']
+            start = 0 if low is None else bisect_left(keys, low)
+            end = len(keys) if high is None else bisect_right(keys, high)
+            paths.append((max(0, end - start), 'gpa index', lambda: ordered[start:end]))
+        
+        name = self.filters.get('name', '')
+        if len(name) >= 3:
+            trigram_index = indexes.name_trigrams(self.collection)
+            postings = [trigram_index.get(t, []) for t in set(_trigrams(name))]
+            smallest = min(postings, key=len)
+            paths.append((len(smallest), 'name index', lambda: smallest))
+        
+        return paths
+    
+    def _plan(self) -> Tuple[Dict, Callable[[], List]]:
+        paths = self._access_paths()
+        estimate, access_path, fetch = min(paths, key=lambda p: p[0])
+        plan = {
+            'collection': self.collection,
+            'access_path': access_path,
+            'estimated_rows': estimate,
+            'considered': {name: rows for rows, name, _ in paths},
+            'filters': sorted(self.filters),
+            'sort': (f"{self.sort_field} {'desc' if self.sort_descending else 'asc'}"
+                     if self.sort_field else None),
+            'offset': self._offset,
+            'limit': self._limit
+        }
+        return plan, fetch
+    
+    def explain(self) -> str:
+        """Describe the plan the query would use."""
+        plan, _ = self._plan()
+        considered = ', '.join(f"{name}={rows}" for name, rows in plan['considered'].items())
+        lines = [f"Access path: {plan['access_path']} (~{plan['estimated_rows']} rows)",
+                 f"Considered: {considered}",
+                 f"Filters: {', '.join(plan['filters']) or 'none'}"]
+        if plan['sort']:
+            lines.append(f"Sort: {plan['sort']}")
+        if plan['limit'] is not None or plan['offset']:
+            lines.append(f"Offset: {plan['offset']}  Limit: {plan['limit']}")
+        return "\n".join(lines)
+    
+    def execute(self) -> QueryResult:
+        """Run the query."""
+        plan, fetch = self._plan()
+        predicates = [self._predicate(name) for name in self.filters]
+        rows = (e for e in fetch() if all(p(e) for p in predicates))
+        
+        end = None if self._limit is None else self._offset + self._limit
+        if self.sort_field:
+            field = self.sort_field
+            key = lambda e: getattr(e, field)
+            if end is not None:
+                select = heapq.nlargest if self.sort_descending else heapq.nsmallest
+                rows = select(end, rows, key=key)
+            else:
+                rows = sorted(rows, key=key, reverse=self.sort_descending)
+            result = rows[self._offset:end]
+        else:
+            result = []
+            for position, row in enumerate(rows):
+                if end is not None and position >= end:
+                    break
+                if position >= self._offset:
+                    result.append(row)
+        
+        plan['returned_rows'] = len(result)
+        return QueryResult(result, plan)
\ No newline at end of file
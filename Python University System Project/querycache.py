@@ -0,0 +1,140 @@
+"""
+Query cache module for University Management System
+
+Bounded LRU cache of name search results for one University. Entries are
+invalidated precisely from change events: adding or renaming an entity
+drops only the cached queries its name matches, and removing or renaming
+one drops only the entries that contain it, found through a reverse index
+from entities to the entries listing them. The cache is safe to use from
+several threads.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Set, Tuple
+from events import ChangeEvent
+
+# Searchable collections and their ID attributes
+ID_KEYS = {'students': 'student_id', 'faculty': 'faculty_id', 'courses': 'course_id'}
+
+CacheKey = Tuple[str, str]  # (collection, lower-case query)
+
+class QueryCache:
+    """Thread-safe LRU cache of name searches, invalidated by change events."""
+    
+    DEFAULT_CAPACITY = 256  # Cached queries
+    
+    def __init__(self, university, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize an empty cache and subscribe to the university's changes.
+        
+        Args:
+            university: University object searched
+            capacity: Maximum number of cached queries
+        """
+        self.university = university
+        self.capacity = capacity
+        self._entries: 'OrderedDict[CacheKey, tuple]' = OrderedDict()  # Least recently used first
+        self._members: Dict[Tuple[str, str], Set[CacheKey]] = {}  # (collection, ID) -> entries
+        self._generations: Dict[str, int] = {collection: 0 for collection in ID_KEYS}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        university.events.subscribe(self._on_change, [ChangeEvent.ENTITY_ADDED,
+                                                      ChangeEvent.ENTITY_REMOVED,
+                                                      ChangeEvent.ENTITY_UPDATED,
+                                                      ChangeEvent.RELOADED])
+    
+    def search(self, collection: str, query: str, compute: Callable[[str], List]) -> List:
+        """
+        Get the result of a name search, computing and caching it on a miss.
+        
+        Args:
+            collection: Collection searched ('students', 'faculty' or 'courses')
+            query: Lower-case search text
+            compute: Runs the search for the query
+            
+        Returns:
+            New list of the matching entities
+        """
+        key = (collection, query)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(result)
+            self.misses += 1
+            generation = self._generations[collection]
+        
+        result = tuple(compute(query))
+        with self._lock:
+            # A change published while searching may not be reflected in the
+            # result; it is returned but not cached
+            if self._generations[collection] == generation and key not in self._entries:
+                self._entries[key] = result
+                id_key = ID_KEYS[collection]
+                for entity in result:
+                    self._members.setdefault((collection, getattr(entity, id_key)), set()).add(key)
+                while len(self._entries) > self.capacity:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        return list(result)
+    
+    def _drop(self, key: CacheKey) -> None:
+        """Remove an entry and its reverse index references; lock must be held."""
+        collection = key[0]
+        id_key = ID_KEYS[collection]
+        for entity in self._entries.pop(key):
+            member = (collection, getattr(entity, id_key))
+            keys = self._members.get(member)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._members[member]
+    
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Event subscriber: drop the entries a change may have affected."""
+        if event.kind == ChangeEvent.RELOADED:
+            self.clear()
+            return
+        collection = event.collection
+        if collection not in ID_KEYS:
+            return
+        if event.kind == ChangeEvent.ENTITY_UPDATED and 'name' not in event.data.get('changes', {}):
+            return
+        
+        # The entity's (new) name, for entries it now matches
+        name = None
+        if event.kind != ChangeEvent.ENTITY_REMOVED:
+            entity = self.university._id_index(collection, ID_KEYS[collection]).get(event.entity_id)
+            name = entity.name.lower() if entity is not None else None
+        
+        with self._lock:
+            self._generations[collection] += 1
+            stale = set(self._members.get((collection, event.entity_id), ()))
+            if name is not None:
+                stale.update(key for key in self._entries if key[0] == collection and key[1] in name)
+            for key in stale:
+                self._drop(key)
+            self.invalidations += len(stale)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._members.clear()
+            for collection in self._generations:
+                self._generations[collection] += 1
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self._entries), 'capacity': self.capacity,
+                    'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'evictions': self.evictions, 'invalidations': self.invalidations}
\ No newline at end of file
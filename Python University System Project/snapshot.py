@@ -0,0 +1,169 @@
+"""
+Snapshot module for University Management System
+
+A snapshot is an immutable point-in-time view of a University. Each entity
+caches a frozen record of itself that is only rebuilt after the entity
+changes, so consecutive snapshots share every unchanged record instead of
+deep-copying the whole university.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from utils import write_table
+
+def freeze_record(value: Any) -> Any:
+    """
+    Convert serialized entity data into an immutable structure.
+    
+    Dictionaries become read-only mappings and lists become tuples.
+    
+    Args:
+        value: Value produced by an entity's to_dict()
+        
+    Returns:
+        Immutable equivalent of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze_record(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_record(v) for v in value)
+    return value
+
+def thaw_record(value: Any) -> Any:
+    """JSON `default` hook turning frozen mappings back into dictionaries."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def unfreeze_record(value: Any) -> Any:
+    """Convert a frozen structure back into plain dictionaries and lists."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: unfreeze_record(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [unfreeze_record(v) for v in value]
+    return value
+
+class UniversitySnapshot:
+    """Immutable point-in-time view of a University."""
+    
+    def __init__(self, version: int, name: str, address: str,
+                 departments: Tuple[Mapping, ...], students: Tuple[Mapping, ...],
+                 faculty: Tuple[Mapping, ...], courses: Tuple[Mapping, ...]):
+        """
+        Initialize a snapshot.
+        
+        Args:
+            version: University version the snapshot was taken at
+            name: University name
+            address: University address
+            departments: Frozen department records
+            students: Frozen student records
+            faculty: Frozen faculty records
+            courses: Frozen course records
+        """
+        self.version = version
+        self.name = name
+        self.address = address
+        self.departments = departments
+        self.students = students
+        self.faculty = faculty
+        self.courses = courses
+        self._indexes: Dict[str, Dict[str, Mapping]] = {}
+    
+    def _find(self, collection: str, key: str, value: str) -> Optional[Mapping]:
+        """Look up a record by ID, building the ID index on first use."""
+        index = self._indexes.get(collection)
+        if index is None:
+            index = {record[key]: record for record in getattr(self, collection)}
+            self._indexes[collection] = index
+        return index.get(value)
+    
+    def find_student(self, student_id: str) -> Optional[Mapping]:
+        """Find a student record by ID."""
+        return self._find('students', 'student_id', student_id)
+    
+    def find_faculty(self, faculty_id: str) -> Optional[Mapping]:
+        """Find a faculty record by ID."""
+        return self._find('faculty', 'faculty_id', faculty_id)
+    
+    def find_course(self, course_id: str) -> Optional[Mapping]:
+        """Find a course record by ID."""
+        return self._find('courses', 'course_id', course_id)
+    
+    def find_department(self, department_id: str) -> Optional[Mapping]:
+        """Find a department record by ID."""
+        return self._find('departments', 'department_id', department_id)
+    
+    def get_average_gpa(self) -> float:
+        """Calculate average GPA of all students."""
+        if not self.students:
+            return 0.0
+        return sum(record['gpa'] for record in self.students) / len(self.students)
+    
+    def get_university_stats(self) -> Dict:
+        """Get university statistics."""
+        return {
+            'name': self.name,
+            'address': self.address,
+            'total_students': len(self.students),
+            'total_faculty': len(self.faculty),
+            'total_courses': len(self.courses),
+            'total_departments': len(self.departments),
+            'average_gpa': self.get_average_gpa()
+        }
+    
+    def get_all_data(self) -> Dict:
+        """
+        Get all snapshot data for serialization.
+        
+        Records are frozen mappings; pass thaw_record as the `default`
+        argument of json.dump to serialize them.
+        """
+        return {
+            'name': self.name,
+            'address': self.address,
+            'departments': list(self.departments),
+            'students': list(self.students),
+            'faculty': list(self.faculty),
+            'courses': list(self.courses)
+        }
+    
+    def display_university_info(self) -> None:
+        """Display university information and statistics."""
+        print_university_info(self.get_university_stats())
+    
+    def display_detailed_stats(self) -> None:
+        """Display detailed university statistics."""
+        self.display_university_info()
+        
+        dept_students: Dict[str, int] = {}
+        for record in self.students:
+            dept_students[record['department']] = dept_students.get(record['department'], 0) + 1
+        dept_faculty: Dict[str, int] = {}
+        for record in self.faculty:
+            dept_faculty[record['department']] = dept_faculty.get(record['department'], 0) + 1
+        
+        print_department_stats((record['name'], dept_students.get(record['department_id'], 0),
+                                dept_faculty.get(record['department_id'], 0),
+                                len(record['courses_offered']))
+                               for record in self.departments)
+
+def print_university_info(stats: Dict) -> None:
+    """Print the university information block from get_university_stats() output."""
+    print("\n" + "="*60)
+    print(f"UNIVERSITY: {stats['name']}")
+    print("="*60)
+    print(f"Address: {stats['address']}")
+    print(f"Departments: {stats['total_departments']}")
+    print(f"Faculty Members: {stats['total_faculty']}")
+    print(f"Students: {stats['total_students']}")
+    print(f"Courses Offered: {stats['total_courses']}")
+    print(f"Average GPA: {stats['average_gpa']:.2f}")
+    print("="*60)
+
+def print_department_stats(rows: Iterable[Tuple[str, int, int, int]]) -> None:
+    """Print the department table from (name, students, faculty, courses) rows."""
+    print("\nDEPARTMENT WISE STATISTICS:")
+    print("-"*60)
+    write_table(['Department', 'Students', 'Faculty', 'Courses'], rows,
+                col_widths=[None, 10, 10, 10], separator=" ")
\ No newline at end of file
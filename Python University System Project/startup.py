@@ -0,0 +1,121 @@
+"""
+Startup module for University Management System
+
+Keeps interactive startup fast: the University is loaded by a background
+thread while the menu is already on screen, and the first use of the data
+waits for that load to finish. Also measures the startup phases.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Modules imported before the menu can run, in dependency order
+STARTUP_MODULES = ('university', 'file_handler', 'menu')
+
+class DeferredUniversity:
+    """Stand-in for a University that is loaded in the background.
+    
+    Attribute access blocks until the load has finished and is then
+    forwarded to the real University, so the object can be passed anywhere
+    a University is expected.
+    """
+    
+    def __init__(self, name: str, address: str, on_loaded: Optional[Callable] = None):
+        """
+        Start loading the university in a background thread.
+        
+        Args:
+            name: University name
+            address: University address
+            on_loaded: Called on the background thread with the University
+                       once it loaded successfully, before resolve() returns
+        """
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_address', address)
+        object.__setattr__(self, '_on_loaded', on_loaded)
+        object.__setattr__(self, '_university', None)
+        object.__setattr__(self, '_error', None)
+        object.__setattr__(self, '_reported', False)
+        thread = threading.Thread(target=self._load, name="university-preload", daemon=True)
+        object.__setattr__(self, '_thread', thread)
+        thread.start()
+    
+    def _load(self) -> None:
+        from university import University
+        from file_handler import FileHandler
+        
+        university = University(self._name, self._address)
+        try:
+            FileHandler.load_all_data(university, verbose=False)
+            university.text_index  # Built here so the first search is instant
+        except Exception as e:
+            object.__setattr__(self, '_error', e)
+        object.__setattr__(self, '_university', university)
+        if self._error is None and self._on_loaded is not None:
+            self._on_loaded(university)
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the background load has finished."""
+        return not self._thread.is_alive()
+    
+    def resolve(self):
+        """Wait for the background load and return the real University."""
+        self._thread.join()
+        if not self._reported:
+            object.__setattr__(self, '_reported', True)
+            from file_handler import FileHandler
+            for message in FileHandler.take_load_messages():
+                print(message)
+            if self._error is not None:
+                print(f"⚠ Error loading data: {self._error}")
+            else:
+                summary = FileHandler.integrity_summary()
+                if summary:
+                    print(summary)
+        return self._university
+    
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+    
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.resolve(), name, value)
+
+def measure_startup() -> Dict[str, float]:
+    """
+    Measure the startup phases in this process.
+    
+    Only modules that were not imported yet count towards the import phase,
+    so call this before anything else has been loaded.
+    
+    Returns:
+        Seconds spent per phase: import, parse, construct and total
+    """
+    started = time.perf_counter()
+    for module in STARTUP_MODULES:
+        importlib.import_module(module)
+    imported = time.perf_counter()
+    
+    from university import University
+    from file_handler import FileHandler
+    
+    FileHandler.last_load_timings = {}
+    FileHandler.load_all_data(University(), verbose=False)
+    timings = {'import': imported - started,
+               'parse': FileHandler.last_load_timings.get('parse', 0.0),
+               'construct': FileHandler.last_load_timings.get('construct', 0.0)}
+    timings['total'] = time.perf_counter() - started
+    return timings
+
+def report_startup() -> None:
+    """Print the startup phase timings."""
+    timings = measure_startup()
+    print("\nSTARTUP TIME")
+    print("-"*30)
+    for phase in ('import', 'parse', 'construct', 'total'):
+        print(f"{phase.capitalize():<12} {timings[phase] * 1000:>10.1f} ms")
+    print("-"*30)
+    print(f"Python {sys.version.split()[0]}")
\ No newline at end of file
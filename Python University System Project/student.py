@@ -2,12 +2,22 @@
 Student module for University Management System
 """
 
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 import json
+from snapshot import freeze_record
+from utils import write_table
 
 class Student:
     """Represents a student in the university."""
     
+    _record: Optional[Mapping] = None  # Cached frozen record for snapshots
+    # Data file fields the class does not model (contact details, ...), kept
+    # so saving writes them back; replaced by from_dict, never changed in place
+    extra: Mapping = MappingProxyType({})
+    _FIELDS = frozenset(('student_id', 'name', 'age', 'gender', 'department', 'gpa',
+                         'course_grades'))  # Keys written by to_dict
+    
     def __init__(self, student_id: str, name: str, age: int, 
                  gender: str, department: str):
         """
@@ -33,6 +43,27 @@ class Student:
         
         self._calculate_gpa()
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any change to a public field invalidates the cached snapshot record
+        if not name.startswith('_'):
+            object.__setattr__(self, '_record', None)
+    
+    def snapshot_record(self, store: bool = True) -> Mapping:
+        """
+        Get an immutable record of the student, cached until it changes.
+        
+        Args:
+            store: Cache a newly built record; pass False when reading from a
+                   thread other than the one changing the student
+        """
+        record = self._record
+        if record is None:
+            record = freeze_record(self.to_dict())
+            if store:
+                self._record = record
+        return record
+    
     def _calculate_gpa(self) -> None:
         """Calculate GPA based on course grades."""
         if not self.course_grades:
@@ -56,6 +87,7 @@ class Student:
             return False
         
         self.course_grades[course_id] = 0.0  # Initialize with 0 grade
+        self._record = None
         return True
     
     def assign_grade(self, course_id: str, grade: float) -> bool:
@@ -76,6 +108,7 @@ class Student:
             return False
         
         self.course_grades[course_id] = grade
+        self._record = None
         self._calculate_gpa()
         return True
     
@@ -91,6 +124,7 @@ class Student:
         """
         if course_id in self.course_grades:
             del self.course_grades[course_id]
+            self._record = None
             self._calculate_gpa()
             return True
         return False
@@ -133,11 +167,9 @@ class Student:
         print("\n" + "-"*40)
         print(f"COURSE GRADES - {self.name}")
         print("-"*40)
-        print(f"{'Course ID':<15} {'Grade':<10}")
-        print("-"*40)
-        
-        for course_id, grade in self.course_grades.items():
-            print(f"{course_id:<15} {grade:<10.2f}")
+        write_table(['Course ID', 'Grade'],
+                    ((course_id, f"{grade:.2f}") for course_id, grade in self.course_grades.items()),
+                    col_widths=[15, 10], separator=" ")
     
     @staticmethod
     def is_valid_student_id(student_id: str) -> bool:
@@ -161,7 +193,8 @@ class Student:
             'gender': self.gender,
             'department': self.department,
             'gpa': self.gpa,
-            'course_grades': self.course_grades
+            'course_grades': self.course_grades,
+            **self.extra
         }
     
     @classmethod
@@ -176,4 +209,7 @@ class Student:
         )
         student.gpa = data['gpa']
         student.course_grades = data['course_grades']
+        extra = {k: v for k, v in data.items() if k not in cls._FIELDS}
+        if extra:
+            student.extra = extra
         return student
\ No newline at end of file
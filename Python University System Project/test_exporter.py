@@ -0,0 +1,51 @@
+"""
+Regression tests for the frontend delta export
+
+Run with: python -m unittest test_exporter
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from university import University
+from department import Department
+from batch import BatchRunner
+from exporter import FrontendExporter
+
+class DeltaExportTest(unittest.TestCase):
+    """Delta exports must include every row changed since the previous export."""
+    
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.university = University("Test University", "Test Address")
+        self.university.add_department(Department("CSE", "Computer Science"))
+        self.runner = BatchRunner(self.university)
+        self.exporter = FrontendExporter(self.university, self.directory)
+    
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    
+    def _rows(self, summary, sheet):
+        with open(os.path.join(summary['directory'], f"{sheet}.csv"), newline='') as f:
+            return list(csv.reader(f))[1:]
+    
+    def test_add_course_to_department(self):
+        self.exporter.export_full()
+        result = self.runner.execute(['add-course', 'CSE777', 'New Course', '3', '0', 'CSE'])
+        self.assertTrue(result['ok'])
+        
+        summary = self.exporter.export_delta()
+        self.assertTrue(summary['used_events'])
+        self.assertEqual([row[0] for row in self._rows(summary, 'Courses')], ['CSE777'])
+        departments = self._rows(summary, 'Departments')
+        self.assertEqual([row[0] for row in departments], ['CSE'])
+        self.assertEqual(departments[0][3], 'CSE777')
+        
+        # Nothing changed since, so the next delta is empty
+        summary = self.exporter.export_delta()
+        self.assertEqual(self._rows(summary, 'Departments'), [])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
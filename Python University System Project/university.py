@@ -2,11 +2,29 @@
 University module for University Management System
 """
 
-from typing import List, Dict, Optional
+import operator
+import threading
+from functools import reduce, wraps
+from typing import Callable, List, Dict, Optional
 from student import Student
 from faculty import Faculty
 from course import Course
 from department import Department
+from snapshot import UniversitySnapshot, print_department_stats, print_university_info
+from views import ReportViews
+from querycache import QueryCache
+from fulltext import FullTextIndex, SearchResult
+from coenrollment import CoEnrollmentGraph
+from idcodec import bitmap_count, iter_bitmap
+from events import ChangeEvent, EventBus
+
+def _mutation(method: Callable) -> Callable:
+    """Run a University method while holding the university's lock."""
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return locked
 
 class University:
     """Represents the university and manages all entities."""
@@ -26,7 +44,18 @@ class University:
         self.students: List[Student] = []
         self.faculty: List[Faculty] = []
         self.courses: List[Course] = []
+        self.version = 0  # Incremented on every mutation made through University
+        self._indexes: Dict[str, Dict] = {}  # collection -> {entity ID: entity}
+        self.events = EventBus()  # Change events published by every mutation
+        # Held by every mutation, so a snapshot taken on another thread never
+        # sees one half done (e.g. a course roster updated but not the student)
+        self.lock = threading.RLock()
+        self._views: Optional[ReportViews] = None  # Created on first report
+        self._search_cache: Optional[QueryCache] = None  # Created on first search
+        self._text_index: Optional[FullTextIndex] = None  # Created on first full-text search
+        self._coenrollment: Optional[CoEnrollmentGraph] = None  # Created on first use
     
+    @_mutation
     def add_student(self, student: Student) -> bool:
         """
         Add a student to the university.
@@ -37,12 +66,17 @@ class University:
         Returns:
             True if added successfully, False if student ID already exists
         """
-        if self.find_student(student.student_id):
+        index = self._id_index('students', 'student_id')
+        if student.student_id in index:
             return False
         
         self.students.append(student)
+        index[student.student_id] = student
+        self.version += 1
+        self.events.publish(ChangeEvent.ENTITY_ADDED, 'students', student.student_id)
         return True
     
+    @_mutation
     def add_faculty(self, faculty_member: Faculty) -> bool:
         """
         Add a faculty member to the university.
@@ -53,12 +87,17 @@ class University:
         Returns:
             True if added successfully, False if faculty ID already exists
         """
-        if self.find_faculty(faculty_member.faculty_id):
+        index = self._id_index('faculty', 'faculty_id')
+        if faculty_member.faculty_id in index:
             return False
         
         self.faculty.append(faculty_member)
+        index[faculty_member.faculty_id] = faculty_member
+        self.version += 1
+        self.events.publish(ChangeEvent.ENTITY_ADDED, 'faculty', faculty_member.faculty_id)
         return True
     
+    @_mutation
     def add_course(self, course: Course) -> bool:
         """
         Add a course to the university.
@@ -69,12 +108,17 @@ class University:
         Returns:
             True if added successfully, False if course ID already exists
         """
-        if self.find_course(course.course_id):
+        index = self._id_index('courses', 'course_id')
+        if course.course_id in index:
             return False
         
         self.courses.append(course)
+        index[course.course_id] = course
+        self.version += 1
+        self.events.publish(ChangeEvent.ENTITY_ADDED, 'courses', course.course_id)
         return True
     
+    @_mutation
     def add_department(self, department: Department) -> bool:
         """
         Add a department to the university.
@@ -85,12 +129,17 @@ class University:
         Returns:
             True if added successfully, False if department ID already exists
         """
-        if self.find_department(department.department_id):
+        index = self._id_index('departments', 'department_id')
+        if department.department_id in index:
             return False
         
         self.departments.append(department)
+        index[department.department_id] = department
+        self.version += 1
+        self.events.publish(ChangeEvent.ENTITY_ADDED, 'departments', department.department_id)
         return True
     
+    @_mutation
     def remove_student(self, student_id: str) -> bool:
         """
         Remove a student from the university.
@@ -103,15 +152,25 @@ class University:
         """
         student = self.find_student(student_id)
         if student:
+            del self._id_index('students', 'student_id')[student_id]
             self.students.remove(student)
             
-            # Remove student from all courses
+            # Remove student from all courses and waitlists, filling freed seats
+            courses = []
             for course in self.courses:
-                course.remove_student(student_id)
+                waiting = course.waitlist.remove(student_id)
+                if course.remove_student(student_id):
+                    self._promote_from_waitlist(course)
+                elif not waiting:
+                    continue
+                courses.append(course.course_id)
             
+            self.version += 1
+            self.events.publish(ChangeEvent.ENTITY_REMOVED, 'students', student_id, courses=courses)
             return True
         return False
     
+    @_mutation
     def remove_faculty(self, faculty_id: str) -> bool:
         """
         Remove a faculty member from the university.
@@ -124,21 +183,30 @@ class University:
         """
         faculty_member = self.find_faculty(faculty_id)
         if faculty_member:
+            del self._id_index('faculty', 'faculty_id')[faculty_id]
             self.faculty.remove(faculty_member)
             
             # Remove faculty from courses they were teaching
+            courses = []
             for course in self.courses:
                 if course.assigned_faculty == faculty_id:
                     course.assigned_faculty = ""
+                    courses.append(course.course_id)
             
             # Remove as head of department
+            departments = []
             for department in self.departments:
                 if department.head_of_department == faculty_id:
                     department.head_of_department = ""
+                    departments.append(department.department_id)
             
+            self.version += 1
+            self.events.publish(ChangeEvent.ENTITY_REMOVED, 'faculty', faculty_id,
+                                courses=courses, departments=departments)
             return True
         return False
     
+    @_mutation
     def remove_course(self, course_id: str) -> bool:
         """
         Remove a course from the university.
@@ -151,23 +219,25 @@ class University:
         """
         course = self.find_course(course_id)
         if course:
+            del self._id_index('courses', 'course_id')[course_id]
             self.courses.remove(course)
             
             # Remove course from students' enrollments
-            for student in self.students:
-                student.drop_course(course_id)
+            students = [s.student_id for s in self.students if s.drop_course(course_id)]
             
             # Remove course from faculty teaching assignments
-            for faculty_member in self.faculty:
-                faculty_member.remove_course(course_id)
+            faculty = [f.faculty_id for f in self.faculty if f.remove_course(course_id)]
             
             # Remove course from departments
-            for department in self.departments:
-                department.remove_course(course_id)
+            departments = [d.department_id for d in self.departments if d.remove_course(course_id)]
             
+            self.version += 1
+            self.events.publish(ChangeEvent.ENTITY_REMOVED, 'courses', course_id, students=students,
+                                faculty=faculty, departments=departments)
             return True
         return False
     
+    @_mutation
     def remove_department(self, department_id: str) -> bool:
         """
         Remove a department from the university.
@@ -180,53 +250,236 @@ class University:
         """
         department = self.find_department(department_id)
         if department:
+            del self._id_index('departments', 'department_id')[department_id]
             self.departments.remove(department)
+            self.version += 1
+            self.events.publish(ChangeEvent.ENTITY_REMOVED, 'departments', department_id)
             return True
         return False
     
+    UPDATABLE_FIELDS = {
+        'students': ('name', 'age', 'gender', 'department'),
+        'faculty': ('name', 'department'),
+        'courses': ('name', 'credit_hours'),
+        'departments': ('name', 'head_of_department')
+    }
+    INTEGER_FIELDS = ('age', 'credit_hours')  # Updatable fields holding positive integers
+    
+    def _check_field(self, field: str, value) -> None:
+        """
+        Validate a new field value the way the constructors and menu do.
+        
+        Raises:
+            ValueError: If the value is not acceptable for the field
+        """
+        label = field.replace('_', ' ').capitalize()
+        if field in self.INTEGER_FIELDS:
+            if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                raise ValueError(f"{label} must be a positive number")
+        elif not isinstance(value, str):
+            raise ValueError(f"{label} must be text")
+        elif field == 'head_of_department':
+            # Empty clears the head, as when the head is removed
+            if value and self.find_faculty(value) is None:
+                raise ValueError(f"Faculty {value} not found")
+        elif not value.strip():
+            raise ValueError(f"{label} cannot be empty")
+    
+    def _update_entity(self, collection: str, entity, changes: Dict) -> bool:
+        """
+        Apply field changes to an entity of a collection.
+        
+        Every change is validated before any is applied.
+        
+        Raises:
+            ValueError: If a field cannot be updated or a value is invalid
+        """
+        if entity is None:
+            return False
+        if not changes:
+            return True  # Nothing changed, so nothing is invalidated or saved
+        
+        allowed = self.UPDATABLE_FIELDS[collection]
+        unknown = [field for field in changes if field not in allowed]
+        if unknown:
+            raise ValueError(f"Cannot update field(s): {', '.join(unknown)}")
+        for field, value in changes.items():
+            self._check_field(field, value)
+        
+        for field, value in changes.items():
+            setattr(entity, field, value)
+        self.version += 1
+        key = {'students': 'student_id', 'faculty': 'faculty_id',
+               'courses': 'course_id', 'departments': 'department_id'}[collection]
+        self.events.publish(ChangeEvent.ENTITY_UPDATED, collection, getattr(entity, key),
+                            changes=dict(changes))
+        return True
+    
+    @_mutation
+    def update_student(self, student_id: str, **changes) -> bool:
+        """
+        Update student fields (name, age, gender, department).
+        
+        Args:
+            student_id: Student identifier
+            **changes: New field values
+            
+        Returns:
+            True if updated successfully, False if student not found
+        """
+        return self._update_entity('students', self.find_student(student_id), changes)
+    
+    @_mutation
+    def update_faculty(self, faculty_id: str, **changes) -> bool:
+        """Update faculty fields (name, department)."""
+        return self._update_entity('faculty', self.find_faculty(faculty_id), changes)
+    
+    @_mutation
+    def update_course(self, course_id: str, **changes) -> bool:
+        """Update course fields (name, credit_hours)."""
+        return self._update_entity('courses', self.find_course(course_id), changes)
+    
+    @_mutation
+    def update_department(self, department_id: str, **changes) -> bool:
+        """Update department fields (name, head_of_department)."""
+        return self._update_entity('departments', self.find_department(department_id), changes)
+    
+    @_mutation
+    def clear(self) -> None:
+        """Remove all departments, students, faculty and courses."""
+        self.departments.clear()
+        self.students.clear()
+        self.faculty.clear()
+        self.courses.clear()
+        self._indexes.clear()
+        self.version += 1
+        self.events.publish(ChangeEvent.RELOADED)
+    
+    def _id_index(self, collection: str, key: str) -> Dict:
+        """
+        Get the ID -> entity index of a collection.
+        
+        The index is maintained by the add/remove methods and rebuilt if
+        the entity list was changed directly (detected by a size mismatch).
+        """
+        entities = getattr(self, collection)
+        index = self._indexes.get(collection)
+        if index is None or len(index) != len(entities):
+            index = {getattr(entity, key): entity for entity in entities}
+            self._indexes[collection] = index
+        return index
+    
     def find_student(self, student_id: str) -> Optional[Student]:
         """Find a student by ID."""
-        for student in self.students:
-            if student.student_id == student_id:
-                return student
-        return None
+        return self._id_index('students', 'student_id').get(student_id)
     
     def find_faculty(self, faculty_id: str) -> Optional[Faculty]:
         """Find a faculty member by ID."""
-        for faculty_member in self.faculty:
-            if faculty_member.faculty_id == faculty_id:
-                return faculty_member
-        return None
+        return self._id_index('faculty', 'faculty_id').get(faculty_id)
     
     def find_course(self, course_id: str) -> Optional[Course]:
         """Find a course by ID."""
-        for course in self.courses:
-            if course.course_id == course_id:
-                return course
-        return None
+        return self._id_index('courses', 'course_id').get(course_id)
     
     def find_department(self, department_id: str) -> Optional[Department]:
         """Find a department by ID."""
-        for department in self.departments:
-            if department.department_id == department_id:
-                return department
-        return None
+        return self._id_index('departments', 'department_id').get(department_id)
+    
+    @property
+    def search_cache(self) -> QueryCache:
+        """LRU cache of name search results, created on first search."""
+        if self._search_cache is None:
+            with self.lock:  # Concurrent readers must not create two caches
+                if self._search_cache is None:
+                    self._search_cache = QueryCache(self)
+        return self._search_cache
+    
+    def _scan_names(self, collection: str) -> Callable[[str], List]:
+        """Name search over a collection for a lower-case query."""
+        return lambda query: [e for e in getattr(self, collection) if query in e.name.lower()]
     
     def search_students_by_name(self, name_query: str) -> List[Student]:
-        """Search students by name (case-insensitive partial match)."""
-        name_query = name_query.lower()
-        return [s for s in self.students if name_query in s.name.lower()]
+        """Search students by name (case-insensitive partial match, cached)."""
+        return self.search_cache.search('students', name_query.lower(), self._scan_names('students'))
     
     def search_faculty_by_name(self, name_query: str) -> List[Faculty]:
-        """Search faculty by name (case-insensitive partial match)."""
-        name_query = name_query.lower()
-        return [f for f in self.faculty if name_query in f.name.lower()]
+        """Search faculty by name (case-insensitive partial match, cached)."""
+        return self.search_cache.search('faculty', name_query.lower(), self._scan_names('faculty'))
     
     def search_courses_by_name(self, name_query: str) -> List[Course]:
-        """Search courses by name (case-insensitive partial match)."""
-        name_query = name_query.lower()
-        return [c for c in self.courses if name_query in c.name.lower()]
+        """Search courses by name (case-insensitive partial match, cached)."""
+        return self.search_cache.search('courses', name_query.lower(), self._scan_names('courses'))
     
+    @property
+    def text_index(self) -> FullTextIndex:
+        """Full-text index over all entities, built on first use."""
+        if self._text_index is None:
+            with self.lock:  # Concurrent readers must not build two indexes
+                if self._text_index is None:
+                    self._text_index = FullTextIndex(self)
+        return self._text_index
+    
+    def search_all(self, query: str, collections: Optional[List[str]] = None,
+                   limit: int = FullTextIndex.DEFAULT_LIMIT) -> List[SearchResult]:
+        """
+        Search students, faculty, courses and departments at once.
+        
+        Args:
+            query: Search text; every word must start a word of an entity's
+                   ID, name, department or other details
+            collections: Entity types to search (default all)
+            limit: Maximum number of results
+            
+        Returns:
+            (collection, entity, score) tuples, best match first
+        """
+        return self.text_index.search(query, collections, limit)
+    
+    @property
+    def coenrollment(self) -> CoEnrollmentGraph:
+        """Course conflict graph kept current by enrollment changes, built on first use."""
+        if self._coenrollment is None:
+            self._coenrollment = CoEnrollmentGraph.follow(self)
+        return self._coenrollment
+    
+    def _enrollment_bitmaps(self, course_ids: List[str]) -> List[int]:
+        """Enrollment bitmaps of the given courses, skipping unknown IDs."""
+        courses = self._id_index('courses', 'course_id')
+        return [courses[c].enrollment_bitmap for c in course_ids if c in courses]
+    
+    def students_in_all_courses(self, course_ids: List[str]) -> List[str]:
+        """
+        Get the students enrolled in every one of the given courses.
+        
+        Args:
+            course_ids: Course identifiers
+            
+        Returns:
+            Student IDs in ascending order (empty if any course is unknown)
+        """
+        bitmaps = self._enrollment_bitmaps(course_ids)
+        if not bitmaps or len(bitmaps) != len(course_ids):
+            return []
+        return list(iter_bitmap(reduce(operator.and_, bitmaps)))
+    
+    def students_in_any_course(self, course_ids: List[str]) -> List[str]:
+        """
+        Get the students enrolled in at least one of the given courses.
+        
+        Args:
+            course_ids: Course identifiers (unknown IDs are ignored)
+            
+        Returns:
+            Student IDs in ascending order
+        """
+        return list(iter_bitmap(reduce(operator.or_, self._enrollment_bitmaps(course_ids), 0)))
+    
+    def count_shared_students(self, first_course_id: str, second_course_id: str) -> int:
+        """Count the students enrolled in both courses."""
+        bitmaps = self._enrollment_bitmaps([first_course_id, second_course_id])
+        return bitmap_count(bitmaps[0] & bitmaps[1]) if len(bitmaps) == 2 else 0
+    
+    @_mutation
     def enroll_student_in_course(self, student_id: str, course_id: str) -> bool:
         """
         Enroll a student in a course.
@@ -247,10 +500,110 @@ class University:
         # Enroll student in course
         if course.enroll_student(student_id):
             # Add course to student's enrollments
-            return student.enroll_in_course(course_id)
+            enrolled = student.enroll_in_course(course_id)
+            self.version += 1
+            self.events.publish(ChangeEvent.ENROLLED, 'students', student_id, course_id=course_id)
+            return enrolled
         
         return False
     
+    @_mutation
+    def join_waitlist(self, student_id: str, course_id: str) -> bool:
+        """
+        Put a student on a full course's waitlist.
+        
+        Args:
+            student_id: Student identifier
+            course_id: Course identifier
+            
+        Returns:
+            True if waitlisted, False if the course has free seats, the
+            student is already enrolled or waiting, or either is missing
+        """
+        student = self.find_student(student_id)
+        course = self.find_course(course_id)
+        
+        if not student or not course:
+            return False
+        
+        if not course.is_full() or course.is_student_enrolled(student_id):
+            return False
+        
+        if course.waitlist.add(student_id, course.waitlist.priority_for(student)):
+            self.version += 1
+            self.events.publish(ChangeEvent.WAITLISTED, 'students', student_id, course_id=course_id)
+            return True
+        return False
+    
+    @_mutation
+    def drop_student_from_course(self, student_id: str, course_id: str) -> bool:
+        """
+        Drop a student from a course (or its waitlist) and promote the next
+        waiting student into the freed seat.
+        
+        Args:
+            student_id: Student identifier
+            course_id: Course identifier
+            
+        Returns:
+            True if dropped successfully, False otherwise
+        """
+        student = self.find_student(student_id)
+        course = self.find_course(course_id)
+        
+        if not student or not course:
+            return False
+        
+        if course.waitlist.remove(student_id):
+            self.version += 1
+            self.events.publish(ChangeEvent.DROPPED, 'students', student_id,
+                                course_id=course_id, waitlist=True)
+            return True
+        
+        dropped = course.remove_student(student_id)
+        dropped = student.drop_course(course_id) or dropped
+        if dropped:
+            self.version += 1
+            self.events.publish(ChangeEvent.DROPPED, 'students', student_id,
+                                course_id=course_id, waitlist=False)
+            self._promote_from_waitlist(course)
+        return dropped
+    
+    @_mutation
+    def set_course_capacity(self, course_id: str, max_capacity: int) -> bool:
+        """
+        Change a course's capacity, promoting waiting students into new seats.
+        
+        Args:
+            course_id: Course identifier
+            max_capacity: Maximum number of enrolled students (0 = unlimited)
+            
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        course = self.find_course(course_id)
+        if not course or max_capacity < 0:
+            return False
+        
+        course.max_capacity = max_capacity
+        self.version += 1
+        self.events.publish(ChangeEvent.CAPACITY_CHANGED, 'courses', course_id,
+                            max_capacity=max_capacity)
+        self._promote_from_waitlist(course)
+        return True
+    
+    def _promote_from_waitlist(self, course: Course) -> List[str]:
+        """Enroll waiting students while the course has free seats."""
+        promoted = []
+        while not course.is_full():
+            student_id = course.waitlist.pop()
+            if student_id is None:
+                break
+            if self.enroll_student_in_course(student_id, course.course_id):
+                promoted.append(student_id)
+        return promoted
+    
+    @_mutation
     def assign_faculty_to_course(self, faculty_id: str, course_id: str) -> bool:
         """
         Assign a faculty member to teach a course.
@@ -271,10 +624,40 @@ class University:
         # Assign faculty to course
         if course.assign_faculty(faculty_id):
             # Add course to faculty's teaching assignments
-            return faculty_member.assign_course(course_id)
+            self.version += 1
+            assigned = faculty_member.assign_course(course_id)
+            self.events.publish(ChangeEvent.FACULTY_ASSIGNED, 'courses', course_id,
+                                faculty_id=faculty_id)
+            return assigned
         
         return False
     
+    @_mutation
+    def add_course_to_department(self, department_id: str, course_id: str) -> bool:
+        """
+        Add a course to the courses a department offers.
+        
+        Args:
+            department_id: Department identifier
+            course_id: Course identifier
+            
+        Returns:
+            True if added successfully, False if either is not found or the
+            department already offers the course
+        """
+        department = self.find_department(department_id)
+        if not department or not self.find_course(course_id):
+            return False
+        
+        if department.add_course(course_id):
+            self.version += 1
+            self.events.publish(ChangeEvent.ENTITY_UPDATED, 'departments', department_id,
+                                changes={'courses_offered': list(department.courses_offered)})
+            return True
+        
+        return False
+    
+    @_mutation
     def assign_grade(self, student_id: str, course_id: str, grade: float) -> bool:
         """
         Assign a grade to a student for a course.
@@ -291,60 +674,70 @@ class University:
         if not student:
             return False
         
-        return student.assign_grade(course_id, grade)
+        if student.assign_grade(course_id, grade):
+            self.version += 1
+            self.events.publish(ChangeEvent.GRADE_ASSIGNED, 'students', student_id,
+                                course_id=course_id, grade=grade)
+            return True
+        return False
+    
+    @property
+    def views(self) -> ReportViews:
+        """Materialized report views, created on first use."""
+        if self._views is None:
+            self._views = ReportViews(self)
+        return self._views
     
     def get_university_stats(self) -> Dict:
-        """Get university statistics."""
-        return {
-            'name': self.name,
-            'address': self.address,
-            'total_students': len(self.students),
-            'total_faculty': len(self.faculty),
-            'total_courses': len(self.courses),
-            'total_departments': len(self.departments),
-            'average_gpa': self.get_average_gpa()
-        }
+        """Get university statistics (cached until students or grades change)."""
+        return self.views.university_stats()
     
     def get_average_gpa(self) -> float:
         """Calculate average GPA of all students."""
-        if not self.students:
-            return 0.0
-        
-        total_gpa = sum(student.gpa for student in self.students)
-        return total_gpa / len(self.students)
+        return self.views.average_gpa()
     
     def sort_students_by_gpa(self, descending: bool = True) -> List[Student]:
-        """Sort students by GPA."""
-        return sorted(self.students, 
-                     key=lambda s: s.gpa, 
-                     reverse=descending)
+        """Sort students by GPA (cached until students or grades change)."""
+        return self.views.gpa_ranking(descending)
+    
+    def snapshot(self, store: bool = True) -> UniversitySnapshot:
+        """
+        Take an immutable point-in-time view of the university.
+        
+        Unchanged entities contribute the same cached frozen record to
+        every snapshot, so taking a snapshot costs one pointer per entity
+        plus a copy of only the entities changed since they were last
+        snapshotted. It is taken under the mutation lock; writers can
+        continue while the snapshot is read.
+        
+        Args:
+            store: Cache the records built for changed entities. A thread
+                   other than the one changing the university must pass
+                   False: a record it builds while an entity is being
+                   changed may be stale, and must not stay cached.
+                   
+        Returns:
+            UniversitySnapshot tagged with the current version
+        """
+        with self.lock:
+            return UniversitySnapshot(
+                self.version,
+                self.name,
+                self.address,
+                tuple(dept.snapshot_record(store) for dept in self.departments),
+                tuple(student.snapshot_record(store) for student in self.students),
+                tuple(faculty.snapshot_record(store) for faculty in self.faculty),
+                tuple(course.snapshot_record(store) for course in self.courses)
+            )
     
     def display_university_info(self) -> None:
         """Display university information and statistics."""
-        print("\n" + "="*60)
-        print(f"UNIVERSITY: {self.name}")
-        print("="*60)
-        print(f"Address: {self.address}")
-        print(f"Departments: {len(self.departments)}")
-        print(f"Faculty Members: {len(self.faculty)}")
-        print(f"Students: {len(self.students)}")
-        print(f"Courses Offered: {len(self.courses)}")
-        print(f"Average GPA: {self.get_average_gpa():.2f}")
-        print("="*60)
+        print_university_info(self.get_university_stats())
     
     def display_detailed_stats(self) -> None:
-        """Display detailed university statistics."""
+        """Display detailed university statistics from the materialized views."""
         self.display_university_info()
-        
-        print("\nDEPARTMENT WISE STATISTICS:")
-        print("-"*60)
-        print(f"{'Department':<20} {'Students':<10} {'Faculty':<10} {'Courses':<10}")
-        print("-"*60)
-        
-        for department in self.departments:
-            dept_students = len([s for s in self.students if s.department == department.department_id])
-            dept_faculty = len([f for f in self.faculty if f.department == department.department_id])
-            print(f"{department.name:<20} {dept_students:<10} {dept_faculty:<10} {len(department.courses_offered):<10}")
+        print_department_stats(self.views.department_rows())
     
     def get_all_data(self) -> Dict:
         """Get all university data as dictionary for serialization."""
@@ -357,16 +750,14 @@ class University:
             'courses': [course.to_dict() for course in self.courses]
         }
     
+    @_mutation
     def load_all_data(self, data: Dict) -> None:
         """Load all university data from dictionary."""
         self.name = data.get('name', self.name)
         self.address = data.get('address', self.address)
         
         # Clear existing data
-        self.departments.clear()
-        self.students.clear()
-        self.faculty.clear()
-        self.courses.clear()
+        self.clear()
         
         # Load departments
         for dept_data in data.get('departments', []):
@@ -382,4 +773,6 @@ class University:
         
         # Load courses
         for course_data in data.get('courses', []):
-            self.courses.append(Course.from_dict(course_data))
\ No newline at end of file
+            self.courses.append(Course.from_dict(course_data))
+        
+        self.events.publish(ChangeEvent.RELOADED)
\ No newline at end of file
@@ -2,9 +2,11 @@
 Utility functions for University Management System
 """
 
+import io
 import os
 import sys
-from typing import Any, List
+from itertools import chain, islice
+from typing import Any, Iterable, List, Optional, Sequence, TextIO
 
 def clear_screen() -> None:
     """Clear the console screen."""
@@ -41,31 +43,81 @@ def get_valid_input(prompt: str, validation_func, error_msg: str = "Invalid inpu
         except Exception as e:
             print(f"⚠ Error: {e}")
 
-def format_table(headers: List[str], data: List[List[str]], 
-                 col_widths: List[int] = None) -> str:
+def write_table(headers: List[str], rows: Iterable[Sequence[Any]], out: Optional[TextIO] = None,
+                col_widths: List[Optional[int]] = None, separator: str = "  ",
+                sample_size: int = 100, max_width: int = 40, buffer_rows: int = 256) -> int:
     """
-    Format data as a table.
+    Stream data as a table to a writable.
+    
+    Rows are consumed lazily and written in buffered chunks, so rendering is
+    linear in the output and memory stays bounded however many rows there are.
+    Columns without a fixed width are sized from the headers and the first
+    sample_size rows; cells wider than their column are truncated.
     
     Args:
         headers: List of header strings
-        data: List of rows (each row is a list of strings)
-        col_widths: List of column widths (optional)
+        rows: Iterable of rows (each row is a sequence of values)
+        out: Writable text stream (defaults to sys.stdout)
+        col_widths: Column widths; None (or a None entry) auto-sizes a column
+        separator: Text written between columns
+        sample_size: Number of leading rows used to auto-size columns
+        max_width: Upper bound for auto-sized columns
+        buffer_rows: Number of rows collected before each write
         
     Returns:
-        Formatted table as string
+        Number of rows written
     """
-    if col_widths is None:
-        col_widths = [len(h) + 2 for h in headers]
+    out = out if out is not None else sys.stdout
+    rows = iter(rows)
+    widths = list(col_widths) if col_widths is not None else [None] * len(headers)
+    
+    sample = []
+    if None in widths:
+        sample = [[str(cell) for cell in row] for row in islice(rows, sample_size)]
+        for i, width in enumerate(widths):
+            if width is None:
+                widest = max((len(row[i]) for row in sample if i < len(row)), default=0)
+                widths[i] = min(max(len(headers[i]), widest), max_width)
     
-    # Build header
-    table = "  ".join(f"{h:<{w}}" for h, w in zip(headers, col_widths)) + "\n"
-    table += "-" * (sum(col_widths) + (len(headers) - 1) * 2) + "\n"
+    line_format = separator.join(f"{{:<{width}}}" for width in widths) + "\n"
     
-    # Build rows
-    for row in data:
-        table += "  ".join(f"{cell:<{w}}" for cell, w in zip(row, col_widths)) + "\n"
+    def render(row: Sequence[Any]) -> str:
+        # Short rows are padded and long ones cut to the headers, as zip() did
+        cells = [str(cell) for cell in row][:len(widths)]
+        cells += [""] * (len(widths) - len(cells))
+        for i, (cell, width) in enumerate(zip(cells, widths)):
+            if len(cell) > width:
+                cells[i] = cell[:width - 1] + "…" if width > 1 else cell[:width]
+        return line_format.format(*cells)
+    
+    buffer = [render(headers), "-" * (sum(widths) + (len(widths) - 1) * len(separator)) + "\n"]
+    count = 0
+    for row in chain(sample, rows):
+        buffer.append(render(row))
+        count += 1
+        if len(buffer) >= buffer_rows:
+            out.write("".join(buffer))
+            buffer.clear()
+    out.write("".join(buffer))
+    out.flush()
+    return count
+
+def format_table(headers: List[str], data: Iterable[Sequence[Any]], 
+                 col_widths: List[Optional[int]] = None) -> str:
+    """
+    Format data as a table.
     
-    return table
+    Args:
+        headers: List of header strings
+        data: Rows (each row is a sequence of values)
+        col_widths: List of column widths (optional, auto-sized if omitted)
+        
+    Returns:
+        Formatted table as string
+    """
+    buffer = io.StringIO()
+    write_table(headers, data, buffer, col_widths)
+    return buffer.getvalue()
 
 def confirm_action(prompt: str) -> bool:
     """
@@ -0,0 +1,167 @@
+"""
+Views module for University Management System
+
+Materialized report views of a University. Each cached report remembers
+the generation (event sequence number) it was computed at and the topics
+of data it depends on; a change event only invalidates the reports whose
+topics it touches, so e.g. assigning a grade leaves department counts
+cached. The number of students and faculty per department is kept up to
+date incrementally instead of being recounted.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from events import ChangeEvent
+
+# Topics of report data; events are mapped onto these
+TOPICS = ('students', 'faculty', 'courses', 'departments', 'grades')
+GRADE_KINDS = (ChangeEvent.GRADE_ASSIGNED, ChangeEvent.ENROLLED, ChangeEvent.DROPPED)
+ENTITY_KINDS = (ChangeEvent.ENTITY_ADDED, ChangeEvent.ENTITY_REMOVED, ChangeEvent.ENTITY_UPDATED)
+
+def event_topics(event: ChangeEvent) -> Tuple[str, ...]:
+    """Topics of report data a change event may have changed."""
+    if event.kind == ChangeEvent.RELOADED:
+        return TOPICS
+    if event.kind in GRADE_KINDS:
+        return ('grades',)
+    if event.kind == ChangeEvent.ENTITY_REMOVED and event.collection in ('students', 'courses'):
+        return (event.collection, 'grades')  # Their grades are removed too
+    if event.kind in (ChangeEvent.ENTITY_ADDED, ChangeEvent.ENTITY_REMOVED):
+        return (event.collection,)
+    # Updates only change fields (names, departments, ...) that no cached
+    # report depends on; department moves update the people counts
+    return ()
+
+class ReportViews:
+    """Cached reports of one University, kept current by its change events."""
+    
+    def __init__(self, university):
+        """
+        Initialize the views and subscribe to the university's changes.
+        
+        Args:
+            university: University object the reports are computed from
+        """
+        self.university = university
+        self._lock = threading.RLock()
+        self._changed: Dict[str, int] = {topic: 0 for topic in TOPICS}  # topic -> generation
+        self._cache: Dict[Tuple, Tuple[int, object]] = {}  # view key -> (generation, value)
+        # Incremental people-per-department counts; None until first used
+        self._headcounts: Optional[Dict[str, List[int]]] = None
+        self._member_departments: Dict[Tuple[str, str], str] = {}  # (collection, ID) -> department
+        self.computed = 0  # Reports computed from scratch
+        self.reused = 0    # Reports served from the cache
+        university.events.subscribe(self._on_change)
+    
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Event subscriber: mark the changed topics and update head counts."""
+        topics = event_topics(event)
+        if not topics and event.kind != ChangeEvent.ENTITY_UPDATED:
+            return
+        with self._lock:
+            for topic in topics:
+                self._changed[topic] = event.sequence
+            if self._headcounts is not None:
+                if event.kind == ChangeEvent.RELOADED:
+                    self._headcounts = None
+                elif event.collection in ('students', 'faculty') and event.kind in ENTITY_KINDS:
+                    self._update_headcount(event)
+    
+    def _view(self, key: Tuple, topics: Tuple[str, ...], compute: Callable[[], object]):
+        """Get a cached report, recomputing it if one of its topics changed."""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and all(self._changed[t] <= cached[0] for t in topics):
+                self.reused += 1
+                return cached[1]
+            # Read before computing: an event published meanwhile is newer
+            generation = self.university.events.sequence
+            value = compute()
+            self._cache[key] = (generation, value)
+            self.computed += 1
+            return value
+    
+    def clear(self) -> None:
+        """Drop every cached report; each is recomputed when next used."""
+        with self._lock:
+            self._cache.clear()
+            self._headcounts = None
+    
+    def average_gpa(self) -> float:
+        """Average GPA of all students."""
+        def compute():
+            students = self.university.students
+            return sum(student.gpa for student in students) / len(students) if students else 0.0
+        return self._view(('average_gpa',), ('students', 'grades'), compute)
+    
+    def university_stats(self) -> Dict:
+        """University statistics (see University.get_university_stats)."""
+        university = self.university
+        return {
+            'name': university.name,
+            'address': university.address,
+            'total_students': len(university.students),
+            'total_faculty': len(university.faculty),
+            'total_courses': len(university.courses),
+            'total_departments': len(university.departments),
+            'average_gpa': self.average_gpa()
+        }
+    
+    def gpa_ranking(self, descending: bool = True) -> List:
+        """
+        Students sorted by GPA.
+        
+        Returns:
+            New list of Student objects; ties keep the order of the students
+        """
+        ranking = self._view(('gpa_ranking', descending), ('students', 'grades'),
+                             lambda: sorted(self.university.students, key=lambda s: s.gpa,
+                                            reverse=descending))
+        return list(ranking)
+    
+    def department_rows(self) -> List[Tuple[str, int, int, int]]:
+        """
+        Department statistics rows.
+        
+        Returns:
+            (name, students, faculty, courses offered) per department
+        """
+        with self._lock:
+            if self._headcounts is None:
+                self._rebuild_headcounts()
+                self.computed += 1
+            else:
+                self.reused += 1
+            counts = self._headcounts
+            # Names and course lists are read directly; both are cheap
+            return [(dept.name, *counts.get(dept.department_id, (0, 0)), len(dept.courses_offered))
+                    for dept in self.university.departments]
+    
+    def _rebuild_headcounts(self) -> None:
+        self._headcounts = {}
+        self._member_departments = {}
+        for collection, key in (('students', 'student_id'), ('faculty', 'faculty_id')):
+            for member in getattr(self.university, collection):
+                self._count(collection, getattr(member, key), member.department)
+    
+    def _count(self, collection: str, member_id: str, department: Optional[str]) -> None:
+        """Move a student or faculty member to a department (None removes them)."""
+        column = 0 if collection == 'students' else 1
+        previous = self._member_departments.pop((collection, member_id), None)
+        if previous is not None:
+            self._headcounts[previous][column] -= 1
+        if department is not None:
+            self._member_departments[(collection, member_id)] = department
+            self._headcounts.setdefault(department, [0, 0])[column] += 1
+    
+    def _update_headcount(self, event: ChangeEvent) -> None:
+        if event.kind == ChangeEvent.ENTITY_REMOVED:
+            self._count(event.collection, event.entity_id, None)
+            return
+        if event.kind == ChangeEvent.ENTITY_UPDATED and 'department' not in event.data.get('changes', {}):
+            return
+        find = (self.university.find_student if event.collection == 'students'
+                else self.university.find_faculty)
+        member = find(event.entity_id)
+        if member is not None:
+            self._count(event.collection, event.entity_id, member.department)
\ No newline at end of file
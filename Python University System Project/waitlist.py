@@ -0,0 +1,138 @@
+"""
+Waitlist module for University Management System
+"""
+
+import heapq
+import itertools
+from typing import Dict, List, Optional
+
+class Waitlist:
+    """Priority queue of students waiting for a seat in a course."""
+    
+    POLICIES = ('registration', 'seniority', 'gpa')
+    
+    def __init__(self, policy: str = 'registration'):
+        """
+        Initialize an empty waitlist.
+        
+        Args:
+            policy: Ordering policy - 'registration' (first come, first served),
+                    'seniority' (oldest student first) or 'gpa' (highest GPA first)
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Invalid waitlist policy: {policy}")
+        
+        self.policy = policy
+        self._heap: List[list] = []  # [priority, sequence, student_id]
+        self._entries: Dict[str, list] = {}  # student_id -> live heap entry
+        self._counter = itertools.count()
+        self.version = 0  # Incremented on every change
+    
+    def __getstate__(self) -> Dict:
+        # itertools.count is not picklable on every Python version; store the next sequence number
+        state = self.__dict__.copy()
+        state['_counter'] = max((entry[1] for entry in self._heap), default=-1) + 1
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._counter = itertools.count(state['_counter'])
+    
+    def priority_for(self, student) -> float:
+        """Get the priority of a student under this policy (lower is served first)."""
+        if self.policy == 'seniority':
+            return -float(student.age)
+        if self.policy == 'gpa':
+            return -float(student.gpa)
+        return 0.0
+    
+    def add(self, student_id: str, priority: float = 0.0) -> bool:
+        """
+        Add a student to the waitlist in O(log n).
+        
+        Args:
+            student_id: Student identifier
+            priority: Priority value (lower is served first); ties are
+                      broken by registration order
+                      
+        Returns:
+            True if added, False if the student is already waiting
+        """
+        if student_id in self._entries:
+            return False
+        
+        entry = [priority, next(self._counter), student_id]
+        self._entries[student_id] = entry
+        heapq.heappush(self._heap, entry)
+        self.version += 1
+        return True
+    
+    def remove(self, student_id: str) -> bool:
+        """
+        Remove a student from the waitlist in O(1).
+        
+        The heap entry is only marked as removed and discarded lazily by pop().
+        
+        Returns:
+            True if removed, False if the student was not waiting
+        """
+        entry = self._entries.pop(student_id, None)
+        if entry is None:
+            return False
+        
+        entry[2] = None
+        self.version += 1
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._compact()
+        return True
+    
+    def pop(self) -> Optional[str]:
+        """Remove and return the next student in O(log n), or None if empty."""
+        while self._heap:
+            _, _, student_id = heapq.heappop(self._heap)
+            if student_id is not None:
+                del self._entries[student_id]
+                self.version += 1
+                return student_id
+        return None
+    
+    def peek(self) -> Optional[str]:
+        """Return the next student without removing them, or None if empty."""
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+    
+    def _compact(self) -> None:
+        """Drop removed entries so the heap stays proportional to live entries."""
+        self._heap = [entry for entry in self._heap if entry[2] is not None]
+        heapq.heapify(self._heap)
+    
+    def get_ordered(self) -> List[str]:
+        """Get waiting student IDs in the order they would be promoted."""
+        return [entry[2] for entry in sorted(self._entries.values())]
+    
+    def position(self, student_id: str) -> Optional[int]:
+        """Get a student's 1-based position on the waitlist, or None."""
+        entry = self._entries.get(student_id)
+        if entry is None:
+            return None
+        return 1 + sum(1 for other in self._entries.values() if other < entry)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, student_id: str) -> bool:
+        return student_id in self._entries
+    
+    def to_list(self) -> List[Dict]:
+        """Convert waitlist to a list of entries for serialization."""
+        return [{'student_id': entry[2], 'priority': entry[0]}
+                for entry in sorted(self._entries.values())]
+    
+    @classmethod
+    def from_list(cls, entries: List[Dict], policy: str = 'registration') -> 'Waitlist':
+        """Create Waitlist from serialized entries, keeping their order."""
+        waitlist = cls(policy)
+        for entry in entries:
+            waitlist.add(entry['student_id'], entry.get('priority', 0.0))
+        return waitlist
\ No newline at end of file